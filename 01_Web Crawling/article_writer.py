@@ -0,0 +1,190 @@
+"""
+기사 저장 전용 writer 스레드
+---------------------------
+● 기존 save_article_to_jsonl 은 기사 한 건마다 FILE_LOCK → open(append) → write → close
+  → 워커 100개가 락 하나를 두고 줄을 서고, 기사마다 open/close 시스템 콜 발생
+● 워커는 bounded queue 에 레코드를 넣기만 하고, writer 스레드 하나가
+    1) 레코드를 모아서(batch) 한 번에 기록
+    2) FSYNC_INTERVAL 초마다 fsync
+    3) 사이트맵 날짜별 샤드 파일로 나눠 저장  예) OUTPUT_DIR/2017/2017-03-01.jsonl.gz
+● 압축: "gzip"(기본, crawl_data_count.ipynb 에서 바로 집계 가능) / "zstd"(zstandard 설치 시) / None
+● 큐가 가득 차면 put 이 대기하므로 디스크가 느려도 메모리가 무한히 늘지 않음
+"""
+
+import gzip, json, os, queue, re, threading, time
+from collections import OrderedDict
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축을 쓰지 않으면 필요 없음
+    zstandard = None
+
+_STOP = object()
+_ARTICLE_DATE = re.compile(r"[A-Z]{3}(\d{4})(\d{2})(\d{2})")
+_SITEMAP_DATE = re.compile(r"/sitemap/articles/(\d{4})/(\d{2})/(\d{2})-\d+\.htm")
+
+SHARD_EXTENSIONS = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst", None: ".jsonl"}
+
+
+def shard_key_from_sitemap_url(url: str):
+    """.../sitemap/articles/2017/03/01-1.htm → '2017-03-01'"""
+    m = _SITEMAP_DATE.search(url)
+    return f"{m.group(1)}-{m.group(2)}-{m.group(3)}" if m else None
+
+
+def shard_key_from_article_id(article_id: str) -> str:
+    """AKR20170301000100001 → '2017-03-01' (날짜를 알 수 없으면 'unknown')"""
+    m = _ARTICLE_DATE.match(article_id or "")
+    return f"{m.group(1)}-{m.group(2)}-{m.group(3)}" if m else "unknown"
+
+
+class _Shard:
+    """샤드 파일 하나 (압축 스트림 + 원본 파일 핸들)"""
+
+    def __init__(self, path: str, compression):
+        self.raw = open(path, "ab")
+        if compression == "gzip":
+            # append 모드로 열 때마다 gzip member 가 하나씩 추가됨 (gzip.open 으로 이어서 읽힘)
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode="ab")
+        elif compression == "zstd":
+            self.stream = zstandard.ZstdCompressor().stream_writer(self.raw, closefd=False)
+        else:
+            self.stream = self.raw
+        self.compression = compression
+
+    def write(self, data: bytes):
+        self.stream.write(data)
+
+    def flush(self):
+        if self.compression == "zstd":
+            self.stream.flush(zstandard.FLUSH_BLOCK)
+        else:
+            self.stream.flush()
+        self.raw.flush()
+
+    def fsync(self):
+        self.flush()
+        os.fsync(self.raw.fileno())
+
+    def close(self):
+        if self.stream is not self.raw:
+            self.stream.close()
+        self.raw.close()
+
+
+class ArticleWriter(threading.Thread):
+    """큐로 받은 기사 레코드를 날짜별 샤드 파일에 모아서 기록하는 스레드"""
+
+    def __init__(self, output_dir: str, compression="gzip", queue_size: int = 2000,
+                 batch_size: int = 200, flush_interval: float = 1.0,
+                 fsync_interval: float = 10.0, max_open_shards: int = 4, on_written=None):
+        super().__init__(name="article-writer", daemon=True)
+        if compression not in SHARD_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+
+        self.output_dir      = output_dir
+        self.compression     = compression
+        self.batch_size      = batch_size
+        self.flush_interval  = flush_interval
+        self.fsync_interval  = fsync_interval
+        self.max_open_shards = max_open_shards
+        self.on_written      = on_written   # 기록(flush) 완료된 레코드 목록을 받는 콜백
+
+        self.queue   = queue.Queue(maxsize=queue_size)
+        self.written = 0
+        self._shards = OrderedDict()   # shard_key → _Shard (최근 사용 순)
+        self._closed = False
+        self.start()
+
+    # ───────────── 워커 쪽 API ─────────────
+    def put(self, record: dict, shard_key: str = None):
+        if shard_key is None:
+            shard_key = shard_key_from_article_id(record.get("id"))
+        self.queue.put((shard_key, record))
+
+    def close(self):
+        """남은 레코드를 모두 기록하고 파일을 닫음 (여러 번 호출해도 안전)"""
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put(_STOP)
+        self.join()
+
+    # ───────────── writer 스레드 ─────────────
+    def shard_path(self, shard_key: str) -> str:
+        year = shard_key[:4] if shard_key[:4].isdigit() else shard_key
+        return os.path.join(self.output_dir, year, shard_key + SHARD_EXTENSIONS[self.compression])
+
+    def _get_shard(self, shard_key: str) -> _Shard:
+        shard = self._shards.get(shard_key)
+        if shard is not None:
+            self._shards.move_to_end(shard_key)
+            return shard
+
+        # 사이트맵을 날짜 순으로 돌기 때문에 오래된 샤드는 다시 쓰일 일이 거의 없음
+        while len(self._shards) >= self.max_open_shards:
+            _, old = self._shards.popitem(last=False)
+            old.close()
+
+        path = self.shard_path(shard_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shard = self._shards[shard_key] = _Shard(path, self.compression)
+        return shard
+
+    def _write_batch(self, batch: list):
+        by_shard = OrderedDict()
+        for shard_key, record in batch:
+            by_shard.setdefault(shard_key, []).append(record)
+
+        for shard_key, records in by_shard.items():
+            lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+            shard = self._get_shard(shard_key)
+            shard.write(lines.encode("utf-8"))
+            shard.flush()
+
+        self.written += len(batch)
+        if self.on_written:
+            self.on_written([record for _, record in batch])
+
+    def _fsync_all(self):
+        for shard in self._shards.values():
+            shard.fsync()
+
+    def run(self):
+        batch = []
+        last_flush = last_fsync = time.monotonic()
+        stopping = False
+
+        while not stopping:
+            timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+            try:
+                item = self.queue.get(timeout=timeout)
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            if batch and (stopping or len(batch) >= self.batch_size
+                          or now - last_flush >= self.flush_interval):
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    print(f"[writer 오류] {len(batch)}건 기록 실패 → {e}")
+                batch = []
+                last_flush = now
+            elif not batch:
+                last_flush = now
+
+            if now - last_fsync >= self.fsync_interval:
+                self._fsync_all()
+                last_fsync = now
+
+        self._fsync_all()
+        for shard in self._shards.values():
+            shard.close()
+        self._shards.clear()
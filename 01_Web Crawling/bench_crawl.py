@@ -0,0 +1,168 @@
+"""
+크롤러 처리량 벤치마크
+---------------------
+● replay_server.py 를 띄우고 crawl_4.py(스레드) 또는 crawl_async.py(asyncio) 크롤러를
+  그대로 돌려서 처리량을 측정 (실제 yna.co.kr 에는 요청하지 않음)
+● 리포트: 사이트맵 pages/s, articles/s, 요청 지연 p50/p99, 재시도·실패 수, 최대 RSS
+● 크롤러 모듈은 import 시점에 설정을 읽으므로 환경변수(YNA_BASE_URL 등)를 먼저 설정하고 import,
+  설정을 덮어쓴 뒤 crawl_4.init() 으로 원장·writer·응답 캐시를 준비
+● --work-dir 로 같은 폴더를 다시 쓰면 원장·응답 캐시가 남아 있어 재실행(보충 수집) 비용을 측정 가능
+● 사용법
+    python bench_crawl.py --engine thread --days 3 --article-workers 50
+    python bench_crawl.py --engine async --days 3 --rps 200 --error-rate 0.02 --json result.json
+"""
+
+import argparse, asyncio, contextlib, json, os, shutil, sys, tempfile, time
+from datetime import date, timedelta
+
+from replay_server import ReplayServer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB). 측정할 수 없으면 None"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024   # macOS 는 바이트, 리눅스는 KB
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except (ImportError, AttributeError):
+        return None
+
+
+def percentile(values, q: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def bench_days(start: date, days: int):
+    return [((start + timedelta(n)).year, (start + timedelta(n)).month, (start + timedelta(n)).day)
+            for n in range(days)]
+
+
+def run_benchmark(args) -> dict:
+    # 캐시 키가 URL 이므로 재실행 측정을 하려면 포트가 같아야 함
+    server = ReplayServer(args.fixtures, port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                          error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                          articles_per_day=args.articles_per_day)
+    base_url = server.start()
+    keep_output = args.keep_output or args.work_dir is not None
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="yna_bench_")
+    os.makedirs(work_dir, exist_ok=True)
+
+    # crawl_4 가 import 될 때 읽는 설정 (재생 서버, 임시 출력 폴더, 고정 딜레이 --crawl-delay)
+    os.environ["YNA_BASE_URL"]         = base_url
+    os.environ["YNA_OUTPUT_JSON_FILE"] = os.path.join(work_dir, "bench.jsonl")
+    os.environ["YNA_CRAWL_DELAY_MIN"]  = str(args.crawl_delay)
+    os.environ["YNA_CRAWL_DELAY_MAX"]  = str(args.crawl_delay)
+
+    quiet = open(os.devnull, "w", encoding="utf-8") if not args.verbose else None
+    try:
+        with contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext():
+            import crawl_4
+            crawl_4.PARSER_BACKEND        = args.parser
+            crawl_4.ARTICLE_WORKERS       = args.article_workers
+            crawl_4.MAX_INFLIGHT_ARTICLES = args.article_workers * 2
+            crawl_4.PAGE_WORKERS          = args.page_workers
+            days = bench_days(date.fromisoformat(args.start), args.days)
+            crawl_4.iter_crawl_days = lambda: iter(days)
+            crawl_4.init()   # 원장·writer·응답 캐시·robots.txt (재생 서버에서 가져옴)
+
+            t0 = time.perf_counter()
+            if args.engine == "async":
+                import crawl_async
+                crawl_async.iter_crawl_days     = crawl_4.iter_crawl_days
+                crawl_async.PAGE_WORKERS        = args.page_workers
+                crawl_async.ARTICLE_CONCURRENCY = args.article_workers
+                crawl_async.MAX_CONNECTIONS     = args.max_connections
+                crawl_async.REQUESTS_PER_SECOND = args.rps
+                crawl_async.REQUEST_BURST       = max(1, int(args.rps))
+                asyncio.run(crawl_async.start_archive_crawling_async())
+            else:
+                crawl_4.start_archive_crawling_parallel()
+            crawl_4.WRITER.close()
+            elapsed = time.perf_counter() - t0
+
+            ledger_counts = crawl_4.LEDGER.counts()
+            crawl_4.LEDGER.close()
+            if crawl_4.HTTP_CACHE is not None:
+                crawl_4.HTTP_CACHE.close()
+    finally:
+        if quiet:
+            quiet.close()
+        server.stop()
+        if not keep_output:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    stats = crawl_4.FETCH_STATS
+    with stats.lock:
+        latencies = list(stats.latencies)
+        pages, articles, retries, failures = stats.pages, stats.articles, stats.retries, stats.failures
+        cache_hits, revalidated = stats.cache_hits, stats.revalidated
+
+    p50, p99 = percentile(latencies, 0.50), percentile(latencies, 0.99)
+    rss = peak_rss_mb()
+    return {
+        "engine":          args.engine,
+        "parser":          crawl_4.resolve_backend(args.parser),
+        "days":            args.days,
+        "article_workers": args.article_workers,
+        "elapsed_sec":     round(elapsed, 3),
+        "sitemap_pages":   pages,
+        "articles_saved":  crawl_4.WRITER.written,
+        "pages_per_sec":   round(pages / elapsed, 2),
+        "articles_per_sec":round(crawl_4.WRITER.written / elapsed, 2),
+        "latency_p50_ms":  round(p50 * 1000, 1) if p50 is not None else None,
+        "latency_p99_ms":  round(p99 * 1000, 1) if p99 is not None else None,
+        "retries":         retries,
+        "failures":        failures,
+        "cache_hits":      cache_hits,
+        "revalidated_304": revalidated,
+        "peak_rss_mb":     round(rss, 1) if rss is not None else None,
+        "server_status":   server.stats,
+        "ledger":          ledger_counts,
+        "output_dir":      work_dir if keep_output else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재생 서버를 이용한 크롤러 처리량 벤치마크")
+    parser.add_argument("--engine", choices=["thread", "async"], default="thread")
+    parser.add_argument("--days", type=int, default=2, help="크롤링할 사이트맵 날짜 수")
+    parser.add_argument("--start", default="2017-03-01", help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--port", type=int, default=8765, help="재생 서버 포트 (0 이면 임의 포트)")
+    parser.add_argument("--fixtures", default=None, help="녹화한 페이지 폴더 (없으면 합성 페이지)")
+    parser.add_argument("--articles-per-day", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=30)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--article-workers", type=int, default=100)
+    parser.add_argument("--page-workers", type=int, default=1)
+    parser.add_argument("--max-connections", type=int, default=20, help="async 전용 커넥션 풀 크기")
+    parser.add_argument("--rps", type=float, default=1000.0, help="async 전용 호스트당 초당 요청 수")
+    parser.add_argument("--parser", default="auto", help="auto / selectolax / lxml / bs4")
+    parser.add_argument("--crawl-delay", type=float, default=0.0, help="기사 사이 딜레이·재시도 대기 (초)")
+    parser.add_argument("--json", default=None, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--work-dir", default=None, help="출력·원장·캐시 폴더 (지정하면 지우지 않고 재사용)")
+    parser.add_argument("--keep-output", action="store_true", help="크롤링 결과 임시 폴더를 지우지 않음")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그를 그대로 출력")
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+    for key, value in result.items():
+        print(f"{key:>17}: {value}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import re
 import os
 from concurrent.futures import ThreadPoolExecutor
 
+from url_policy import UrlPolicy
+
 # --- 설정 ---
 BASE_ARCHIVE_INDEX_URL = "https://www.yna.co.kr/sitemap/index"
 YONHAP_BASE_URL = "https://www.yna.co.kr"
@@ -24,23 +26,14 @@ START_MONTH = 1
 END_YEAR = 2019
 END_MONTH = 1
 
-DISALLOWED_PATTERNS = [
-    r'\/\*?\*cp=',
-    r'\/view\/AEN.*', r'\/view\/ACK.*', r'\/view\/AJP.*', r'\/view\/AAR.*',
-    r'\/view\/ASP.*', r'\/view\/AFR.*',
-    r'\/hc\.html',
-    r'\/search\/', r'\/search\/\*?\*query=',
-    r'\/did\/', r'\/program\/', r'\/web\/', r'\/irclub\/', r'\/changwon\/',
-    r'\/gangwon-do\/', r'\/coronavirus\/',
-    r'\/view\/AKR20221115124100505'
-]
+# robots.txt Disallow 규칙: 로컬 파일 → 사이트 robots.txt → url_policy 기본 규칙 순으로 로드
+ROBOTS_TXT_FILE = None   # 예: "yna_robots.txt" (None 이면 ROBOTS_TXT_URL 에서 가져옴)
+ROBOTS_TXT_URL  = f"{YONHAP_BASE_URL}/robots.txt"
+URL_POLICY = UrlPolicy.load(ROBOTS_TXT_FILE, ROBOTS_TXT_URL, USER_AGENT)
+print(f"robots.txt 규칙 로드: {URL_POLICY}")
 
 def is_allowed_url(url):
-    path = url.replace(YONHAP_BASE_URL, "")
-    for pattern in DISALLOWED_PATTERNS:
-        if re.search(pattern, path):
-            return False
-    return True
+    return URL_POLICY.is_allowed(url)
 
 def save_article_to_jsonl(article_data):
     with open(OUTPUT_JSON_FILE, 'a', encoding='utf-8') as f:
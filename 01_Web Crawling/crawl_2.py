@@ -15,6 +15,8 @@ from urllib.parse import urljoin
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from url_policy import UrlPolicy
+
 # ────────────────────────────── 설정값 ──────────────────────────────
 BASE_ARCHIVE_INDEX_URL = "https://www.yna.co.kr/sitemap/index"
 YONHAP_BASE_URL        = "https://www.yna.co.kr"
@@ -30,16 +32,11 @@ END_YEAR,   END_MONTH   = 2018, 12  # inclusive
 PAGE_WORKERS    = 8    # sitemap 페이지 병렬 수
 ARTICLE_WORKERS = 20   # 기사 병렬 수 (네트워크 상황에 맞게 조절)
 
-DISALLOWED_PATTERNS = [
-    r'/\*?\*cp=',
-    r'/view/AEN.*', r'/view/ACK.*', r'/view/AJP.*', r'/view/AAR.*',
-    r'/view/ASP.*', r'/view/AFR.*',
-    r'/hc\.html',
-    r'/search/', r'/search/\*?\*query=',
-    r'/did/', r'/program/', r'/web/', r'/irclub/', r'/changwon/',
-    r'/gangwon-do/', r'/coronavirus/',
-    r'/view/AKR20221115124100505'
-]
+# robots.txt Disallow 규칙: 로컬 파일 → 사이트 robots.txt → url_policy 기본 규칙 순으로 로드
+ROBOTS_TXT_FILE = None   # 예: "yna_robots.txt" (None 이면 ROBOTS_TXT_URL 에서 가져옴)
+ROBOTS_TXT_URL  = f"{YONHAP_BASE_URL}/robots.txt"
+URL_POLICY = UrlPolicy.load(ROBOTS_TXT_FILE, ROBOTS_TXT_URL, USER_AGENT)
+print(f"robots.txt 규칙 로드: {URL_POLICY}")
 
 # ────────────────────── 내부 공용 도구 (thread‑safe) ──────────────────────
 FILE_LOCK = threading.Lock()
@@ -54,8 +51,7 @@ def get_session():
     return _thread_local.sess
 
 def is_allowed_url(url: str) -> bool:
-    path = url.replace(YONHAP_BASE_URL, "")
-    return not any(re.search(pat, path) for pat in DISALLOWED_PATTERNS)
+    return URL_POLICY.is_allowed(url)
 
 def get_html_soup(url: str, max_retries: int = 3):
     sess = get_session()
@@ -15,6 +15,8 @@ from urllib.parse import urljoin
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from url_policy import UrlPolicy
+
 # ────────────────────────────── 설정값 ──────────────────────────────
 BASE_ARCHIVE_INDEX_URL = "https://www.yna.co.kr/sitemap/index"
 YONHAP_BASE_URL        = "https://www.yna.co.kr"
@@ -30,37 +32,11 @@ END_YEAR,   END_MONTH   = 2019, 2  # inclusive
 PAGE_WORKERS    = 1    # sitemap 페이지 병렬 수
 ARTICLE_WORKERS = 70   # 기사 병렬 수 (네트워크 상황에 맞게 조절)
 
-DISALLOWED_PATTERNS = [
-    r'\/\*?\*cp=',
-    r'\/view\/AEN.*', r'\/view\/ACK.*', r'\/view\/AJP.*', r'\/view\/AAR.*',
-    r'\/view\/ASP.*', r'\/view\/AFR.*',
-    r'\/hc\.html',
-    r'\/search\/', # 이 부분이 중요! 검색 페이지 불허
-    r'\/search\/\*?\*query=',
-    r'\/did\/', r'\/program\/', r'\/web\/', r'\/irclub\/', r'\/changwon\/',
-    r'\/gangwon-do\/', r'\/coronavirus\/',
-    # --- 중요: robots.txt에서 가져온 모든 개별 기사 ID Disallow를 여기에 추가하세요 ---
-    # 예시:
-    r'\/view\/AKR20150422172700003', r'\/view\/AKR20140829043800065',
-    r'\/view\/AKR20140829043851065', r'\/view\/AKR20170628100600004',
-    r'\/view\/AKR20180312046500004', r'\/view\/AKR20001016000500007',
-    r'\/view\/AKR20120627179800004', r'\/view\/AKR20120627179851004',
-    r'\/view\/AKR20090217198200051', r'\/view\/AKR20200612149500005',
-    r'\/view\/AKR20121210065200061', r'\/view\/AKR20121210099600061',
-    r'\/view\/AKR20180323024000033', r'\/view\/AKR20121018033100014',
-    r'\/view\/AKR20210225119251001', r'\/view\/AKR20210225119200001',
-    r'\/view\/AKR20210225155200005', r'\/view\/AKR20111228151200061',
-    r'\/view\/AKR20210528145800065', r'\/view\/AKR20210420149500051',
-    r'\/view\/AKR20210420149551051', r'\/view\/AKR20071018085900004',
-    r'\/view\/AKR20070709049600004', r'\/view\/AKR20080124092800004',
-    r'\/view\/AKR20150728117000060', r'\/view\/AKR20100414090000017',
-    r'\/view\/AKR20200428055400004', r'\/view\/MYH20140829007500038',
-    r'\/view\/MYH20161104017200038', r'\/view\/MYH20121211002300038',
-    r'\/view\/MYH20180323010400038', r'\/view\/PYH20191203158600013',
-    r'\/view\/PYH20190918134800013', r'\/view\/PYH20190918134900013',
-    r'\/view\/PYH20210225267400013', r'\/view\/IIS20110401000200365',
-    r'\/view\/AKR20221115124100505'
-]
+# robots.txt Disallow 규칙: 로컬 파일 → 사이트 robots.txt → url_policy 기본 규칙 순으로 로드
+ROBOTS_TXT_FILE = None   # 예: "yna_robots.txt" (None 이면 ROBOTS_TXT_URL 에서 가져옴)
+ROBOTS_TXT_URL  = f"{YONHAP_BASE_URL}/robots.txt"
+URL_POLICY = UrlPolicy.load(ROBOTS_TXT_FILE, ROBOTS_TXT_URL, USER_AGENT)
+print(f"robots.txt 규칙 로드: {URL_POLICY}")
 
 # ────────────────────── 내부 공용 도구 (thread‑safe) ──────────────────────
 FILE_LOCK = threading.Lock()
@@ -86,8 +62,7 @@ def get_session():
     return _thread_local.sess
 
 def is_allowed_url(url: str) -> bool:
-    path = url.replace(YONHAP_BASE_URL, "")
-    return not any(re.search(pat, path) for pat in DISALLOWED_PATTERNS)
+    return URL_POLICY.is_allowed(url)
 
 def get_html_soup(url: str, max_retries: int = 3):
     sess = get_session()
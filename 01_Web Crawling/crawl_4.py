@@ -6,53 +6,141 @@ Yonhap News 아카이브 크롤러 – 병렬 버전
     1) 사이트맵 페이지를 병렬로 요청
     2) 기사 본문도 전역 ThreadPoolExecutor(워커 20개)로 병렬 요청
     3) requests.Session 을 스레드마다 독립적으로 사용해 race condition 방지
-    4) JSONL 파일 기록 시 Lock 으로 동기화
+    4) 기사 기록은 writer 스레드 하나가 날짜별 .jsonl.gz 샤드로 모아서 저장
+    5) 응답은 http_cache 에 저장 → 다시 돌릴 때 기사는 캐시에서, 사이트맵은 조건부 GET 으로
 """
 
-import requests, threading, time, random, json, re, os
+import requests, threading, time, random, os, atexit
+from collections import deque
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+
+from url_policy import UrlPolicy
+from html_extract import extract_article_fields, extract_sitemap_links, parse_article_soup, resolve_backend
+from article_writer import ArticleWriter, shard_key_from_sitemap_url
+from http_cache import ResponseCache, is_immutable_url
+from crawl_ledger import (
+    CrawlLedger, article_id_from_url,
+    STATUS_FETCHED, STATUS_FAILED, STATUS_DISALLOWED, STATUS_EMPTY,
+)
 
 # ────────────────────────────── 설정값 ──────────────────────────────
+# YNA_BASE_URL / YNA_OUTPUT_JSON_FILE / YNA_CRAWL_DELAY_MIN / YNA_CRAWL_DELAY_MAX 환경변수로 덮어쓸 수 있음
+# (bench_crawl.py 가 replay_server.py 로 크롤러를 돌릴 때 사용)
 BASE_ARCHIVE_INDEX_URL = "https://www.yna.co.kr/sitemap/index"
-YONHAP_BASE_URL        = "https://www.yna.co.kr"
-OUTPUT_JSON_FILE       = r"C:\\Users\\이름\\Desktop\\DS4\\AIFFELthon\\데이터\\yonhap_news_raw_data_archive_2017_3.jsonl"
+YONHAP_BASE_URL        = os.environ.get("YNA_BASE_URL", "https://www.yna.co.kr")
+OUTPUT_JSON_FILE       = os.environ.get("YNA_OUTPUT_JSON_FILE", r"C:\\Users\\이름\\Desktop\\DS4\\AIFFELthon\\데이터\\yonhap_news_raw_data_archive_2017_3.jsonl")
+CRAWL_LEDGER_FILE      = os.path.splitext(OUTPUT_JSON_FILE)[0] + ".ledger.sqlite"  # 기사별 수집 상태 원장
+OUTPUT_SHARD_DIR       = os.path.splitext(OUTPUT_JSON_FILE)[0]  # 날짜별 샤드 저장 폴더 (OUTPUT_SHARD_DIR/YYYY/YYYY-MM-DD.jsonl.gz)
+OUTPUT_COMPRESSION     = "gzip"   # "gzip" / "zstd" / None
+WRITER_QUEUE_SIZE      = 2000     # writer 큐 최대 길이 (가득 차면 워커가 대기)
+WRITER_BATCH_SIZE      = 200      # 한 번에 기록할 기사 수
+WRITER_FSYNC_INTERVAL  = 10.0     # fsync 주기 (초)
+HTTP_CACHE_ENABLED     = True     # 응답 캐시 사용 여부 (기사 본문까지 저장하므로 월 수 GB 까지 커질 수 있음)
+HTTP_CACHE_FILE        = os.path.splitext(OUTPUT_JSON_FILE)[0] + ".http_cache.sqlite"
 
 USER_AGENT       = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-CRAWL_DELAY_MIN  = 2
-CRAWL_DELAY_MAX  = 4
+CRAWL_DELAY_MIN  = float(os.environ.get("YNA_CRAWL_DELAY_MIN", 2))
+CRAWL_DELAY_MAX  = float(os.environ.get("YNA_CRAWL_DELAY_MAX", 4))
 
 START_YEAR, START_MONTH = 2017, 3   # inclusive
 END_YEAR,   END_MONTH   = 2017, 3  # inclusive
 
-PAGE_WORKERS    = 1    # sitemap 페이지 병렬 수
+PAGE_WORKERS    = 1    # 동시에 처리하는 사이트맵 날짜 수
 ARTICLE_WORKERS = 100   # 기사 병렬 수 (네트워크 상황에 맞게 조절)
+MAX_INFLIGHT_ARTICLES = ARTICLE_WORKERS * 2  # 제출했지만 끝나지 않은 기사 요청 상한 (메모리 상한)
+
+SITEMAP_PAGE_SIZE = 1000  # 사이트맵 한 페이지의 최대 링크 수 → 이보다 적으면 다음 페이지를 요청하지 않음
+SITEMAP_MAX_PAGES = 2     # 하루치 사이트맵 최대 페이지 수 (1~2페이지만 존재)
+RETRY_FAILED_ONLY = False  # True 면 사이트맵 대신 원장의 failed 기사만 다시 수집
+
+# robots.txt Disallow 규칙: 로컬 파일 → 사이트 robots.txt → url_policy 기본 규칙 순으로 로드
+ROBOTS_TXT_FILE = None   # 예: "yna_robots.txt" (None 이면 ROBOTS_TXT_URL 에서 가져옴)
+ROBOTS_TXT_URL  = f"{YONHAP_BASE_URL}/robots.txt"
 
-DISALLOWED_PATTERNS = [
-    r'/\*?\*cp=',
-    r'/view/AEN.*', r'/view/ACK.*', r'/view/AJP.*', r'/view/AAR.*',
-    r'/view/ASP.*', r'/view/AFR.*',
-    r'/hc\.html',
-    r'/search/', r'/search/\*?\*query=',
-    r'/did/', r'/program/', r'/web/', r'/irclub/', r'/changwon/',
-    r'/gangwon-do/', r'/coronavirus/',
-    r'/view/AKR20221115124100505'
-]
+PARSER_BACKEND  = "auto"   # html_extract 백엔드: "auto"(selectolax → lxml → bs4) / "selectolax" / "lxml" / "bs4"
 
 # ────────────────────── 내부 공용 도구 (thread‑safe) ──────────────────────
-FILE_LOCK = threading.Lock()
-crawled_urls = set()
-if os.path.exists(OUTPUT_JSON_FILE):
-    with open(OUTPUT_JSON_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            try:
-                data = json.loads(line)
-                crawled_urls.add(data['url'])
-            except json.JSONDecodeError:
-                continue
-    print(f"기존에 {len(crawled_urls)}개의 URL이 파일에서 로드되었습니다.")
+# 원장·writer 스레드·응답 캐시·robots.txt 규칙은 init() 에서 준비
+# (crawl_async.py / bench_crawl.py 가 import 만 해도 파일·스레드·네트워크를 건드리지 않도록)
+LEDGER     = None
+WRITER     = None
+HTTP_CACHE = None
+URL_POLICY = None
+
+def _mark_written(records):
+    """writer 가 파일에 기록한 기사만 원장에 fetched 로 표시"""
+    LEDGER.mark_many([(r["id"], r["url"], r["title"]) for r in records], STATUS_FETCHED)
+
+def init():
+    """크롤링 전에 한 번 호출 (이미 준비됐으면 아무것도 하지 않음)"""
+    global LEDGER, WRITER, HTTP_CACHE, URL_POLICY
+    if LEDGER is not None:
+        return
+
+    os.makedirs(os.path.dirname(CRAWL_LEDGER_FILE) or ".", exist_ok=True)
+    os.makedirs(OUTPUT_SHARD_DIR, exist_ok=True)
+    LEDGER = CrawlLedger(CRAWL_LEDGER_FILE)
+    if len(LEDGER) == 0 and os.path.exists(OUTPUT_JSON_FILE):
+        # 원장 도입 이전에 수집한 JSONL 은 최초 1회만 읽어 fetched 로 등록
+        imported = LEDGER.import_jsonl(OUTPUT_JSON_FILE)
+        print(f"기존 결과 파일에서 {imported}개의 기사를 원장으로 옮겼습니다.")
+    print(f"크롤링 원장 로드: {LEDGER.counts()}")
+
+    WRITER = ArticleWriter(
+        OUTPUT_SHARD_DIR,
+        compression=OUTPUT_COMPRESSION,
+        queue_size=WRITER_QUEUE_SIZE,
+        batch_size=WRITER_BATCH_SIZE,
+        fsync_interval=WRITER_FSYNC_INTERVAL,
+        on_written=_mark_written,
+    )
+    atexit.register(WRITER.close)
+
+    HTTP_CACHE = ResponseCache(HTTP_CACHE_FILE) if HTTP_CACHE_ENABLED else None
+    if HTTP_CACHE is not None:
+        print(f"응답 캐시 로드: {len(HTTP_CACHE):,}건 ({HTTP_CACHE_FILE})")
+
+    URL_POLICY = UrlPolicy.load(ROBOTS_TXT_FILE, ROBOTS_TXT_URL, USER_AGENT)
+    print(f"robots.txt 규칙 로드: {URL_POLICY}")
+    print(f"HTML 파서 백엔드: {resolve_backend(PARSER_BACKEND)}")
+
+class FetchStats:
+    """요청 지연시간·재시도·실패 집계 (동기/비동기 크롤러 공용, bench_crawl.py 에서 리포트)"""
+
+    def __init__(self, max_samples: int = 100_000):
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=max_samples)   # 성공한 요청의 응답 시간(초), 최근 max_samples 개
+        self.pages = self.articles = self.retries = self.failures = 0
+        self.cache_hits = self.revalidated = 0   # 요청 없이 캐시 사용 / 304 로 캐시 사용
+
+    def record_success(self, url: str, latency: float):
+        with self.lock:
+            self.latencies.append(latency)
+            if "/sitemap/" in url:
+                self.pages += 1
+            else:
+                self.articles += 1
+
+    def record_retry(self):
+        with self.lock:
+            self.retries += 1
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+
+    def record_cache_hit(self):
+        with self.lock:
+            self.cache_hits += 1
+
+    def record_revalidated(self):
+        with self.lock:
+            self.revalidated += 1
+
+FETCH_STATS = FetchStats()
 
 _thread_local = threading.local()
 
@@ -65,175 +153,294 @@ def get_session():
     return _thread_local.sess
 
 def is_allowed_url(url: str) -> bool:
-    path = url.replace(YONHAP_BASE_URL, "")
-    return not any(re.search(pat, path) for pat in DISALLOWED_PATTERNS)
+    return URL_POLICY.is_allowed(url)
+
+def lookup_cache(url: str):
+    """(바로 쓸 캐시 본문, 재검증할 캐시 항목) 반환. 기사 페이지는 캐시에 있으면 요청하지 않음"""
+    if HTTP_CACHE is None:
+        return None, None
+    cached = HTTP_CACHE.get(url)
+    if cached is not None and is_immutable_url(url):
+        FETCH_STATS.record_cache_hit()
+        return cached.body, None
+    return None, cached
+
+def store_response(url: str, html: str, headers):
+    if HTTP_CACHE is not None:
+        HTTP_CACHE.put(url, html, headers.get("ETag"), headers.get("Last-Modified"))
+
+def revalidated(url: str, cached):
+    """304 응답 → 캐시 본문 사용"""
+    FETCH_STATS.record_revalidated()
+    HTTP_CACHE.touch(url)
+    return cached.body
+
+def fetch_html(url: str, max_retries: int = 3):
+    """(HTML 문자열 또는 None, 요청 없이 캐시에서 꺼냈는지 여부)"""
+    body, cached = lookup_cache(url)
+    if body is not None:
+        return body, True
+    headers = cached.conditional_headers() if cached is not None else None
 
-def get_html_soup(url: str, max_retries: int = 3):
     sess = get_session()
     for attempt in range(max_retries):
+        if attempt:
+            FETCH_STATS.record_retry()
         try:
-            resp = sess.get(url, timeout=15)
+            t0 = time.perf_counter()
+            resp = sess.get(url, timeout=15, headers=headers)
+            if resp.status_code == 304 and cached is not None:
+                FETCH_STATS.record_success(url, time.perf_counter() - t0)
+                return revalidated(url, cached), False
             resp.raise_for_status()
-            return BeautifulSoup(resp.text, "html.parser")
+            FETCH_STATS.record_success(url, time.perf_counter() - t0)
+            store_response(url, resp.text, resp.headers)
+            return resp.text, False
         except requests.exceptions.RequestException as e:
             print(f"[에러] {url} (시도 {attempt+1}/{max_retries}) → {e}")
             time.sleep(random.uniform(CRAWL_DELAY_MAX, CRAWL_DELAY_MAX*2))
-    return None
+    FETCH_STATS.record_failure()
+    return None, False
+
+def get_html(url: str, max_retries: int = 3):
+    """URL 의 HTML 문자열 반환 (재시도 후에도 실패하면 None)"""
+    return fetch_html(url, max_retries)[0]
 
-def save_article_to_jsonl(article_data: dict):
-    """JSONL 파일 쓰기 – 동시 접근 보호"""
-    with FILE_LOCK:
-        with open(OUTPUT_JSON_FILE, "a", encoding="utf-8") as f:
-            json.dump(article_data, f, ensure_ascii=False)
-            f.write("\n")
+def get_html_soup(url: str, max_retries: int = 3):
+    html = get_html(url, max_retries)
+    return BeautifulSoup(html, "html.parser") if html is not None else None
+
+def save_article_to_jsonl(article_data: dict, shard_key: str = None):
+    """writer 큐에 기사 추가 (shard_key: 사이트맵 날짜, 없으면 기사 ID 의 날짜)"""
+    WRITER.put(article_data, shard_key)
 
 # ────────────────────── 기사 세부 정보 추출 ──────────────────────
+EMPTY_DETAILS = {"content": None, "pubDate": None, "journalist": None, "category": None}
+
 def fetch_article_details(article_url: str) -> dict:
-    soup = get_html_soup(article_url)
-    if not soup:
-        return {"content": None, "pubDate": None, "journalist": None, "category": None}
-
-    # 본문
-    content_div = soup.find("div", class_="story-news article") \
-                 or soup.find("article", id="article-view-content-div")
-    content_text = None
-    if content_div:
-        content_text = " ".join(content_div.get_text(" ", strip=True).split())
-
-    # 발행일(기사 URL 안의 AKRYYYYMMDD 패턴 활용)
-    pub_date_iso = None
-
-    # 1. div 태그의 data-published-time 속성 사용 (추천)
-    update_time_div = soup.find('div', id='newsUpdateTime01')
-    if update_time_div and 'data-published-time' in update_time_div.attrs:
-        raw_datetime_str = update_time_div['data-published-time']
-        try:
-            # "YYYY-MM-DD HH:MM" 형식을 ISO 8601로 변환
-            pub_date_iso = datetime.strptime(raw_datetime_str, '%Y-%m-%d %H:%M').isoformat()
-        except ValueError:
-            pass
-
-    # 2. 만약 data-published-time이 없다면, 기존 URL 방식 또는 p 태그 텍스트 파싱으로 폴백 (선택 사항)
-    if not pub_date_iso:
-        # 기존 URL 방식 폴백 (AKRXXXXXXXX)
-        m = re.search(r"AKR(\d{8})", article_url)
-        if m:
-            try:
-                pub_date_iso = datetime.strptime(m.group(1), "%Y%m%d").isoformat()
-            except ValueError:
-                pass
-
-    # 기자
-    journalist = None
-    byline = soup.find("p", class_="byline")
-    if byline:
-        journalist = byline.get_text(strip=True).replace("기자", "").replace(":", "").strip()
-
-    # 카테고리
-    category = None
-    meta = soup.find("meta", property="article:section")
-    if meta and "content" in meta.attrs:
-        category = meta["content"]
+    html = get_html(article_url)
+    if not html:
+        return dict(EMPTY_DETAILS)
+    return extract_article_fields(html, article_url, PARSER_BACKEND)
+
+def parse_article_details(soup, article_url: str) -> dict:
+    """파싱된 기사 페이지(BeautifulSoup)에서 본문·발행일·기자·카테고리 추출"""
+    return parse_article_soup(soup, article_url)
 
+# ────────────────────── 기사 태그 처리 (본문 병렬) ──────────────────────
+def resolve_article_url(title: str, rel_url: str):
+    """사이트맵 링크(제목, href) → (제목, 절대 URL). 수집 대상이 아니면 None"""
+    if not rel_url:
+        return None
+
+    full_url = urljoin(YONHAP_BASE_URL, rel_url)
+    if "/view/" not in full_url:
+        return None
+
+    article_id = article_id_from_url(full_url)
+    if LEDGER.is_done(article_id):
+        print(f"    ⏩ 이미 크롤링된 URL: {full_url}")
+        return None
+
+    if not is_allowed_url(full_url):
+        LEDGER.mark(article_id, STATUS_DISALLOWED, full_url, title)
+        return None
+    return title, full_url
+
+def build_article_record(title: str, full_url: str, details: dict):
+    """기사 세부 정보 → JSONL 한 줄 레코드 (본문이 없으면 None)"""
+    if not details["content"]:
+        return None
     return {
-        "content":    content_text,
-        "pubDate":    pub_date_iso,
-        "journalist": journalist,
-        "category":   category
+        "id":        full_url.split("/")[-1].split(".")[0],
+        "url":       full_url,
+        "title":     title,
+        "pubDate":   details["pubDate"],
+        "media":     "연합뉴스",
+        "content":   details["content"],
+        "journalist":details["journalist"],
+        "category":  details["category"],
+        "crawled_at":datetime.now().isoformat()
     }
 
-# ────────────────────── 기사 태그 처리 (본문 병렬) ──────────────────────
-def process_article(article_tag):
+def finish_article(title: str, full_url: str, html):
+    """기사 HTML → 레코드. 요청 실패/빈 본문은 원장에 기록하고 None 반환"""
+    article_id = article_id_from_url(full_url)
+    if html is None:
+        LEDGER.mark(article_id, STATUS_FAILED, full_url, title)
+        return None
+    record = build_article_record(title, full_url, extract_article_fields(html, full_url, PARSER_BACKEND))
+    if record is None:
+        LEDGER.mark(article_id, STATUS_EMPTY, full_url, title)
+    return record
+
+def process_article_url(title: str, full_url: str):
     try:
-        title   = article_tag.get_text(strip=True)
-        rel_url = article_tag.get("href")
-        if not rel_url:
-            return None
-
-        full_url = urljoin(YONHAP_BASE_URL, rel_url)
-        if full_url in crawled_urls:
-            print(f"    ⏩ 이미 크롤링된 URL: {full_url}")
-            return None
-
-        if "/view/" not in full_url or not is_allowed_url(full_url):
-            return None
-
         print(f"    ▶ {title} ({full_url})")
-        details = fetch_article_details(full_url)
-        time.sleep(random.uniform(CRAWL_DELAY_MIN, CRAWL_DELAY_MAX))  # polite crawl
-
-        if details["content"]:
-            return {
-                "id":        full_url.split("/")[-1].split(".")[0],
-                "url":       full_url,
-                "title":     title,
-                "pubDate":   details["pubDate"],
-                "media":     "연합뉴스",
-                "content":   details["content"],
-                "journalist":details["journalist"],
-                "category":  details["category"],
-                "crawled_at":datetime.now().isoformat()
-            }
+        html, from_cache = fetch_html(full_url)
+        if not from_cache:   # 캐시 적중은 요청을 보내지 않았으므로 쉬지 않음
+            time.sleep(random.uniform(CRAWL_DELAY_MIN, CRAWL_DELAY_MAX))  # polite crawl
+
+        return finish_article(title, full_url, html)
     except Exception as e:
         print(f"    [오류] {e}")
     return None
 
+def process_article(article_tag):
+    try:
+        target = resolve_article_url(article_tag.get_text(strip=True), article_tag.get("href"))
+    except Exception as e:
+        print(f"    [오류] {e}")
+        return None
+    if not target:
+        return None
+    return process_article_url(*target)
+
 # ────────────────────── 사이트맵 페이지 처리 (기사 워커 활용) ──────────────────────
-def process_sitemap_page(url: str, article_executor: ThreadPoolExecutor) -> int:
-    soup = get_html_soup(url)
-    if not soup:
-        return 0
-    article_tags = soup.select("ul#sitemap-list a")
-    if not article_tags:
-        return 0
-
-    futures = [article_executor.submit(process_article, tag) for tag in article_tags]
-    saved   = 0
+def fetch_sitemap_targets(url: str):
+    """사이트맵 페이지 → (전체 링크 수, 수집 대상 (제목, URL) 목록)
+
+    파싱 트리는 이 함수 안에서만 쓰고 버려서 기사 요청이 끝날 때까지 붙잡지 않음
+    """
+    html = get_html(url)
+    if not html:
+        return 0, []
+    return resolve_sitemap_targets(html)
+
+def resolve_sitemap_targets(html: str):
+    """사이트맵 HTML → (전체 링크 수, 수집 대상 (제목, URL) 목록) (파싱 + 원장 조회)"""
+    links = extract_sitemap_links(html, PARSER_BACKEND)
+
+    targets = []
+    for title, rel_url in links:
+        try:
+            target = resolve_article_url(title, rel_url)
+        except Exception as e:
+            print(f"    [오류] {e}")
+            continue
+        if target:
+            targets.append(target)
+    return len(links), targets
+
+def crawl_sitemap_page(url: str, article_executor: ThreadPoolExecutor, article_slots=None):
+    """사이트맵 페이지 하나 처리 → (전체 링크 수, 저장 건수)
+
+    article_slots(BoundedSemaphore)가 있으면 제출 전에 슬롯을 받아 진행 중인 기사 수를 제한
+    """
+    link_count, targets = fetch_sitemap_targets(url)
+    if not targets:
+        return link_count, 0
+
+    shard_key = shard_key_from_sitemap_url(url)
+    futures = []
+    for title, full_url in targets:
+        if article_slots is not None:
+            article_slots.acquire()
+        fut = article_executor.submit(process_article_url, title, full_url)
+        if article_slots is not None:
+            fut.add_done_callback(lambda _: article_slots.release())
+        futures.append(fut)
+
+    saved = 0
     for fut in as_completed(futures):
         item = fut.result()
         if item:
-            save_article_to_jsonl(item)
+            save_article_to_jsonl(item, shard_key)
             saved += 1
+    return link_count, saved
+
+def process_sitemap_page(url: str, article_executor: ThreadPoolExecutor, article_slots=None) -> int:
+    return crawl_sitemap_page(url, article_executor, article_slots)[1]
+
+def process_sitemap_day(year: int, month: int, day: int,
+                        article_executor: ThreadPoolExecutor, article_slots=None) -> int:
+    """하루치 사이트맵을 1페이지부터 처리. 페이지가 가득 차지 않으면 다음 페이지는 요청하지 않음"""
+    saved = 0
+    for page in range(1, SITEMAP_MAX_PAGES + 1):
+        url = sitemap_page_url(year, month, day, page)
+        print(f"[PAGE] {url}")
+        link_count, page_saved = crawl_sitemap_page(url, article_executor, article_slots)
+        saved += page_saved
+        if link_count < SITEMAP_PAGE_SIZE:
+            break
     return saved
 
 # ────────────────────── 메인 크롤러 ──────────────────────
+def iter_crawl_days():
+    """START ~ END 범위의 (year, month, day)를 날짜 순으로 생성"""
+    for year in range(START_YEAR, END_YEAR + 1):
+        for month in range(1, 13):
+            if (year == START_YEAR and month < START_MONTH) or \
+               (year == END_YEAR   and month > END_MONTH):
+                continue
+
+            # 해당 월의 마지막 날 계산
+            days_in_month = (datetime(year + (month // 12),
+                                      (month % 12) + 1, 1)
+                             - datetime(year, month, 1)).days
+
+            for day in range(1, days_in_month + 1):
+                yield year, month, day
+
+def sitemap_page_url(year: int, month: int, day: int, page: int) -> str:
+    return f"{YONHAP_BASE_URL}/sitemap/articles/{year}/{month:02d}/{day:02d}-{page}.htm"
+
 def start_archive_crawling_parallel():
     print("=== 연합뉴스 아카이브 크롤링 (병렬) 시작 ===")
 
+    article_slots = threading.BoundedSemaphore(MAX_INFLIGHT_ARTICLES)
+    total_saved = 0
+
     with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as article_pool, \
          ThreadPoolExecutor(max_workers=PAGE_WORKERS)    as page_pool:
 
-        page_futs = []
-
-        for year in range(START_YEAR, END_YEAR + 1):
-            for month in range(1, 13):
-                if (year == START_YEAR and month < START_MONTH) or \
-                   (year == END_YEAR   and month > END_MONTH):
-                    continue
-
-                # 해당 월의 마지막 날 계산
-                days_in_month = (datetime(year + (month // 12),
-                                          (month % 12) + 1, 1)
-                                 - datetime(year, month, 1)).days
-
-                for day in range(1, days_in_month + 1):
-                    for page in range(1, 3):  # 1~2페이지만 존재
-                        sitemap_url = f"{YONHAP_BASE_URL}/sitemap/articles/{year}/{month:02d}/{day:02d}-{page}.htm"
-                        print(f"[QUEUE] {sitemap_url}")
-                        page_futs.append(
-                            page_pool.submit(process_sitemap_page, sitemap_url, article_pool)
-                        )
+        # 날짜 순으로 PAGE_WORKERS 개까지만 제출하고, 하나가 끝나야 다음 날짜를 제출
+        pending = set()
+        for year, month, day in iter_crawl_days():
+            if len(pending) >= PAGE_WORKERS:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                total_saved += sum(f.result() for f in done)
+            print(f"[QUEUE] {year}-{month:02d}-{day:02d}")
+            pending.add(page_pool.submit(
+                process_sitemap_day, year, month, day, article_pool, article_slots
+            ))
 
         # 진행 상황 수집
-        total_saved = 0
-        for fut in as_completed(page_futs):
+        for fut in as_completed(pending):
             total_saved += fut.result()
 
     print(f"=== 크롤링 완료: 총 {total_saved:,}건 저장 ===")
 
+def retry_failed_articles():
+    """원장에 failed 로 남은 기사만 다시 요청"""
+    failed = LEDGER.iter_status(STATUS_FAILED)
+    print(f"=== 실패 기사 재수집 시작: {len(failed):,}건 ===")
+
+    total_saved = 0
+    with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as article_pool:
+        futures = [article_pool.submit(process_article_url, title or "", url)
+                   for _, url, title in failed if url]
+        for fut in as_completed(futures):
+            item = fut.result()
+            if item:
+                save_article_to_jsonl(item)
+                total_saved += 1
+
+    print(f"=== 재수집 완료: 총 {total_saved:,}건 저장 ===")
+
 # ────────────────────── 실행 스크립트 진입점 ──────────────────────
 if __name__ == "__main__":
-    os.makedirs(os.path.dirname(OUTPUT_JSON_FILE), exist_ok=True)
+    init()
     t0 = time.time()
-    start_archive_crawling_parallel()
+    if RETRY_FAILED_ONLY:
+        retry_failed_articles()
+    else:
+        start_archive_crawling_parallel()
+    WRITER.close()
+    print(f"기록된 기사: {WRITER.written:,}건 → {OUTPUT_SHARD_DIR}")
+    print(f"원장 상태: {LEDGER.counts()}")
+    print(f"캐시 사용: {FETCH_STATS.cache_hits:,}건, 304 재검증: {FETCH_STATS.revalidated:,}건")
+    LEDGER.close()
+    if HTTP_CACHE is not None:
+        HTTP_CACHE.close()
     print(f"소요 시간: {(time.time() - t0)/3600:.2f} 시간")
@@ -0,0 +1,209 @@
+"""
+Yonhap News 아카이브 크롤러 – asyncio 버전
+------------------------------------------
+● crawl_4.py 의 사이트맵 → 기사 흐름(process_sitemap_page / process_article /
+  fetch_article_details)과 기사 필터·메타데이터 추출은 그대로 재사용
+● 개선점
+    1) 스레드 100개 + 스레드별 time.sleep 대신 단일 이벤트 루프에서 aiohttp 로 요청
+    2) 호스트별 토큰 버킷으로 초당 요청 수(REQUESTS_PER_SECOND)를 전역적으로 제한
+       → 워커 수와 무관하게 실제 요청 속도가 REQUESTS_PER_SECOND 를 넘지 않음
+    3) aiohttp.ClientSession 하나로 커넥션 풀을 공유 (keep-alive 재사용)
+    4) 사이트맵 날짜·기사 동시 처리 수는 워커 수/세마포어로 고정
+       (기사 태스크는 슬롯을 받은 뒤에 생성, 가득 차지 않은 1페이지 뒤의 2페이지는 요청하지 않음)
+    5) 파싱·원장(SQLite)·응답 캐시·writer 큐처럼 블로킹되는 작업은 asyncio.to_thread 로 넘겨
+       이벤트 루프는 요청 발행과 토큰 버킷만 담당 (요청 속도가 파싱·디스크 I/O 에 묶이지 않음)
+"""
+
+import asyncio, random, time
+from urllib.parse import urlsplit
+
+import aiohttp
+from article_writer import shard_key_from_sitemap_url
+
+import crawl_4   # LEDGER / WRITER / HTTP_CACHE 는 crawl_4.init() 뒤에 생기므로 모듈로 참조
+from crawl_4 import (
+    USER_AGENT, CRAWL_DELAY_MAX, OUTPUT_SHARD_DIR, FETCH_STATS,
+    SITEMAP_PAGE_SIZE, SITEMAP_MAX_PAGES,
+    resolve_sitemap_targets, finish_article, save_article_to_jsonl,
+    iter_crawl_days, sitemap_page_url,
+    lookup_cache, store_response, revalidated,
+)
+
+# ────────────────────────────── 설정값 ──────────────────────────────
+REQUESTS_PER_SECOND = 5.0   # 호스트당 초당 요청 수 (토큰 충전 속도)
+REQUEST_BURST       = 5     # 토큰 버킷 최대 용량 (순간 허용 요청 수)
+MAX_CONNECTIONS     = 20    # 커넥션 풀 크기
+PAGE_WORKERS        = 2     # 동시에 처리할 사이트맵 날짜 수
+ARTICLE_CONCURRENCY = 50    # 동시에 진행 중인 기사 요청 수
+REQUEST_TIMEOUT     = 15    # 초
+
+# ────────────────────── 요청 속도 제한 (토큰 버킷) ──────────────────────
+class TokenBucket:
+    """초당 rate 개씩 토큰이 충전되고 최대 capacity 개까지 쌓이는 버킷"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate     = rate
+        self.capacity = capacity
+        self.tokens   = float(capacity)
+        self.updated  = time.monotonic()
+        self._lock    = asyncio.Lock()
+
+    async def acquire(self):
+        # 락을 쥔 채로 대기하므로 대기 중인 요청은 도착 순서대로 토큰을 받음
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class HostRateLimiter:
+    """호스트마다 독립적인 TokenBucket 을 두는 요청 속도 제한기"""
+
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, burst: int = REQUEST_BURST):
+        self.rate    = rate
+        self.burst   = burst
+        self.buckets = {}
+
+    async def acquire(self, url: str):
+        host = urlsplit(url).netloc
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        await bucket.acquire()
+
+# ────────────────────── HTTP 요청 ──────────────────────
+async def fetch_html(session: aiohttp.ClientSession, limiter: HostRateLimiter,
+                     url: str, max_retries: int = 3):
+    body, cached = await asyncio.to_thread(lookup_cache, url)
+    if body is not None:
+        return body
+    headers = cached.conditional_headers() if cached is not None else None
+
+    for attempt in range(max_retries):
+        if attempt:
+            FETCH_STATS.record_retry()
+        await limiter.acquire(url)
+        try:
+            t0 = time.perf_counter()
+            async with session.get(url, headers=headers) as resp:
+                if resp.status == 304 and cached is not None:
+                    FETCH_STATS.record_success(url, time.perf_counter() - t0)
+                    return await asyncio.to_thread(revalidated, url, cached)
+                resp.raise_for_status()
+                html = await resp.text()
+                resp_headers = resp.headers
+            FETCH_STATS.record_success(url, time.perf_counter() - t0)
+            await asyncio.to_thread(store_response, url, html, resp_headers)
+            return html
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"[에러] {url} (시도 {attempt+1}/{max_retries}) → {e}")
+            await asyncio.sleep(random.uniform(CRAWL_DELAY_MAX, CRAWL_DELAY_MAX*2))
+    FETCH_STATS.record_failure()
+    return None
+
+# ────────────────────── 기사 / 사이트맵 처리 ──────────────────────
+async def process_article_async(session, limiter, title: str, full_url: str):
+    try:
+        print(f"    ▶ {title} ({full_url})")
+        html = await fetch_html(session, limiter, full_url)
+        return await asyncio.to_thread(finish_article, title, full_url, html)
+    except Exception as e:
+        print(f"    [오류] {e}")
+    return None
+
+async def fetch_sitemap_targets_async(session, limiter, url: str):
+    """사이트맵 페이지 → (전체 링크 수, 수집 대상 (제목, URL) 목록)"""
+    html = await fetch_html(session, limiter, url)
+    if not html:
+        return 0, []
+    return await asyncio.to_thread(resolve_sitemap_targets, html)
+
+async def process_sitemap_page_async(session, limiter, article_sem, url: str):
+    """사이트맵 페이지 하나 처리 → (전체 링크 수, 저장 건수)"""
+    link_count, targets = await fetch_sitemap_targets_async(session, limiter, url)
+    if not targets:
+        return link_count, 0
+
+    shard_key = shard_key_from_sitemap_url(url)
+    tasks = []
+    for title, full_url in targets:
+        await article_sem.acquire()
+        task = asyncio.create_task(process_article_async(session, limiter, title, full_url))
+        task.add_done_callback(lambda _: article_sem.release())
+        tasks.append(task)
+
+    saved = 0
+    for fut in asyncio.as_completed(tasks):
+        item = await fut
+        if item:
+            # writer 큐가 가득 차면 이 태스크만 기다리고 이벤트 루프(다른 요청)는 계속 진행
+            await asyncio.to_thread(save_article_to_jsonl, item, shard_key)
+            saved += 1
+    return link_count, saved
+
+async def process_sitemap_day_async(session, limiter, article_sem, year, month, day) -> int:
+    saved = 0
+    for page in range(1, SITEMAP_MAX_PAGES + 1):
+        url = sitemap_page_url(year, month, day, page)
+        print(f"[PAGE] {url}")
+        link_count, page_saved = await process_sitemap_page_async(session, limiter, article_sem, url)
+        saved += page_saved
+        if link_count < SITEMAP_PAGE_SIZE:
+            break
+    return saved
+
+# ────────────────────── 메인 크롤러 ──────────────────────
+async def start_archive_crawling_async():
+    print("=== 연합뉴스 아카이브 크롤링 (asyncio) 시작 ===")
+    print(f"    호스트당 {REQUESTS_PER_SECOND}건/초, 커넥션 {MAX_CONNECTIONS}개")
+
+    limiter     = HostRateLimiter(REQUESTS_PER_SECOND, REQUEST_BURST)
+    article_sem = asyncio.Semaphore(ARTICLE_CONCURRENCY)
+    day_queue   = asyncio.Queue(maxsize=PAGE_WORKERS)
+    total_saved = 0
+
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    timeout   = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                     headers={"User-Agent": USER_AGENT}) as session:
+
+        async def day_worker():
+            nonlocal total_saved
+            while True:
+                ymd = await day_queue.get()
+                try:
+                    if ymd is None:
+                        return
+                    saved = await process_sitemap_day_async(session, limiter, article_sem, *ymd)
+                    total_saved += saved
+                finally:
+                    day_queue.task_done()
+
+        workers = [asyncio.create_task(day_worker()) for _ in range(PAGE_WORKERS)]
+        for year, month, day in iter_crawl_days():
+            print(f"[QUEUE] {year}-{month:02d}-{day:02d}")
+            await day_queue.put((year, month, day))
+        for _ in workers:
+            await day_queue.put(None)
+        await asyncio.gather(*workers)
+
+    print(f"=== 크롤링 완료: 총 {total_saved:,}건 저장 ===")
+    return total_saved
+
+# ────────────────────── 실행 스크립트 진입점 ──────────────────────
+if __name__ == "__main__":
+    crawl_4.init()
+    t0 = time.time()
+    asyncio.run(start_archive_crawling_async())
+    crawl_4.WRITER.close()
+    print(f"기록된 기사: {crawl_4.WRITER.written:,}건 → {OUTPUT_SHARD_DIR}")
+    print(f"원장 상태: {crawl_4.LEDGER.counts()}")
+    print(f"캐시 사용: {FETCH_STATS.cache_hits:,}건, 304 재검증: {FETCH_STATS.revalidated:,}건")
+    crawl_4.LEDGER.close()
+    if crawl_4.HTTP_CACHE is not None:
+        crawl_4.HTTP_CACHE.close()
+    print(f"소요 시간: {(time.time() - t0)/3600:.2f} 시간")
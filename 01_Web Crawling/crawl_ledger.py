@@ -0,0 +1,148 @@
+"""
+크롤링 상태 원장 (SQLite)
+-------------------------
+● 기존에는 시작할 때마다 OUTPUT_JSON_FILE 전체를 json.loads 해서 crawled_urls 셋을 채움
+  → 수년치 아카이브면 첫 요청 전까지 수 분 + 수 GB 메모리
+● 기사 ID(AKRyyyymmdd…)와 처리 상태만 SQLite 파일에 기록하고 필요할 때 조회
+    - fetched    : 본문 저장 완료
+    - failed     : 재시도 후에도 요청 실패 (선택적으로 재수집 가능)
+    - disallowed : robots.txt 규칙으로 제외
+    - empty      : 페이지는 받았지만 본문 없음
+● 조회는 기본키 인덱스 한 번이라 재시작 비용이 원장 크기와 무관 (WAL 모드, 스레드 공유)
+"""
+
+import json, os, sqlite3, threading
+from datetime import datetime
+
+STATUS_FETCHED    = "fetched"
+STATUS_FAILED     = "failed"
+STATUS_DISALLOWED = "disallowed"
+STATUS_EMPTY      = "empty"
+
+# 재시작 시 다시 요청하지 않는 상태 (failed 는 다음 실행에서 다시 시도)
+DONE_STATUSES = (STATUS_FETCHED, STATUS_DISALLOWED, STATUS_EMPTY)
+
+
+def article_id_from_url(url: str) -> str:
+    """https://www.yna.co.kr/view/AKR20170301000100001?... → AKR20170301000100001"""
+    return url.split("?", 1)[0].rstrip("/").split("/")[-1].split(".")[0]
+
+
+class CrawlLedger:
+    """기사 ID → 처리 상태를 기록하는 스레드 안전 SQLite 원장"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id         TEXT PRIMARY KEY,
+                status     TEXT NOT NULL,
+                url        TEXT,
+                title      TEXT,
+                attempts   INTEGER NOT NULL DEFAULT 1,
+                updated_at TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status)")
+        self._conn.commit()
+
+    # ───────────── 조회 ─────────────
+    def status(self, article_id: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM articles WHERE id = ?", (article_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, article_id: str) -> bool:
+        return self.status(article_id) in DONE_STATUSES
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM articles GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    def iter_status(self, status: str):
+        """해당 상태의 (id, url, title) 목록 (예: failed 기사만 재수집)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, url, title FROM articles WHERE status = ? ORDER BY id", (status,)
+            ).fetchall()
+        return rows
+
+    # ───────────── 기록 ─────────────
+    _UPSERT = """
+        INSERT INTO articles (id, status, url, title, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            status     = excluded.status,
+            url        = COALESCE(excluded.url, articles.url),
+            title      = COALESCE(excluded.title, articles.title),
+            attempts   = articles.attempts + 1,
+            updated_at = excluded.updated_at
+    """
+
+    def mark(self, article_id: str, status: str, url: str = None, title: str = None):
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute(self._UPSERT, (article_id, status, url, title, now))
+            self._conn.commit()
+
+    def mark_many(self, entries, status: str):
+        """(id, url, title) 여러 건을 한 트랜잭션으로 같은 상태로 기록"""
+        now = datetime.now().isoformat()
+        rows = [(article_id, status, url, title, now) for article_id, url, title in entries]
+        with self._lock:
+            self._conn.executemany(self._UPSERT, rows)
+            self._conn.commit()
+
+    def import_jsonl(self, jsonl_path: str, batch_size: int = 10000) -> int:
+        """기존 JSONL 결과 파일의 기사들을 fetched 로 일괄 등록 (최초 1회 이전용)"""
+        if not os.path.exists(jsonl_path):
+            return 0
+        now = datetime.now().isoformat()
+        imported = 0
+        batch = []
+
+        def flush():
+            with self._lock:
+                self._conn.executemany("""
+                    INSERT OR IGNORE INTO articles (id, status, url, title, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, batch)
+                self._conn.commit()
+
+        with open(jsonl_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                url = data.get("url")
+                article_id = data.get("id") or (url and article_id_from_url(url))
+                if not article_id:
+                    continue
+                batch.append((article_id, STATUS_FETCHED, url, data.get("title"), now))
+                if len(batch) >= batch_size:
+                    flush()
+                    imported += len(batch)
+                    batch = []
+        if batch:
+            flush()
+            imported += len(batch)
+        return imported
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
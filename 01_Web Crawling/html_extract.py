@@ -0,0 +1,212 @@
+"""
+기사/사이트맵 HTML 추출기 (파서 백엔드 선택)
+------------------------------------------
+● 네트워크를 병렬화한 뒤로는 BeautifulSoup(html.parser) 파싱이 CPU 병목
+● 기사 페이지에서 실제로 필요한 것은 네 가지뿐
+    - 본문     : div.story-news.article (없으면 article#article-view-content-div)
+    - 발행시각 : div#newsUpdateTime01 의 data-published-time
+    - 기자     : p.byline
+    - 카테고리 : meta[property="article:section"]
+● C 기반 파서(selectolax → lxml 순)로 위 필드만 바로 꺼내고,
+  본문을 찾지 못하면(마크업 변경 등) BeautifulSoup 경로로 다시 추출
+● PARSER_BACKEND = "auto" 면 설치된 가장 빠른 백엔드 사용, "bs4" 로 기존 동작 고정 가능
+"""
+
+import re
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+except ImportError:
+    try:  # lexbor 백엔드가 없는 구버전 selectolax
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+    except ImportError:
+        _SelectolaxParser = None
+
+try:
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+PARSER_BACKEND = "auto"   # "auto" / "selectolax" / "lxml" / "bs4"
+
+CONTENT_CLASS   = "story-news article"
+CONTENT_ALT_ID  = "article-view-content-div"
+UPDATE_TIME_ID  = "newsUpdateTime01"
+SITEMAP_LINKS   = "ul#sitemap-list a"
+_URL_DATE       = re.compile(r"AKR(\d{8})")
+
+
+def available_backends() -> list:
+    backends = []
+    if _SelectolaxParser is not None:
+        backends.append("selectolax")
+    if _lxml_html is not None:
+        backends.append("lxml")
+    backends.append("bs4")
+    return backends
+
+
+def resolve_backend(backend: str = None) -> str:
+    backend = backend or PARSER_BACKEND
+    if backend == "auto":
+        return available_backends()[0]
+    if backend not in available_backends():
+        raise ValueError(f"사용할 수 없는 파서 백엔드: {backend} (설치됨: {available_backends()})")
+    return backend
+
+
+# ────────────────────── 공통 후처리 ──────────────────────
+def _squash(text):
+    return " ".join(text.split()) if text else None
+
+
+def _build_details(content_text, raw_published, byline_text, category, article_url: str) -> dict:
+    # 발행일: data-published-time("YYYY-MM-DD HH:MM") 우선, 없으면 URL 의 AKRYYYYMMDD
+    pub_date_iso = None
+    if raw_published:
+        try:
+            pub_date_iso = datetime.strptime(raw_published, '%Y-%m-%d %H:%M').isoformat()
+        except ValueError:
+            pass
+    if not pub_date_iso:
+        m = _URL_DATE.search(article_url)
+        if m:
+            try:
+                pub_date_iso = datetime.strptime(m.group(1), "%Y%m%d").isoformat()
+            except ValueError:
+                pass
+
+    journalist = None
+    if byline_text is not None:
+        journalist = byline_text.replace("기자", "").replace(":", "").strip()
+
+    return {
+        "content":    content_text or None,
+        "pubDate":    pub_date_iso,
+        "journalist": journalist,
+        "category":   category,
+    }
+
+
+# ────────────────────── BeautifulSoup 경로 (기준 구현) ──────────────────────
+def parse_article_soup(soup, article_url: str) -> dict:
+    content_div = soup.find("div", class_=CONTENT_CLASS) \
+                 or soup.find("article", id=CONTENT_ALT_ID)
+    content_text = None
+    if content_div:
+        content_text = _squash(content_div.get_text(" ", strip=True))
+
+    raw_published = None
+    update_time_div = soup.find('div', id=UPDATE_TIME_ID)
+    if update_time_div and 'data-published-time' in update_time_div.attrs:
+        raw_published = update_time_div['data-published-time']
+
+    byline_text = None
+    byline = soup.find("p", class_="byline")
+    if byline:
+        byline_text = byline.get_text(strip=True)
+
+    category = None
+    meta = soup.find("meta", property="article:section")
+    if meta and "content" in meta.attrs:
+        category = meta["content"]
+
+    return _build_details(content_text, raw_published, byline_text, category, article_url)
+
+
+def _sitemap_links_bs4(html: str) -> list:
+    soup = BeautifulSoup(html, "html.parser")
+    return [(a.get_text(strip=True), a.get("href")) for a in soup.select(SITEMAP_LINKS)]
+
+
+# ────────────────────── selectolax 경로 ──────────────────────
+def _article_selectolax(html: str, article_url: str) -> dict:
+    tree = _SelectolaxParser(html)
+    content_node = tree.css_first(f'div[class="{CONTENT_CLASS}"]') \
+                  or tree.css_first(f"article#{CONTENT_ALT_ID}")
+    content_text = _squash(content_node.text(separator=" ", strip=True)) if content_node else None
+
+    update_node = tree.css_first(f"div#{UPDATE_TIME_ID}")
+    raw_published = update_node.attributes.get("data-published-time") if update_node else None
+
+    byline_node = tree.css_first("p.byline")
+    byline_text = byline_node.text(strip=True) if byline_node else None
+
+    meta_node = tree.css_first('meta[property="article:section"]')
+    category = meta_node.attributes.get("content") if meta_node else None
+
+    return _build_details(content_text, raw_published, byline_text, category, article_url)
+
+
+def _sitemap_links_selectolax(html: str) -> list:
+    tree = _SelectolaxParser(html)
+    return [(a.text(strip=True), a.attributes.get("href")) for a in tree.css(SITEMAP_LINKS)]
+
+
+# ────────────────────── lxml 경로 ──────────────────────
+def _first(nodes):
+    return nodes[0] if nodes else None
+
+
+def _lxml_text(node) -> str:
+    return " ".join(t.strip() for t in node.itertext() if t.strip())
+
+
+def _article_lxml(html: str, article_url: str) -> dict:
+    root = _lxml_html.fromstring(html)
+    content_node = _first(root.xpath(f'//div[@class="{CONTENT_CLASS}"]'))
+    if content_node is None:
+        content_node = _first(root.xpath(f'//article[@id="{CONTENT_ALT_ID}"]'))
+    content_text = _squash(_lxml_text(content_node)) if content_node is not None else None
+
+    update_node = _first(root.xpath(f'//div[@id="{UPDATE_TIME_ID}"]'))
+    raw_published = update_node.get("data-published-time") if update_node is not None else None
+
+    byline_node = _first(root.xpath('//p[contains(concat(" ", normalize-space(@class), " "), " byline ")]'))
+    byline_text = "".join(t.strip() for t in byline_node.itertext()) if byline_node is not None else None
+
+    meta_node = _first(root.xpath('//meta[@property="article:section"]'))
+    category = meta_node.get("content") if meta_node is not None else None
+
+    return _build_details(content_text, raw_published, byline_text, category, article_url)
+
+
+def _sitemap_links_lxml(html: str) -> list:
+    root = _lxml_html.fromstring(html)
+    return [("".join(t.strip() for t in a.itertext()), a.get("href"))
+            for a in root.xpath('//ul[@id="sitemap-list"]//a')]
+
+
+_ARTICLE_EXTRACTORS = {"selectolax": _article_selectolax, "lxml": _article_lxml}
+_SITEMAP_EXTRACTORS = {"selectolax": _sitemap_links_selectolax, "lxml": _sitemap_links_lxml,
+                       "bs4": _sitemap_links_bs4}
+
+
+# ────────────────────── 공개 API ──────────────────────
+def extract_article_fields(html: str, article_url: str, backend: str = None) -> dict:
+    """기사 HTML → {content, pubDate, journalist, category}"""
+    backend = resolve_backend(backend)
+    if backend != "bs4":
+        try:
+            details = _ARTICLE_EXTRACTORS[backend](html, article_url)
+            if details["content"]:
+                return details
+        except Exception as e:
+            print(f"    [파서] {backend} 추출 실패, BeautifulSoup 으로 재시도 → {e}")
+        # 본문을 찾지 못하면 마크업이 바뀌었을 수 있으므로 기준 구현으로 한 번 더 추출
+    return parse_article_soup(BeautifulSoup(html, "html.parser"), article_url)
+
+
+def extract_sitemap_links(html: str, backend: str = None) -> list:
+    """사이트맵 HTML → [(제목, href), ...]"""
+    backend = resolve_backend(backend)
+    try:
+        return _SITEMAP_EXTRACTORS[backend](html)
+    except Exception as e:
+        if backend == "bs4":
+            raise
+        print(f"    [파서] {backend} 사이트맵 추출 실패, BeautifulSoup 으로 재시도 → {e}")
+        return _sitemap_links_bs4(html)
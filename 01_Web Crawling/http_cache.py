@@ -0,0 +1,120 @@
+"""
+HTTP 응답 캐시 (조건부 GET)
+--------------------------
+● 한 달을 다시 돌리면(실패 기사 보충, 파서 변경 후 재추출 등) 사이트맵 페이지와 기사를 전부 다시 내려받음
+● URL 별로 본문(zlib 압축)과 ETag / Last-Modified 를 SQLite 파일 하나에 저장
+    - 기사 페이지(/view/…)   : 한 번 발행되면 바뀌지 않으므로 캐시에 있으면 요청 없이 바로 사용
+    - 그 외(사이트맵 페이지) : If-None-Match / If-Modified-Since 로 재검증 → 304 면 캐시 본문 사용
+● 캐시에서 꺼낸 기사 HTML 로 파서만 다시 돌릴 수 있음 (iter_bodies)
+● 조회·기록 방식은 crawl_ledger 와 같음 (WAL 모드, 스레드 공유 커넥션 + 락)
+"""
+
+import sqlite3, threading, zlib
+from datetime import datetime
+
+IMMUTABLE_MARKERS = ("/view/",)   # 이 문자열이 들어간 URL 은 재검증 없이 캐시 사용
+ITER_PAGE_SIZE    = 200          # iter_bodies 가 한 번에 읽을 항목 수
+
+
+def is_immutable_url(url: str) -> bool:
+    return any(marker in url for marker in IMMUTABLE_MARKERS)
+
+
+class CachedResponse:
+    __slots__ = ("url", "body", "etag", "last_modified")
+
+    def __init__(self, url: str, body: str, etag, last_modified):
+        self.url           = url
+        self.body          = body
+        self.etag          = etag
+        self.last_modified = last_modified
+
+    def conditional_headers(self) -> dict:
+        """재검증 요청에 붙일 헤더"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """URL → (압축 본문, ETag, Last-Modified) 를 저장하는 스레드 안전 SQLite 캐시"""
+
+    def __init__(self, path: str, compress_level: int = 6):
+        self.path = path
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url           TEXT PRIMARY KEY,
+                body          BLOB NOT NULL,
+                etag          TEXT,
+                last_modified TEXT,
+                fetched_at    TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+
+    # ───────────── 조회 ─────────────
+    def get(self, url: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(url, zlib.decompress(row[0]).decode("utf-8"), row[1], row[2])
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def iter_bodies(self, marker: str = "/view/", page_size: int = ITER_PAGE_SIZE):
+        """URL 에 marker 가 들어간 캐시 항목의 (url, HTML) (예: 기사 페이지만 다시 파싱)
+
+        page_size 건씩 URL 순으로 나눠 읽음 (본문 전체를 한꺼번에 메모리에 올리지 않고,
+        락도 한 페이지를 읽는 동안만 잡음)
+        """
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT url, body FROM responses WHERE url > ? AND instr(url, ?) > 0 "
+                    "ORDER BY url LIMIT ?", (last, marker, page_size)
+                ).fetchall()
+            for url, body in rows:
+                yield url, zlib.decompress(body).decode("utf-8")
+            if len(rows) < page_size:
+                break
+            last = rows[-1][0]
+
+    # ───────────── 기록 ─────────────
+    def put(self, url: str, body: str, etag: str = None, last_modified: str = None):
+        blob = zlib.compress(body.encode("utf-8"), self.compress_level)
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO responses (url, body, etag, last_modified, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    body = excluded.body, etag = excluded.etag,
+                    last_modified = excluded.last_modified, fetched_at = excluded.fetched_at
+            """, (url, blob, etag, last_modified, now))
+            self._conn.commit()
+
+    def touch(self, url: str):
+        """304 응답: 본문은 그대로 두고 확인 시각만 갱신"""
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?",
+                               (datetime.now().isoformat(), url))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,307 @@
+"""
+오프라인 재생(replay) 서버 – yna.co.kr 대역
+-------------------------------------------
+● 크롤러 변경(워커 수, 파서 백엔드 등)을 실제 사이트에 요청하지 않고 로컬에서 측정하기 위한 서버
+● 크롤러가 쓰는 세 종류의 경로만 흉내냄
+    - /robots.txt
+    - /sitemap/articles/YYYY/MM/DD-N.htm   (사이트맵 페이지)
+    - /view/<기사 ID>                       (기사 페이지)
+● FIXTURE_DIR 에 녹화해 둔 파일(경로 그대로 저장)이 있으면 그 내용을, 없으면
+  날짜·기사 번호로 결정되는 합성 페이지를 응답 (실제 마크업과 같은 선택자 사용)
+● 응답 지연(LATENCY_MS ± LATENCY_JITTER_MS), 5xx 오류 비율, 429 비율을 설정 가능
+● 200 응답에 ETag / Last-Modified 를 붙이고 If-None-Match 가 맞으면 304 (http_cache 재검증 측정용)
+● 사용법
+    python replay_server.py --port 8765 --latency-ms 50 --error-rate 0.01
+    python replay_server.py record --fixtures fixtures --date 2017-03-01 --limit 50
+"""
+
+import argparse, hashlib, os, random, re, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ────────────────────────────── 설정값 ──────────────────────────────
+FIXTURE_DIR        = None   # 녹화한 페이지 폴더 (None 이면 합성 페이지만 사용)
+LATENCY_MS         = 30     # 평균 응답 지연 (밀리초)
+LATENCY_JITTER_MS  = 20     # 지연 편차 (± 균등 분포)
+ERROR_RATE         = 0.0    # 503 으로 응답할 비율
+THROTTLE_RATE      = 0.0    # 429 (Retry-After) 로 응답할 비율
+ARTICLES_PER_DAY   = 300    # 합성 사이트맵 하루치 기사 수
+SITEMAP_PAGE_SIZE  = 1000   # 사이트맵 한 페이지의 링크 수 (crawl_4.SITEMAP_PAGE_SIZE 와 같게)
+PARAGRAPHS         = 8      # 합성 기사 본문 문단 수
+LAST_MODIFIED      = "Wed, 01 Mar 2017 00:00:00 GMT"   # 모든 응답에 붙이는 Last-Modified
+
+DEFAULT_ROBOTS_TXT = """User-agent: *
+Disallow: /search/
+Disallow: /*cp=
+"""
+
+YNA_BASE_URL = "https://www.yna.co.kr"
+USER_AGENT   = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+_SITEMAP_PATH = re.compile(r"^/sitemap/articles/(\d{4})/(\d{2})/(\d{2})-(\d+)\.htm$")
+_VIEW_PATH    = re.compile(r"^/view/([A-Z]{3})(\d{4})(\d{2})(\d{2})(\d{6})(\d{3})$")
+_CATEGORIES   = ["정치", "북한", "경제", "사회", "세계", "문화"]
+
+
+# ────────────────────── 합성 페이지 ──────────────────────
+def synthetic_article_id(year: int, month: int, day: int, index: int) -> str:
+    """(2017, 3, 1, 12) → AKR20170301000012001"""
+    return f"AKR{year:04d}{month:02d}{day:02d}{index:06d}001"
+
+
+def synthetic_sitemap_page(year: int, month: int, day: int, page: int,
+                           articles_per_day: int = ARTICLES_PER_DAY,
+                           page_size: int = SITEMAP_PAGE_SIZE) -> str:
+    start = (page - 1) * page_size
+    stop  = min(articles_per_day, start + page_size)
+    items = "".join(
+        f'<li><a href="/view/{synthetic_article_id(year, month, day, i)}">'
+        f"{year}-{month:02d}-{day:02d} 합성 기사 {i}</a></li>\n"
+        for i in range(start, stop)
+    )
+    return ("<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>sitemap</title></head>"
+            f"<body><ul id=\"sitemap-list\">\n{items}</ul></body></html>")
+
+
+def synthetic_article_page(article_id: str, year: int, month: int, day: int, index: int) -> str:
+    rng = random.Random(article_id)   # 같은 기사는 항상 같은 내용
+    hour, minute = rng.randrange(24), rng.randrange(60)
+    category = _CATEGORIES[index % len(_CATEGORIES)]
+    paragraphs = "".join(
+        f"<p>({year}-{month:02d}-{day:02d}) {category} 분야 합성 기사 {index}번의 {n + 1}번째 문단입니다. "
+        + " ".join(f"단어{rng.randrange(5000)}" for _ in range(40)) + "</p>"
+        for n in range(PARAGRAPHS)
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<meta property=\"article:section\" content=\"{category}\">"
+        f"<title>합성 기사 {article_id}</title></head><body>"
+        f"<div id=\"newsUpdateTime01\" data-published-time=\"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}\"></div>"
+        f"<div class=\"story-news article\">{paragraphs}</div>"
+        f"<p class=\"byline\">홍길동{index % 50} 기자</p>"
+        "</body></html>"
+    )
+
+
+# ────────────────────── 서버 ──────────────────────
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive (크롤러의 커넥션 재사용을 그대로 측정)
+
+    def log_message(self, format, *args):   # 요청마다 stderr 로 찍지 않음
+        pass
+
+    def _send(self, status: int, body: str = "", headers: dict = None):
+        data = body.encode("utf-8") if status != 304 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.replay.count(status)
+
+    def do_GET(self):
+        replay = self.server.replay
+        replay.sleep()
+
+        fault = replay.pick_fault()
+        if fault == 429:
+            return self._send(429, "Too Many Requests", {"Retry-After": "1"})
+        if fault == 503:
+            return self._send(503, "Service Unavailable")
+
+        path = self.path.split("?", 1)[0]
+        body = replay.render(path)
+        if body is None:
+            return self._send(404, "Not Found")
+
+        etag = '"' + hashlib.md5(body.encode("utf-8")).hexdigest()[:16] + '"'
+        validators = {"ETag": etag, "Last-Modified": LAST_MODIFIED}
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, headers=validators)
+        self._send(200, body, validators)
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    daemon_threads     = True
+    request_queue_size = 1024   # 기본값 5 면 워커 100개가 동시에 접속할 때 SYN 재전송(1초)이 생김
+
+
+class ReplayServer:
+    """백그라운드 스레드에서 도는 재생 서버. start() 가 base URL 을 돌려줌"""
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = LATENCY_MS, jitter_ms: float = LATENCY_JITTER_MS,
+                 error_rate: float = ERROR_RATE, throttle_rate: float = THROTTLE_RATE,
+                 articles_per_day: int = ARTICLES_PER_DAY, page_size: int = SITEMAP_PAGE_SIZE,
+                 seed: int = 0):
+        self.fixture_dir      = fixture_dir
+        self.host             = host
+        self.port             = port
+        self.latency_ms       = latency_ms
+        self.jitter_ms        = jitter_ms
+        self.error_rate       = error_rate
+        self.throttle_rate    = throttle_rate
+        self.articles_per_day = articles_per_day
+        self.page_size        = page_size
+
+        self.stats   = {}   # HTTP 상태 코드 → 응답 수
+        self._lock   = threading.Lock()
+        self._rng    = random.Random(seed)
+        self._server = None
+        self._thread = None
+
+    # ───────────── 응답 생성 ─────────────
+    def sleep(self):
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        delay = max(0.0, self.latency_ms + jitter) / 1000
+        if delay:
+            time.sleep(delay)
+
+    def pick_fault(self):
+        with self._lock:
+            r = self._rng.random()
+        if r < self.throttle_rate:
+            return 429
+        if r < self.throttle_rate + self.error_rate:
+            return 503
+        return None
+
+    def count(self, status: int):
+        with self._lock:
+            self.stats[status] = self.stats.get(status, 0) + 1
+
+    def _read_fixture(self, path: str):
+        if not self.fixture_dir:
+            return None
+        full = os.path.normpath(os.path.join(self.fixture_dir, path.lstrip("/")))
+        if not full.startswith(os.path.normpath(self.fixture_dir)) or not os.path.isfile(full):
+            return None
+        with open(full, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def render(self, path: str):
+        """요청 경로 → HTML (녹화 파일 우선, 알 수 없는 경로는 None)"""
+        body = self._read_fixture(path)
+        if body is not None:
+            return body
+        if path == "/robots.txt":
+            return DEFAULT_ROBOTS_TXT
+
+        m = _SITEMAP_PATH.match(path)
+        if m:
+            year, month, day, page = map(int, m.groups())
+            if page < 1:
+                return None
+            # 마지막 페이지 뒤의 페이지는 빈 목록으로 응답
+            return synthetic_sitemap_page(year, month, day, page, self.articles_per_day, self.page_size)
+
+        m = _VIEW_PATH.match(path)
+        if m:
+            year, month, day, index = int(m.group(2)), int(m.group(3)), int(m.group(4)), int(m.group(5))
+            article_id = path[len("/view/"):]
+            return synthetic_article_page(article_id, year, month, day, index)
+        return None
+
+    # ───────────── 시작 / 종료 ─────────────
+    def start(self) -> str:
+        self._server = _ReplayHTTPServer((self.host, self.port), _ReplayHandler)
+        self._server.replay = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+
+# ────────────────────── 녹화 ──────────────────────
+def record_day(fixture_dir: str, year: int, month: int, day: int,
+               limit: int = 50, delay: float = 2.0, base_url: str = YNA_BASE_URL) -> int:
+    """실제 사이트의 하루치 사이트맵 1페이지와 기사 limit 개를 fixture_dir 에 경로 그대로 저장"""
+    import requests
+    from html_extract import extract_sitemap_links
+
+    sess = requests.Session()
+    sess.headers.update({"User-Agent": USER_AGENT})
+
+    def save(path: str, text: str):
+        full = os.path.join(fixture_dir, path.lstrip("/"))
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    robots = sess.get(f"{base_url}/robots.txt", timeout=15)
+    if robots.ok:
+        save("/robots.txt", robots.text)
+
+    sitemap_path = f"/sitemap/articles/{year}/{month:02d}/{day:02d}-1.htm"
+    resp = sess.get(base_url + sitemap_path, timeout=15)
+    resp.raise_for_status()
+    save(sitemap_path, resp.text)
+
+    saved = 0
+    for _, href in extract_sitemap_links(resp.text)[:limit]:
+        if not href or "/view/" not in href:
+            continue
+        path = "/view/" + href.split("/view/", 1)[1].split("?", 1)[0]
+        time.sleep(delay)
+        page = sess.get(base_url + path, timeout=15)
+        if page.ok:
+            save(path, page.text)
+            saved += 1
+    return saved
+
+
+# ────────────────────── 실행 스크립트 진입점 ──────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="연합뉴스 사이트맵/기사 재생 서버")
+    sub = parser.add_subparsers(dest="command")
+
+    rec = sub.add_parser("record", help="실제 사이트의 페이지를 fixture 폴더로 녹화")
+    rec.add_argument("--fixtures", required=True)
+    rec.add_argument("--date", required=True, help="YYYY-MM-DD")
+    rec.add_argument("--limit", type=int, default=50)
+    rec.add_argument("--delay", type=float, default=2.0)
+
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=FIXTURE_DIR)
+    parser.add_argument("--latency-ms", type=float, default=LATENCY_MS)
+    parser.add_argument("--jitter-ms", type=float, default=LATENCY_JITTER_MS)
+    parser.add_argument("--error-rate", type=float, default=ERROR_RATE)
+    parser.add_argument("--throttle-rate", type=float, default=THROTTLE_RATE)
+    parser.add_argument("--articles-per-day", type=int, default=ARTICLES_PER_DAY)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        year, month, day = map(int, args.date.split("-"))
+        saved = record_day(args.fixtures, year, month, day, args.limit, args.delay)
+        print(f"녹화 완료: 기사 {saved}건 → {args.fixtures}")
+        return
+
+    server = ReplayServer(args.fixtures, args.host, args.port, args.latency_ms, args.jitter_ms,
+                          args.error_rate, args.throttle_rate, args.articles_per_day)
+    print(f"재생 서버 시작: {server.start()} (Ctrl+C 로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"응답 통계: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+robots.txt 기반 URL 허용 여부 판정기
+-----------------------------------
+● 기존 is_allowed_url 은 DISALLOWED_PATTERNS 의 패턴마다 re.search 를 호출
+  → robots.txt 에 개별 기사 ID 가 수백 개 등록되면 URL 하나당 수백 번 정규식 검사
+● 규칙(Allow / Disallow)을 세 종류로 나눠 URL 한 건을 경로 길이에 비례하는 비용으로 판정
+    1) 개별 기사 ID (/view/AKR20221115124100505 등)  → 경로 앞 26자의 ID 부분으로 해시 조회
+    2) 와일드카드 없는 디렉터리/경로 규칙 (/search/ 등) → 접두사 트라이 탐색
+    3) 나머지 와일드카드 규칙 (/*cp= 등)              → 하나로 합친 정규식
+● 규칙은 robots.txt 파일(또는 URL)에서 읽어 오며, 읽을 수 없으면 기본 규칙 사용
+  (robots.txt 표준에 따라 모든 규칙은 경로 앞부분부터 일치하는 접두사 규칙이고,
+   일치하는 규칙이 여럿이면 가장 긴 규칙을 따름. 그룹은 User-Agent 의 제품 토큰으로 선택)
+"""
+
+import re
+from urllib.parse import urlsplit
+
+import requests
+
+# robots.txt 를 가져올 수 없을 때 쓰는 기본 Disallow 규칙 (robots.txt 문법)
+DEFAULT_DISALLOW_RULES = [
+    "/*cp=",
+    "/view/AEN", "/view/ACK", "/view/AJP", "/view/AAR",
+    "/view/ASP", "/view/AFR",
+    "/hc.html",
+    "/search/", "/search/*query=",
+    "/did/", "/program/", "/web/", "/irclub/", "/changwon/",
+    "/gangwon-do/", "/coronavirus/",
+    "/view/AKR20221115124100505",
+]
+
+# /view/ 뒤에 붙는 완전한 기사 ID (예: AKR20221115124100505, MYH20140829007500038)
+# 정확히 이 길이인 규칙만 해시로 보내고, 더 짧거나 긴 /view/… 규칙은 접두사 트라이에서 처리
+ARTICLE_ID_RULE = re.compile(r"^/view/([A-Z]{3}\d{17})$")
+ARTICLE_ID_RULE_LENGTH = len("/view/AKR20221115124100505")
+VIEW_PREFIX     = "/view/"
+PRODUCT_TOKEN   = re.compile(r"\s*([A-Za-z_-]+)")
+_TERMINAL       = object()   # 트라이에서 규칙 끝을 표시하는 키 (값: Allow 규칙이면 True)
+
+
+def product_token(user_agent: str) -> str:
+    """User-Agent 문자열의 제품 토큰 (소문자, 'Mozilla/5.0 (...) Chrome/120' → 'mozilla')
+
+    robots.txt 의 User-agent 줄은 전체 문자열이 아니라 이 토큰과 비교함
+    """
+    if user_agent.strip() == "*":
+        return "*"
+    m = PRODUCT_TOKEN.match(user_agent)
+    return m.group(1).lower() if m else "*"
+
+
+def parse_robots_txt(text: str, user_agent: str = "*"):
+    """robots.txt 본문에서 user_agent 의 제품 토큰(없으면 '*') 그룹의 (Disallow 목록, Allow 목록) 추출"""
+    groups = {}          # 제품 토큰 → (Disallow 목록, Allow 목록)
+    current_agents = []
+    in_rules = False     # 직전 줄이 규칙이었는지 (새 User-agent 줄이 새 그룹을 여는지 판단)
+
+    for raw in text.splitlines():
+        line = raw.split("#", 1)[0].strip()
+        if not line or ":" not in line:
+            continue
+        field, value = (part.strip() for part in line.split(":", 1))
+        field = field.lower()
+
+        if field == "user-agent":
+            if in_rules:
+                current_agents = []
+                in_rules = False
+            current_agents.append(product_token(value))
+            for agent in current_agents:
+                groups.setdefault(agent, ([], []))
+        elif field in ("disallow", "allow"):
+            in_rules = True
+            if value:   # 빈 Disallow 는 '모두 허용', 빈 Allow 는 의미 없음
+                for agent in current_agents:
+                    groups[agent][field == "allow"].append(value)
+
+    agent = product_token(user_agent)
+    if agent in groups:
+        return groups[agent]
+    return groups.get("*", ([], []))
+
+
+class UrlPolicy:
+    """Allow / Disallow 규칙을 ID 사전 / 접두사 트라이 / 결합 정규식으로 컴파일한 판정기
+
+    robots.txt 표준(RFC 9309)처럼 경로에 일치하는 규칙 중 가장 긴 규칙을 따르고,
+    길이가 같으면 Allow 가 우선. 일치하는 규칙이 없으면 허용
+    """
+
+    def __init__(self, rules, allow_rules=()):
+        self.article_ids = {}    # 기사 ID → Allow 규칙이면 True
+        self.prefix_trie = {}
+        wildcard_rules = []
+
+        for allowed, rule in [(False, r) for r in rules] + [(True, r) for r in allow_rules]:
+            rule = rule.strip()
+            if not rule:
+                continue
+            m = ARTICLE_ID_RULE.match(rule)
+            if m:
+                self.article_ids[m.group(1)] = self.article_ids.get(m.group(1), False) or allowed
+            elif "*" in rule or rule.endswith("$"):
+                wildcard_rules.append((len(rule), allowed, rule))
+            else:
+                self._add_prefix(rule, allowed)
+
+        # 정규식은 앞쪽 대안부터 시도하므로 긴 규칙(같은 길이면 Allow)을 앞에 두면
+        # 처음 일치한 대안이 곧 가장 긴 규칙 → m.lastindex 로 어느 규칙인지 확인
+        wildcard_rules.sort(key=lambda r: (-r[0], not r[1]))
+        self.allow_count = len(allow_rules)
+        self.wildcard_count = len(wildcard_rules)
+        self.wildcard_rules = [(length, allowed) for length, allowed, _ in wildcard_rules]
+        self.wildcard_regex = None
+        if wildcard_rules:
+            self.wildcard_regex = re.compile("|".join(
+                f"({self._wildcard_to_regex(r)})" for _, _, r in wildcard_rules
+            ))
+
+    # ───────────── 생성 헬퍼 ─────────────
+    @classmethod
+    def from_robots_txt(cls, text: str, user_agent: str = "*"):
+        return cls(*parse_robots_txt(text, user_agent))
+
+    @classmethod
+    def from_file(cls, path: str, user_agent: str = "*"):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_robots_txt(f.read(), user_agent)
+
+    @classmethod
+    def from_url(cls, robots_url: str, user_agent: str = "*", timeout: int = 15):
+        resp = requests.get(robots_url, headers={"User-Agent": user_agent}, timeout=timeout)
+        resp.raise_for_status()
+        return cls.from_robots_txt(resp.text, user_agent)
+
+    @classmethod
+    def load(cls, robots_file: str = None, robots_url: str = None, user_agent: str = "*"):
+        """파일 → URL → DEFAULT_DISALLOW_RULES 순서로 규칙을 읽어 판정기 생성"""
+        if robots_file:
+            try:
+                return cls.from_file(robots_file, user_agent)
+            except OSError as e:
+                print(f"[robots] 파일을 읽을 수 없습니다: {robots_file} → {e}")
+        if robots_url:
+            try:
+                return cls.from_url(robots_url, user_agent)
+            except requests.exceptions.RequestException as e:
+                print(f"[robots] 가져오기 실패: {robots_url} → {e}")
+        print("[robots] 기본 Disallow 규칙을 사용합니다.")
+        return cls(DEFAULT_DISALLOW_RULES)
+
+    def _add_prefix(self, rule: str, allowed: bool):
+        node = self.prefix_trie
+        for ch in rule:
+            node = node.setdefault(ch, {})
+        node[_TERMINAL] = node.get(_TERMINAL, False) or allowed
+
+    @staticmethod
+    def _wildcard_to_regex(rule: str) -> str:
+        anchored = rule.endswith("$")
+        body = rule[:-1] if anchored else rule
+        pattern = ".*".join(re.escape(part) for part in body.split("*"))
+        return pattern + ("$" if anchored else "")
+
+    # ───────────── 판정 ─────────────
+    def _match_prefix(self, path: str):
+        """경로에 일치하는 가장 긴 접두사 규칙의 (길이, Allow 여부) (없으면 None)"""
+        node, best = self.prefix_trie, None
+        for depth, ch in enumerate(path, 1):
+            node = node.get(ch)
+            if node is None:
+                break
+            allowed = node.get(_TERMINAL)
+            if allowed is not None:
+                best = (depth, allowed)
+        return best
+
+    def is_allowed_path(self, path: str) -> bool:
+        """경로(+쿼리 문자열)에 일치하는 가장 긴 규칙이 Allow 이거나 일치하는 규칙이 없으면 True"""
+        best = (0, True)   # (규칙 길이, Allow 여부) → max 로 비교하면 같은 길이에서 Allow 가 이김
+        if self.article_ids and path.startswith(VIEW_PREFIX):
+            # 기사 ID 규칙도 접두사 규칙 → 규칙 길이만큼만 잘라 조회 (/view/ID.html, /view/ID?… 도 일치)
+            allowed = self.article_ids.get(path[len(VIEW_PREFIX):ARTICLE_ID_RULE_LENGTH])
+            if allowed is not None:
+                best = max(best, (ARTICLE_ID_RULE_LENGTH, allowed))
+        prefix = self._match_prefix(path)
+        if prefix is not None:
+            best = max(best, prefix)
+        if self.wildcard_regex is not None:
+            m = self.wildcard_regex.match(path)
+            if m is not None:
+                best = max(best, self.wildcard_rules[m.lastindex - 1])
+        return best[1]
+
+    def is_allowed(self, url: str) -> bool:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return self.is_allowed_path(path)
+
+    def __repr__(self):
+        return (f"UrlPolicy(ids={len(self.article_ids)}, "
+                f"wildcards={self.wildcard_count}, allow={self.allow_count})")
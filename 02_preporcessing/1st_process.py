@@ -1,6 +1,14 @@
 import pymongo
 import datetime
 import re
+from collections import Counter
+
+from keyword_matcher import KEYWORDS, NK_CATEGORY, KeywordMatcher
+from mongo_io import (
+    WRITE_BATCH_SIZE, ensure_article_index, merge_counts, print_worker_report, run_partitioned,
+    stamp_updated_at,
+)
+from watermark import Watermark
 
 # --- MongoDB 연결 설정 ---
 MONGO_URI = "mongodb://localhost:27017/" # MongoDB 서버 주소 (필요시 수정)
@@ -8,24 +16,19 @@ DB_NAME = "polaris"                      # 데이터베이스 이름
 SOURCE_COLLECTION_NAME = "yna"           # 원본 컬렉션 이름
 DESTINATION_COLLECTION_NAME = "yna_preprocessed_v1" # 전처리된 데이터를 저장할 새로운 컬렉션 이름 (이름을 바꿔주세요!)
 
-# --- 검색 키워드 정의 ---
-# 이 키워드들을 포함하는 문서만 전처리 대상으로 삼습니다.
-keyword_string = """
-북한, 김정은, 김여정, 조선중앙통신, 조선인민군, 오물풍선, 남북, 남측, 북측, 평양, 대북, 대남, 군사합의, 비무장지대, 이산가족, 장마당, 
-통일부, 장거리 미사일, ICBM, SLBM, NLL, 휴전선
-김주애, 리설주, 최룡해, 장성택, 김정남, 최선희, 김일성, 현송월, 김영철, 
-광명성절, 김정일, 6.25, 방사포, 판문점, JSA, 러시아, 특수부대, 남파공작원, 정찰총국, 
-군사, 탈북, 조선, 인민, 주석궁, 동창리, 나진항, 선봉, 北, 당대회, 금수산태양궁전, 
-김일성종합대학, 김책공업대학, 주체사상, 금강산, 개성공단, 
-북핵, 북중, 북러, 로동신문, DPRK, 조선로동당 중앙위원회
-"""
-
-# --- 키워드 파싱 ---
-keywords = [
-    word.strip()
-    for word in re.split(r'[, \n]+', keyword_string) 
-    if word.strip()
-]
+# --- 필터링 방식 ---
+# "stream" : 원본을 한 번 읽으며 Aho–Corasick 오토마톤으로 모든 키워드를 동시에 검사 (keyword_matcher.py)
+#            걸린 키워드는 문서의 matched_keywords 필드에 기록하고, 키워드별 적중 수를 출력
+# "regex"  : 기존 방식 (키워드마다 title/content $regex 를 $or 로 묶어 서버에서 검사)
+FILTER_MODE = "stream"
+STREAM_WORKERS = 4      # stream 모드에서 _id 범위를 나눠 동시에 처리할 프로세스 수 (1 이면 단일 커서)
+BATCH_SIZE = 1000       # regex 모드 insert_many 배치 크기
+STREAM_BATCH_SIZE = WRITE_BATCH_SIZE  # stream 모드 unordered bulk_write 배치 크기
+STREAM_FIELDS = None    # stream 모드에서 읽어 기록할 필드 (None 이면 원본 문서 전체, mongo_io.READ_FIELDS 로 줄일 수 있지만 나머지 필드는 v1 에 남지 않음)
+INCREMENTAL = True      # stream 모드: 워터마크 이후 문서만 처리하고 기사 id 기준 upsert (regex 모드는 항상 전체 insert)
+
+# --- 검색 키워드 (keyword_matcher.KEYWORD_STRING 에서 관리) ---
+keywords = KEYWORDS
 
 # --- 1차 전처리 함수 (여기를 수정하여 원하는 전처리 로직을 구현하세요!) ---
 def preprocess_document(doc):
@@ -33,63 +36,120 @@ def preprocess_document(doc):
     원본 문서를 받아서 1차 전처리를 수행하고, 전처리된 새 문서 객체를 반환합니다.
     이 함수는 이미 필터링된 문서에 대해서만 호출됩니다.
     """
-    processed_doc = doc.copy() 
+    processed_doc = doc.copy()
 
     # --- 중요: _id 필드 처리 (새 컬렉션에 새 _id를 부여받기 위해 원본 _id 제거) ---
     if '_id' in processed_doc:
-        del processed_doc['_id'] 
+        del processed_doc['_id']
 
     return processed_doc
 
-# --- MongoDB 연결 및 전처리 실행 ---
-client = None
-try:
-    client = pymongo.MongoClient(MONGO_URI)
-    db = client[DB_NAME]
-    source_collection = db[SOURCE_COLLECTION_NAME]
-    destination_collection = db[DESTINATION_COLLECTION_NAME]
-
-    print(f"MongoDB에 연결되었습니다. '{SOURCE_COLLECTION_NAME}' -> '{DESTINATION_COLLECTION_NAME}' 전처리를 시작합니다...")
-
-    # --- 필터링 조건 동적 생성 ---
+# --- 기존 방식: 서버측 $regex $or 필터 ---
+def build_regex_filter_query():
     filter_conditions = []
-    filter_conditions.append({"category": "북한"}) # 카테고리가 '북한'인 문서
+    filter_conditions.append({"category": NK_CATEGORY}) # 카테고리가 '북한'인 문서
 
     for kw in keywords:
         filter_conditions.append({"title": {"$regex": re.compile(kw, re.IGNORECASE)}}) # 제목에 키워드 포함
         filter_conditions.append({"content": {"$regex": re.compile(kw, re.IGNORECASE)}}) # 내용에 키워드 포함
 
     # 최종 쿼리 필터 (OR 조건)
-    filter_query = {"$or": filter_conditions}
+    return {"$or": filter_conditions}
 
-    batch_size = 1000 
+def run_regex_filter(source_collection, destination_collection):
     processed_docs_batch = []
     processed_count = 0
 
     # --- 필터링 조건을 적용하여 문서 조회 ---
-    cursor = source_collection.find(filter_query).sort('_id', 1) 
+    cursor = source_collection.find(build_regex_filter_query()).sort('_id', 1)
 
     for doc in cursor:
         processed_doc = preprocess_document(doc)
         processed_docs_batch.append(processed_doc)
 
-        if len(processed_docs_batch) >= batch_size:
-            destination_collection.insert_many(processed_docs_batch)
+        if len(processed_docs_batch) >= BATCH_SIZE:
+            destination_collection.insert_many(stamp_updated_at(processed_docs_batch))
             processed_count += len(processed_docs_batch)
             processed_docs_batch = []
             print(f"{processed_count}개 문서 전처리 및 삽입 완료...")
 
     if processed_docs_batch:
-        destination_collection.insert_many(processed_docs_batch)
+        destination_collection.insert_many(stamp_updated_at(processed_docs_batch))
         processed_count += len(processed_docs_batch)
+    return processed_count
 
-    print(f"\n--- 전체 {processed_count}개 문서 전처리 및 '{DESTINATION_COLLECTION_NAME}'에 삽입 완료 ---")
+# --- stream 방식: 한 번 읽으며 오토마톤으로 검사 ---
+class KeywordTransform:
+    """워커 프로세스 안에서 문서마다 키워드를 검사하는 변환기 (mongo_io.run_partitioned 의 make_transform)"""
 
-except pymongo.errors.ConnectionFailure as e:
-    print(f"MongoDB 연결 오류: {e}")
-except Exception as e:
-    print(f"전처리 및 삽입 중 오류 발생: {e}")
-finally:
-    if client:
-        client.close()
-        print("MongoDB 연결을 닫았습니다.")
\ No newline at end of file
+    def __init__(self):
+        self.matcher = KeywordMatcher(keywords)
+        self.counts = {"keyword_hits": Counter()}
+
+    def __call__(self, doc):
+        matched = self.matcher.match_document(doc)
+        if not self.matcher.is_relevant(doc, matched):
+            return None
+        self.counts["keyword_hits"].update(matched)
+
+        processed_doc = preprocess_document(doc)
+        processed_doc["matched_keywords"] = matched
+        return processed_doc
+
+def run_stream_filter(db, source_collection, destination_collection):
+    # 증분 모드: 워터마크 이후 문서만 대상, 시작 시점의 마지막 _id 까지 처리하면 워터마크 전진
+    watermark = Watermark(db, "1st_process", SOURCE_COLLECTION_NAME)
+    scope = {}
+    if INCREMENTAL:
+        print(f"증분 모드: {watermark}")
+        ensure_article_index(destination_collection)
+        scope = watermark.query()
+        if not watermark.observe_latest(source_collection, scope):
+            print("새로 들어온 문서가 없습니다.")
+            return 0
+
+    print(f"{KeywordMatcher(keywords)} 로 최대 {STREAM_WORKERS}개 _id 구간을 검사합니다.")
+    stats = run_partitioned(MONGO_URI, DB_NAME, SOURCE_COLLECTION_NAME, DESTINATION_COLLECTION_NAME,
+                            KeywordTransform, workers=STREAM_WORKERS, query=scope, field="_id",
+                            fields=STREAM_FIELDS, batch_size=STREAM_BATCH_SIZE, upsert=INCREMENTAL)
+
+    scanned = sum(s["scanned"] for s in stats)
+    processed_count = sum(s["written"] for s in stats)
+    keyword_hits = Counter(merge_counts(stats).get("keyword_hits", {}))
+
+    print_worker_report(stats)
+    print(f"\n검사한 문서: {scanned}개 (제외된 문서: {scanned - processed_count})")
+    print("--- 키워드별 적중 문서 수 ---")
+    for kw, hits in keyword_hits.most_common():
+        print(f"{kw}: {hits}")
+
+    if INCREMENTAL:
+        watermark.commit(processed_count)
+    return processed_count
+
+# --- MongoDB 연결 및 전처리 실행 ---
+if __name__ == "__main__":
+    client = None
+    try:
+        client = pymongo.MongoClient(MONGO_URI)
+        db = client[DB_NAME]
+        source_collection = db[SOURCE_COLLECTION_NAME]
+        destination_collection = db[DESTINATION_COLLECTION_NAME]
+
+        print(f"MongoDB에 연결되었습니다. '{SOURCE_COLLECTION_NAME}' -> '{DESTINATION_COLLECTION_NAME}' 전처리를 시작합니다... (필터: {FILTER_MODE})")
+
+        if FILTER_MODE == "regex":
+            processed_count = run_regex_filter(source_collection, destination_collection)
+        else:
+            processed_count = run_stream_filter(db, source_collection, destination_collection)
+
+        print(f"\n--- 전체 {processed_count}개 문서 전처리 및 '{DESTINATION_COLLECTION_NAME}'에 삽입 완료 ---")
+
+    except pymongo.errors.ConnectionFailure as e:
+        print(f"MongoDB 연결 오류: {e}")
+    except Exception as e:
+        print(f"전처리 및 삽입 중 오류 발생: {e}")
+    finally:
+        if client:
+            client.close()
+            print("MongoDB 연결을 닫았습니다.")
@@ -1,19 +1,18 @@
 import pymongo
 import re
 
+from stage_config import MIN_CONTENT_BYTES, is_content_long_enough
+from mongo_io import UPDATED_KEY, ensure_article_index, stamp_updated_at, upsert_by_article_id
+from watermark import Watermark
+
 # --- MongoDB 연결 설정 ---
 MONGO_URI = "mongodb://localhost:27017/"
 DB_NAME = "polaris"
 SOURCE_COLLECTION_NAME = "yna_preprocessed_v1"  # 1차 전처리된 기사 컬렉션
 DESTINATION_COLLECTION_NAME = "yna_preprocessed_v2"  # 본문 길이 기준 필터링된 컬렉션
+INCREMENTAL = True  # 워터마크 이후 문서만 처리하고 기사 id 기준 upsert (False 면 전체 insert)
 
-# --- 길이 기준 설정 ---
-MIN_CONTENT_BYTES = 500  # 바이트 기준 최소 길이 (조정 가능)
-
-# --- 본문 길이 필터링 함수 ---
-def is_content_long_enough(doc):
-    content = doc.get("content", "")
-    return len(content.encode("utf-8")) >= MIN_CONTENT_BYTES
+# --- 길이 기준 (MIN_CONTENT_BYTES, is_content_long_enough) 은 stage_config.py 에서 관리 ---
 
 # --- MongoDB 연결 및 필터링 실행 ---
 client = None
@@ -25,14 +24,32 @@ try:
 
     print(f"MongoDB에 연결되었습니다. '{SOURCE_COLLECTION_NAME}' -> '{DESTINATION_COLLECTION_NAME}' 본문 길이 필터링을 시작합니다...")
 
-    cursor = source_collection.find().sort('_id', 1)
+    # 증분 모드: 1차 결과는 기사 id 기준 upsert 라 갱신된 기사도 _id 가 그대로
+    # → _id 대신 기록 시각(UPDATED_KEY)이 워터마크 이후인 문서를 그 순서대로 읽음
+    watermark = Watermark(db, "2nd_process", SOURCE_COLLECTION_NAME, field=UPDATED_KEY)
+    if INCREMENTAL:
+        print(f"증분 모드: {watermark}")
+        ensure_article_index(destination_collection)
+        source_collection.create_index(UPDATED_KEY)
+        query = watermark.query()
+        cursor = source_collection.find(query).sort(UPDATED_KEY, 1)
+    else:
+        query = {}
+        cursor = source_collection.find(query).sort('_id', 1)
 
     batch_size = 1000
     processed_docs_batch = []
     processed_count = 0
     skipped_count = 0
 
+    def write(batch):
+        if INCREMENTAL:
+            upsert_by_article_id(destination_collection, batch)
+        else:
+            destination_collection.insert_many(stamp_updated_at(batch))
+
     for doc in cursor:
+        watermark.observe(doc)
         if is_content_long_enough(doc):
             doc_copy = doc.copy()
             if '_id' in doc_copy:
@@ -42,15 +59,18 @@ try:
             skipped_count += 1
 
         if len(processed_docs_batch) >= batch_size:
-            destination_collection.insert_many(processed_docs_batch)
+            write(processed_docs_batch)
             processed_count += len(processed_docs_batch)
             processed_docs_batch = []
             print(f"{processed_count}개 문서 삽입 완료...")
 
     if processed_docs_batch:
-        destination_collection.insert_many(processed_docs_batch)
+        write(processed_docs_batch)
         processed_count += len(processed_docs_batch)
 
+    if INCREMENTAL:
+        watermark.commit(processed_count)
+
     print(f"\n--- 전체 {processed_count}개 문서 삽입 완료 (제외된 문서: {skipped_count}) ---")
 
 except pymongo.errors.ConnectionFailure as e:
@@ -1,28 +1,18 @@
 import pymongo
 import re
 
+from stage_config import EXCLUDE_TITLE_PATTERN, exclude_title_regex
+from mongo_io import UPDATED_KEY, ensure_article_index, stamp_updated_at, upsert_by_article_id
+from watermark import Watermark
+
 # --- MongoDB 연결 설정 ---
 MONGO_URI = "mongodb://localhost:27017/"
 DB_NAME = "polaris"
 SOURCE_COLLECTION_NAME = "yna_preprocessed_v2" # 본문 길이 기준 필터링된 컬렉션
 DESTINATION_COLLECTION_NAME = "yna_preprocessed_v3" # 제목 기준 필터링된 최종 컬렉션
+INCREMENTAL = True # 워터마크 이후 문서만 처리하고 기사 id 기준 upsert (False 면 전체 insert)
 
-# --- 필터링할 제목 키워드 리스트 ---
-EXCLUDE_TITLE_KEYWORDS = [
-    re.escape('[이시각헤드라인]'),
-    re.escape('[뉴스초점]'),
-    re.escape('[뉴스리뷰]'),
-    re.escape('[라이브투데이]'),
-    re.escape('[현장연결]'),
-    re.escape('[씬속뉴스]'),
-    re.escape('[1번지이슈]'),
-    re.escape('[주요 신문 사설]'),
-    re.escape('[연합시론]')
-]
-
-# 키워드들을 OR 조건으로 합쳐 하나의 정규표현식 패턴 생성
-EXCLUDE_TITLE_PATTERN = '|'.join(EXCLUDE_TITLE_KEYWORDS)
-exclude_title_regex = re.compile(EXCLUDE_TITLE_PATTERN)
+# --- 필터링할 제목 키워드 (EXCLUDE_TITLE_PATTERN) 는 stage_config.py 에서 관리 ---
 
 # --- MongoDB 연결 및 필터링 실행 ---
 client = None
@@ -34,6 +24,7 @@ try:
     
     # yna_preprocessed_v3 컬렉션이 이미 존재하면 삭제하고 시작 (선택 사항)
     # destination_collection.drop()
+    # → INCREMENTAL 모드에서는 기사 id 기준 upsert 라 삭제하지 않아도 중복이 생기지 않음
 
     print(f"MongoDB에 연결되었습니다. '{SOURCE_COLLECTION_NAME}' -> '{DESTINATION_COLLECTION_NAME}' 필터링 및 정렬을 시작합니다...")
 
@@ -41,6 +32,19 @@ try:
     query = {
         "title": { "$not": { "$regex": EXCLUDE_TITLE_PATTERN } }
     }
+
+    # 증분 모드: 워터마크 이후 문서만 대상. 2차 결과는 기사 id 기준 upsert 라 _id 가 유지되므로
+    # 기록 시각(UPDATED_KEY) 기준으로 고름. 제외되는 문서는 커서로 오지 않으므로
+    # 시작 시점의 마지막 기록 시각을 미리 기록해 두고 끝나면 그 위치까지 워터마크 전진
+    watermark = Watermark(db, "3rd_process", SOURCE_COLLECTION_NAME, field=UPDATED_KEY)
+    scope = {}
+    if INCREMENTAL:
+        print(f"증분 모드: {watermark}")
+        ensure_article_index(destination_collection)
+        source_collection.create_index(UPDATED_KEY)
+        scope = watermark.query()
+        query = {"$and": [scope, query]} if scope else query
+        watermark.observe_latest(source_collection, scope)
     
     # 쿼리를 사용하여 필터링하고, pubDate 필드를 기준으로 오름차순(1) 정렬하여 커서 생성
     # 오래된 기사가 먼저 오도록 정렬
@@ -55,6 +59,12 @@ try:
     batch_size = 1000
     inserted_count = 0
 
+    def write(batch):
+        if INCREMENTAL:
+            upsert_by_article_id(destination_collection, batch)
+        else:
+            destination_collection.insert_many(stamp_updated_at(batch))
+
     for doc in cursor:
         doc_copy = doc.copy()
         if '_id' in doc_copy:
@@ -62,18 +72,21 @@ try:
         processed_docs.append(doc_copy)
 
         if len(processed_docs) >= batch_size:
-            destination_collection.insert_many(processed_docs)
+            write(processed_docs)
             inserted_count += len(processed_docs)
             print(f"{inserted_count}개 문서 삽입 완료...")
             processed_docs = []
 
     # 남은 문서 삽입
     if processed_docs:
-        destination_collection.insert_many(processed_docs)
+        write(processed_docs)
         inserted_count += len(processed_docs)
+
+    if INCREMENTAL:
+        watermark.commit(inserted_count)
     
     # 필터링으로 제외된 문서 수 계산
-    skipped_count = source_collection.count_documents({}) - inserted_count
+    skipped_count = source_collection.count_documents(scope) - inserted_count
     
     print(f"\n--- 전체 {inserted_count}개 문서 삽입 완료 (제외된 문서: {skipped_count}) ---")
 
@@ -0,0 +1,142 @@
+"""
+북한 관련 키워드 다중 매칭기 (Aho–Corasick)
+------------------------------------------
+● 1st_process.py 는 키워드마다 title / content 에 대소문자 무시 $regex 조건을 만들어
+  {"$or": [...]} 로 보냄 → MongoDB 가 문서 하나에 정규식을 최대 120번 평가하며 전체 스캔
+● 키워드 전체를 오토마톤 하나로 만들어 문서를 한 번 훑으면 모든 키워드를 동시에 찾음
+    - 겹치는 키워드도 모두 찾음 (예: "조선중앙통신" 안의 "조선")
+    - 문서마다 어떤 키워드가 걸렸는지 알 수 있어 키워드별 적중 통계를 낼 수 있음
+● pyahocorasick(C 구현)이 설치되어 있으면 사용하고, 없으면 같은 동작의 순수 파이썬 구현 사용
+● 대소문자 무시는 키워드와 본문을 모두 소문자로 바꿔서 처리 (ICBM, DPRK 등)
+  기존 $regex 와 달리 키워드는 문자 그대로 비교 ("6.25" 의 "." 은 임의 문자가 아님)
+"""
+
+import re
+
+try:
+    import ahocorasick as _pyahocorasick
+except ImportError:  # pip install pyahocorasick
+    _pyahocorasick = None
+
+# --- 검색 키워드 정의 ---
+# 이 키워드들을 포함하는 문서만 전처리 대상으로 삼습니다.
+KEYWORD_STRING = """
+북한, 김정은, 김여정, 조선중앙통신, 조선인민군, 오물풍선, 남북, 남측, 북측, 평양, 대북, 대남, 군사합의, 비무장지대, 이산가족, 장마당,
+통일부, 장거리 미사일, ICBM, SLBM, NLL, 휴전선
+김주애, 리설주, 최룡해, 장성택, 김정남, 최선희, 김일성, 현송월, 김영철,
+광명성절, 김정일, 6.25, 방사포, 판문점, JSA, 러시아, 특수부대, 남파공작원, 정찰총국,
+군사, 탈북, 조선, 인민, 주석궁, 동창리, 나진항, 선봉, 北, 당대회, 금수산태양궁전,
+김일성종합대학, 김책공업대학, 주체사상, 금강산, 개성공단,
+북핵, 북중, 북러, 로동신문, DPRK, 조선로동당 중앙위원회
+"""
+
+NK_CATEGORY = "북한"   # 이 카테고리 문서는 키워드와 무관하게 대상
+
+
+def parse_keywords(keyword_string: str = KEYWORD_STRING) -> list:
+    """쉼표·공백·줄바꿈으로 구분된 키워드 문자열 → 키워드 목록 (1st_process.py 와 같은 규칙)"""
+    return [
+        word.strip()
+        for word in re.split(r'[, \n]+', keyword_string)
+        if word.strip()
+    ]
+
+
+KEYWORDS = parse_keywords()
+
+
+class KeywordMatcher:
+    """키워드 목록을 Aho–Corasick 오토마톤으로 컴파일해 텍스트 한 번 순회로 모두 찾는 매칭기"""
+
+    def __init__(self, keywords=None, backend: str = "auto"):
+        keywords = KEYWORDS if keywords is None else keywords
+        # 소문자 키 → 원래 표기 (같은 키가 여러 번 나오면 처음 것 사용)
+        self.keywords = {}
+        for kw in keywords:
+            self.keywords.setdefault(kw.lower(), kw)
+
+        if backend == "auto":
+            backend = "pyahocorasick" if _pyahocorasick is not None else "python"
+        if backend == "pyahocorasick" and _pyahocorasick is None:
+            raise ImportError("pyahocorasick 백엔드를 사용하려면 pyahocorasick 패키지가 필요합니다.")
+        if backend not in ("pyahocorasick", "python"):
+            raise ValueError(f"지원하지 않는 매칭 백엔드: {backend}")
+        self.backend = backend
+
+        if backend == "pyahocorasick":
+            self._automaton = _pyahocorasick.Automaton()
+            for key, original in self.keywords.items():
+                self._automaton.add_word(key, original)
+            self._automaton.make_automaton()
+        else:
+            self._build(list(self.keywords.items()))
+
+    # ───────────── 순수 파이썬 오토마톤 ─────────────
+    def _build(self, items):
+        goto = [{}]      # 상태 → {문자: 다음 상태}
+        out  = [()]      # 상태 → 이 상태에서 끝나는 키워드들 (실패 링크로 이어진 것 포함)
+        for key, original in items:
+            state = 0
+            for ch in key:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = out[state] + (original,)
+
+        # BFS 로 실패 링크 계산
+        fail  = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def _find_python(self, text: str) -> set:
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    # ───────────── 공개 API ─────────────
+    def find(self, text) -> set:
+        """텍스트에 들어 있는 키워드(원래 표기)의 집합"""
+        if not text:
+            return set()
+        text = text.lower()
+        if self.backend == "pyahocorasick":
+            return {original for _, original in self._automaton.iter(text)}
+        return self._find_python(text)
+
+    def match_document(self, doc: dict, fields=("title", "content")) -> list:
+        """문서의 여러 필드에서 찾은 키워드 목록 (KEYWORDS 순서)"""
+        found = set()
+        for field in fields:
+            value = doc.get(field)
+            if isinstance(value, str):
+                found |= self.find(value)
+        return [kw for kw in self.keywords.values() if kw in found]
+
+    def is_relevant(self, doc: dict, matched=None) -> bool:
+        """카테고리가 '북한'이거나 키워드가 하나라도 있으면 True"""
+        if doc.get("category") == NK_CATEGORY:
+            return True
+        return bool(self.match_document(doc) if matched is None else matched)
+
+    def __repr__(self):
+        return f"KeywordMatcher(keywords={len(self.keywords)}, backend={self.backend})"
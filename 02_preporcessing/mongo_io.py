@@ -0,0 +1,269 @@
+"""
+전처리 스크립트 공용 MongoDB 입출력 도구
+--------------------------------------
+● 범위 분할: 컬렉션을 _id 또는 pubDate 기준으로 문서 수가 비슷한 [lo, hi) 구간으로 나눠
+  프로세스별로 따로 읽기 ($bucketAuto 로 경계값만 구하므로 문서 본문은 읽지 않음)
+● 프로젝션: 기본은 문서 전체를 읽고 그대로 기록 (기존 스크립트처럼 기자명·매체명 등 모든 필드 유지)
+  → fields=READ_FIELDS 를 넘기면 그 필드만 전송하지만 결과 컬렉션에도 그 필드만 남으므로
+    나머지 필드가 필요 없을 때만 사용
+● 기록: 순서 없는(unordered) bulk_write 를 WRITE_BATCH_SIZE 단위로 보냄
+  → 한 배치 안의 문서를 서버가 병렬로 처리하고, 한 건이 실패해도 나머지는 기록
+● 기사 id 기준 upsert: 같은 기사를 다시 처리해도 결과 컬렉션에 중복이 생기지 않음 (증분 모드)
+● 기록하는 문서마다 UPDATED_KEY(기록 시각)를 찍음 → upsert 는 기존 _id 를 유지하므로
+  다음 단계의 워터마크는 _id 가 아니라 이 값으로 갱신·재크롤링된 기사까지 찾음
+● run_partitioned: 구간마다 워커 프로세스가 읽기 → 변환 → 기록을 하고 워커별 docs/s 를 보고
+  (GCP Mongo 인스턴스에 맞춰 워커 수·배치 크기를 정할 때 사용)
+"""
+
+import time
+from datetime import datetime, timezone
+from multiprocessing import Pool
+
+import pymongo
+from pymongo import InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError
+
+ARTICLE_KEY = "id"   # 크롤러가 기록한 기사 ID (AKR...)
+UPDATED_KEY = "updated_at"   # 결과 문서를 마지막으로 기록한 시각 (UTC, 다음 단계 워터마크 기준)
+
+# 전처리 이후 단계(요약·지오코딩·이벤트 키워드)가 실제로 쓰는 필드 (fields 로 넘길 때만 프로젝션)
+READ_FIELDS = ("id", "url", "title", "content", "category", "pubDate", "crawled_at", "matched_keywords")
+WRITE_BATCH_SIZE = 5000
+WRITE_ERROR_LOG_LIMIT = 5   # 배치마다 출력할 기록 실패 수
+
+
+def projection(fields=None) -> dict:
+    """find 에 넘길 프로젝션 (fields 가 None 이면 전체 필드)"""
+    if fields is None:
+        return None
+    return {field: 1 for field in fields}
+
+
+# ────────────────────── 범위 분할 ──────────────────────
+def split_id_ranges(collection, parts: int, query: dict = None, field: str = "_id") -> list:
+    """field 기준으로 문서 수가 비슷한 parts 개의 (lo, hi) 구간. lo/hi 가 None 이면 끝까지"""
+    if parts <= 1:
+        return [(None, None)]
+    pipeline = []
+    if query:
+        pipeline.append({"$match": query})
+    pipeline.append({"$bucketAuto": {"groupBy": f"${field}", "buckets": parts}})
+    buckets = list(collection.aggregate(pipeline, allowDiskUse=True))
+    if len(buckets) <= 1:
+        return [(None, None)]
+
+    # 각 버킷의 최솟값이 다음 구간의 시작 (마지막 구간은 끝까지)
+    edges = [None] + [b["_id"]["min"] for b in buckets[1:]] + [None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def id_range_query(lo=None, hi=None, query: dict = None, field: str = "_id") -> dict:
+    """(lo, hi) 구간 조건을 기존 쿼리에 덧붙인 쿼리"""
+    cond = {}
+    if lo is not None:
+        cond["$gte"] = lo
+    if hi is not None:
+        if lo is None and field != "_id":
+            # 첫 구간은 값이 없거나(null) 타입이 다른 문서까지 포함
+            cond = {"$not": {"$gte": hi}}
+        else:
+            cond["$lt"] = hi
+    if not cond:
+        return dict(query or {})
+    if query:
+        return {"$and": [query, {field: cond}]}
+    return {field: cond}
+
+
+# ────────────────────── 기록 ──────────────────────
+def ensure_article_index(collection):
+    """upsert 조회용 기사 id 인덱스 (기존 중복 때문에 unique 를 못 만들면 일반 인덱스)
+    + 다음 단계가 워터마크로 읽을 UPDATED_KEY 인덱스"""
+    try:
+        collection.create_index(ARTICLE_KEY, unique=True, sparse=True)
+    except pymongo.errors.OperationFailure as e:
+        print(f"'{collection.name}' 에 중복 {ARTICLE_KEY} 가 있어 unique 인덱스 대신 일반 인덱스를 만듭니다. ({e})")
+        collection.create_index(ARTICLE_KEY)
+    collection.create_index(UPDATED_KEY)
+
+
+def stamp_updated_at(docs: list) -> list:
+    """배치의 모든 문서에 같은 기록 시각(UPDATED_KEY)을 찍어 그대로 돌려줌"""
+    now = datetime.now(timezone.utc)
+    for doc in docs:
+        doc[UPDATED_KEY] = now
+    return docs
+
+
+def _write_ops(docs: list, upsert: bool) -> list:
+    stamp_updated_at(docs)
+    if not upsert:
+        return [InsertOne(doc) for doc in docs]
+    return [ReplaceOne({ARTICLE_KEY: doc[ARTICLE_KEY]}, doc, upsert=True) if doc.get(ARTICLE_KEY)
+            else InsertOne(doc)
+            for doc in docs]
+
+
+def _bulk_write(collection, ops: list):
+    """unordered bulk_write → (서버가 확인한 기록 수, 실패한 쓰기 수)
+
+    일부 문서가 실패(중복 키·문서 크기 초과 등)하면 BulkWriteError 가 나지만 나머지는 이미 기록됨
+    → 예외의 details 에서 실제로 기록된 수를 세고 실패한 쓰기는 알려 준 뒤 계속
+    """
+    try:
+        result = collection.bulk_write(ops, ordered=False)
+    except BulkWriteError as e:
+        details = e.details
+        errors = details.get("writeErrors", [])
+        for err in errors[:WRITE_ERROR_LOG_LIMIT]:
+            print(f"'{collection.name}' 기록 실패 (index {err.get('index')}, code {err.get('code')}): {err.get('errmsg')}")
+        if len(errors) > WRITE_ERROR_LOG_LIMIT:
+            print(f"'{collection.name}' 기록 실패 {len(errors) - WRITE_ERROR_LOG_LIMIT}건 더 있음")
+        written = details.get("nInserted", 0) + details.get("nUpserted", 0) + details.get("nModified", 0)
+        return written, len(errors)
+    return result.inserted_count + result.upserted_count + result.modified_count, 0
+
+
+def upsert_by_article_id(collection, docs: list) -> int:
+    """기사 id 가 같은 문서는 교체, 없으면 삽입 (id 가 없는 문서는 그냥 삽입)"""
+    if not docs:
+        return 0
+    written, _ = _bulk_write(collection, _write_ops(docs, upsert=True))
+    return written
+
+
+class BulkWriter:
+    """문서를 모아 batch_size 마다 unordered bulk_write 로 기록
+
+    written 은 서버가 확인한 기록 수, errors 는 실패한 쓰기 수 (실패해도 다음 배치는 계속 기록)
+    """
+
+    def __init__(self, collection, batch_size: int = WRITE_BATCH_SIZE, upsert: bool = False):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.upsert     = upsert
+        self.batch      = []
+        self.written    = 0
+        self.errors     = 0
+
+    def add(self, doc: dict):
+        self.batch.append(doc)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+        written, errors = _bulk_write(self.collection, _write_ops(self.batch, self.upsert))
+        self.written += written
+        self.errors  += errors
+        self.batch = []
+
+    def close(self) -> int:
+        self.flush()
+        return self.written
+
+
+# ────────────────────── 구간별 병렬 처리 ──────────────────────
+def connect(uri: str, db_name: str):
+    """워커 프로세스마다 새로 만드는 클라이언트 (MongoClient 는 fork 후 재사용 불가)"""
+    client = pymongo.MongoClient(uri)
+    return client, client[db_name]
+
+
+def process_range(task: dict) -> dict:
+    """구간 하나: 읽기(프로젝션) → transform → bulk 기록. 워커 통계 dict 반환
+
+    task["make_transform"] 은 워커 안에서 호출할 피클 가능한 팩토리로, 문서를 받아
+    기록할 문서(또는 None)를 돌려주는 callable 을 만듦. 그 callable 에 counts 속성(dict)이
+    있으면 통계에 합쳐서 돌려줌
+    """
+    client, db = connect(task["uri"], task["db_name"])
+    source = db[task["source"]]
+    writer = BulkWriter(db[task["destination"]], task.get("batch_size", WRITE_BATCH_SIZE),
+                        task.get("upsert", False))
+    transform = task["make_transform"]()
+    field = task.get("field", "_id")
+    lo, hi = task["range"]
+
+    scanned = 0
+    t0 = time.perf_counter()
+    try:
+        cursor = source.find(id_range_query(lo, hi, task.get("query"), field),
+                             projection(task.get("fields")),
+                             batch_size=task.get("read_batch_size", 1000))
+        if task.get("sort", True):
+            cursor = cursor.sort(field, pymongo.ASCENDING)
+        for doc in cursor:
+            scanned += 1
+            out = transform(doc)
+            if out is not None:
+                out.pop("_id", None)
+                writer.add(out)
+        written = writer.close()
+    finally:
+        client.close()
+
+    seconds = time.perf_counter() - t0
+    return {
+        "worker":      task["worker"],
+        "range":       (str(lo), str(hi)),
+        "scanned":     scanned,
+        "written":     written,
+        "write_errors": writer.errors,
+        "seconds":     round(seconds, 2),
+        "docs_per_sec": round(scanned / seconds, 1) if seconds else None,
+        "counts":      dict(getattr(transform, "counts", {}) or {}),
+    }
+
+
+def run_partitioned(uri: str, db_name: str, source: str, destination: str, make_transform,
+                    workers: int = 4, query: dict = None, field: str = "_id", fields=None,
+                    batch_size: int = WRITE_BATCH_SIZE, upsert: bool = False) -> list:
+    """source 를 field 구간으로 나눠 workers 개 프로세스로 처리 → 워커별 통계 목록
+    (fields 가 None 이면 문서 전체를 읽고 기록)"""
+    client, db = connect(uri, db_name)
+    try:
+        ranges = split_id_ranges(db[source], workers, query, field)
+    finally:
+        client.close()
+
+    tasks = [{
+        "worker": i, "uri": uri, "db_name": db_name, "source": source, "destination": destination,
+        "make_transform": make_transform, "range": rng, "query": query, "field": field,
+        "fields": fields, "batch_size": batch_size, "upsert": upsert,
+    } for i, rng in enumerate(ranges)]
+
+    if len(tasks) == 1:
+        return [process_range(tasks[0])]
+    with Pool(len(tasks)) as pool:
+        return pool.map(process_range, tasks)
+
+
+def print_worker_report(stats: list):
+    total_scanned = sum(s["scanned"] for s in stats)
+    total_written = sum(s["written"] for s in stats)
+    total_errors = sum(s.get("write_errors", 0) for s in stats)
+    wall = max((s["seconds"] for s in stats), default=0)
+    print("--- 워커별 처리 속도 ---")
+    for s in stats:
+        print(f"  worker {s['worker']}: {s['scanned']}개 읽음, {s['written']}개 기록, "
+              f"{s['seconds']}초, {s['docs_per_sec']} docs/s  [{s['range'][0]} ~ {s['range'][1]}]")
+    if wall:
+        print(f"  전체: {total_scanned}개 읽음, {total_written}개 기록, {total_scanned / wall:.1f} docs/s")
+    if total_errors:
+        print(f"  기록 실패: {total_errors}개")
+
+
+def merge_counts(stats: list) -> dict:
+    """워커별 transform counts 를 합침"""
+    merged = {}
+    for s in stats:
+        for key, value in s["counts"].items():
+            if isinstance(value, dict):
+                bucket = merged.setdefault(key, {})
+                for k, v in value.items():
+                    bucket[k] = bucket.get(k, 0) + v
+            else:
+                merged[key] = merged.get(key, 0) + value
+    return merged
@@ -0,0 +1,154 @@
+"""
+1~3차 전처리 통합 파이프라인
+---------------------------
+● 기존: 1st → yna_preprocessed_v1 → 2nd → v2 → 3rd → v3
+  → 단계마다 컬렉션 전체를 읽고 복사해 insert_many (코퍼스를 세 번 쓰고 세 번 인덱싱)
+● 세 단계를 하나의 커서 위에서 차례로 검사하는 조건(stage)으로 묶고 최종 결과만 기록
+    1) keyword : 카테고리 '북한' 또는 키워드 포함 (keyword_matcher, matched_keywords 기록)
+    2) length  : 본문이 MIN_CONTENT_BYTES 바이트 이상 (stage_config.py)
+    3) title   : 제목에 EXCLUDE_TITLE_PATTERN 이 없음 (stage_config.py)
+● pubDate 정렬은 원본의 pubDate 인덱스를 따라 읽어서 처리 (메모리 정렬 없음)
+  → 결과 컬렉션에도 pubDate 인덱스를 만들어 시간 순 조회는 인덱스로 처리
+● 원본을 pubDate(증분 모드는 _id) 구간으로 나눠 WORKERS 개 프로세스가 동시에 처리
+  (mongo_io.run_partitioned: 문서 전체(또는 PROJECTION_FIELDS)를 읽고 unordered bulk_write 로 기록, 워커별 docs/s 출력)
+● 단계별 제외 건수는 기존 스크립트처럼 출력
+● INCREMENTAL = True 면 워터마크(watermark.py) 이후에 들어온 원본 문서만 _id 순으로 읽고
+  결과는 기사 id 기준 upsert → 새로 크롤링한 날짜만큼만 처리
+"""
+
+from collections import OrderedDict
+
+import pymongo
+
+from keyword_matcher import KeywordMatcher
+from mongo_io import (
+    WRITE_BATCH_SIZE, ensure_article_index, merge_counts, print_worker_report, run_partitioned,
+)
+from stage_config import is_content_long_enough, is_title_allowed
+from watermark import Watermark
+
+# --- MongoDB 연결 설정 ---
+MONGO_URI = "mongodb://localhost:27017/"
+DB_NAME = "polaris"
+SOURCE_COLLECTION_NAME = "yna"                       # 원본 컬렉션
+DESTINATION_COLLECTION_NAME = "yna_preprocessed_v3"  # 최종 컬렉션 (3rd_process.py 결과와 같은 내용)
+BATCH_SIZE = WRITE_BATCH_SIZE   # unordered bulk_write 한 번에 보낼 문서 수
+WORKERS = 4                     # 구간을 나눠 동시에 처리할 프로세스 수
+PARTITION_FIELD = "pubDate"     # 전체 처리 시 구간 기준 ("pubDate" / "_id"), 증분 모드는 항상 _id
+INCREMENTAL = True              # False 면 원본 전체를 처리해 insert
+WATERMARK_STAGE = "pipeline"
+PROJECTION_FIELDS = None        # 읽어 기록할 필드 (None 이면 원본 문서 전체, mongo_io.READ_FIELDS 로 줄이면 나머지 필드는 결과에 없음)
+
+
+# ────────────────────── 단계별 조건 ──────────────────────
+def keyword_stage(matcher: KeywordMatcher = None):
+    """키워드 조건. 통과한 문서에는 matched_keywords 를 기록"""
+    matcher = matcher or KeywordMatcher()
+
+    def check(doc):
+        matched = matcher.match_document(doc)
+        if not matcher.is_relevant(doc, matched):
+            return False
+        doc["matched_keywords"] = matched
+        return True
+    return check
+
+
+def build_stages(matcher: KeywordMatcher = None) -> OrderedDict:
+    """이름 → 조건 함수 (기존 1st → 2nd → 3rd 순서)"""
+    return OrderedDict([
+        ("keyword", keyword_stage(matcher)),
+        ("length",  is_content_long_enough),
+        ("title",   is_title_allowed),
+    ])
+
+
+def apply_stages(doc, stages: OrderedDict, counts: dict) -> bool:
+    """단계를 차례로 검사해 모두 통과하면 True
+
+    counts: "scanned"(읽은 문서 수)와 단계 이름별 제외 수를 누적
+    """
+    counts["scanned"] = counts.get("scanned", 0) + 1
+    for name, check in stages.items():
+        if not check(doc):
+            counts[name] = counts.get(name, 0) + 1
+            return False
+    return True
+
+
+def run_stages(docs, stages: OrderedDict, counts: dict):
+    """모든 단계를 통과한 문서만 내보냄 (_id 는 제거)"""
+    for name in stages:
+        counts.setdefault(name, 0)
+    for doc in docs:
+        if apply_stages(doc, stages, counts):
+            doc.pop('_id', None)
+            yield doc
+
+
+class StageTransform:
+    """워커 프로세스 안에서 쓰는 변환기 (run_partitioned 의 make_transform)"""
+
+    def __init__(self):
+        self.stages = build_stages()
+        self.counts = {name: 0 for name in self.stages}
+
+    def __call__(self, doc):
+        return doc if apply_stages(doc, self.stages, self.counts) else None
+
+
+def print_stage_report(inserted_count: int, counts: dict):
+    scanned = counts.get("scanned", 0)
+    print(f"\n--- 전체 {scanned}개 문서 중 {inserted_count}개 삽입 완료 ---")
+    remaining = scanned
+    for name in build_stages():
+        count = counts.get(name, 0)
+        remaining -= count
+        print(f"  [{name}] 제외된 문서: {count} (남은 문서: {remaining})")
+
+
+# --- MongoDB 연결 및 통합 전처리 실행 ---
+if __name__ == "__main__":
+    client = None
+    try:
+        client = pymongo.MongoClient(MONGO_URI)
+        db = client[DB_NAME]
+        source_collection = db[SOURCE_COLLECTION_NAME]
+        destination_collection = db[DESTINATION_COLLECTION_NAME]
+
+        stages = build_stages()
+        print(f"MongoDB에 연결되었습니다. '{SOURCE_COLLECTION_NAME}' -> '{DESTINATION_COLLECTION_NAME}' "
+              f"통합 전처리({' → '.join(stages)})를 시작합니다...")
+
+        options = dict(make_transform=StageTransform, workers=WORKERS, fields=PROJECTION_FIELDS,
+                       batch_size=BATCH_SIZE)
+        if INCREMENTAL:
+            # 새 문서만 _id 구간으로 나눠 읽음 (결과의 시간 순서는 pubDate 인덱스로 조회)
+            watermark = Watermark(db, WATERMARK_STAGE, SOURCE_COLLECTION_NAME)
+            print(f"증분 모드: {watermark}")
+            ensure_article_index(destination_collection)
+            scope = watermark.query()
+            stats = []
+            if watermark.observe_latest(source_collection, scope):
+                stats = run_partitioned(MONGO_URI, DB_NAME, SOURCE_COLLECTION_NAME, DESTINATION_COLLECTION_NAME,
+                                        query=scope, field="_id", upsert=True, **options)
+        else:
+            source_collection.create_index([(PARTITION_FIELD, pymongo.ASCENDING)])
+            stats = run_partitioned(MONGO_URI, DB_NAME, SOURCE_COLLECTION_NAME, DESTINATION_COLLECTION_NAME,
+                                    field=PARTITION_FIELD, **options)
+        inserted_count = sum(s["written"] for s in stats)
+        if INCREMENTAL:
+            watermark.commit(inserted_count)
+        destination_collection.create_index([("pubDate", pymongo.ASCENDING)])
+
+        print_worker_report(stats)
+        print_stage_report(inserted_count, merge_counts(stats))
+
+    except pymongo.errors.ConnectionFailure as e:
+        print(f"MongoDB 연결 오류: {e}")
+    except Exception as e:
+        print(f"전처리 중 오류 발생: {e}")
+    finally:
+        if client:
+            client.close()
+            print("MongoDB 연결을 닫았습니다.")
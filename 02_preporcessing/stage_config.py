@@ -0,0 +1,39 @@
+"""
+2·3차 전처리 공용 기준
+--------------------
+● 2nd_process.py / 3rd_process.py 와 통합 파이프라인(pipeline.py)이 같은 기준을 쓰도록 한곳에서 관리
+● re 외에는 의존성이 없어 각 스크립트가 pipeline 을 거치지 않고 가져다 씀
+  (pipeline 은 keyword_matcher · mongo_io · watermark 까지 불러옴)
+"""
+
+import re
+
+# --- 2차: 길이 기준 ---
+MIN_CONTENT_BYTES = 500  # 바이트 기준 최소 길이 (조정 가능)
+
+# --- 3차: 필터링할 제목 키워드 리스트 ---
+EXCLUDE_TITLE_KEYWORDS = [
+    re.escape('[이시각헤드라인]'),
+    re.escape('[뉴스초점]'),
+    re.escape('[뉴스리뷰]'),
+    re.escape('[라이브투데이]'),
+    re.escape('[현장연결]'),
+    re.escape('[씬속뉴스]'),
+    re.escape('[1번지이슈]'),
+    re.escape('[주요 신문 사설]'),
+    re.escape('[연합시론]')
+]
+
+# 키워드들을 OR 조건으로 합쳐 하나의 정규표현식 패턴 생성
+EXCLUDE_TITLE_PATTERN = '|'.join(EXCLUDE_TITLE_KEYWORDS)
+exclude_title_regex = re.compile(EXCLUDE_TITLE_PATTERN)
+
+
+# ────────────────────── 단계별 조건 ──────────────────────
+def is_content_long_enough(doc):
+    content = doc.get("content", "")
+    return len(content.encode("utf-8")) >= MIN_CONTENT_BYTES
+
+
+def is_title_allowed(doc):
+    return not exclude_title_regex.search(doc.get("title") or "")
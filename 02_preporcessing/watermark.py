@@ -0,0 +1,96 @@
+"""
+증분 전처리용 단계별 워터마크
+----------------------------
+● 기존 스크립트는 매번 원본 컬렉션을 처음(_id 1)부터 읽어 결과 컬렉션에 insert
+  → 하루치 크롤링을 추가한 뒤 다시 돌리면 중복 삽입되거나 drop() 후 전체 재처리
+● 단계(stage)마다 마지막으로 처리한 원본 문서의 field 값(과 crawled_at)을 WATERMARK_COLLECTION 에 기록하고
+  다음 실행에서는 그 이후에 들어온 문서만 읽음 → 비용이 전체 코퍼스가 아니라 새 문서 수에 비례
+● field 는 원본 컬렉션이 어떻게 쓰이는지에 따라 고름
+    - "_id"        : 크롤러가 insert 만 하는 원본(yna) → 새 문서는 항상 더 큰 _id
+    - "updated_at" : 앞 단계가 기사 id 기준 upsert 로 쓰는 중간 컬렉션(v1, v2)
+                     → upsert 는 기존 _id 를 유지하므로 _id 로는 갱신·재크롤링된 기사를 놓침.
+                       mongo_io 가 기록할 때마다 찍는 UPDATED_KEY 로 고름
+● 결과는 기사 id 기준 upsert (mongo_io.upsert_by_article_id) 라 같은 구간을 다시 돌려도 중복 없음
+● 워터마크는 결과 기록이 끝난 뒤에만 전진 (중간에 실패하면 다음 실행에서 그 구간부터 다시 처리)
+"""
+
+from datetime import datetime
+
+WATERMARK_COLLECTION = "preprocess_watermarks"
+
+
+class Watermark:
+    """stage 이름 하나의 high-water mark (마지막 처리 field 값 / crawled_at)"""
+
+    def __init__(self, db, stage: str, source_collection_name: str = None, field: str = "_id"):
+        self.collection = db[WATERMARK_COLLECTION]
+        self.stage = stage
+        self.source = source_collection_name
+        self.field = field
+        self.state = self.collection.find_one({"_id": stage}) or {}
+        if self.state and self.state.get("field", "_id") != field:
+            # 기준 필드가 바뀌면 이전 값과 비교할 수 없으므로 처음부터 다시 처리
+            print(f"워터마크 '{stage}' 기준이 {self.state.get('field', '_id')} → {field} 로 바뀌어 처음부터 처리합니다.")
+            self.state = {}
+        self.max_value = self.last_value
+        self.max_crawled_at = self.state.get("last_crawled_at")
+
+    @property
+    def last_value(self):
+        return self.state.get("last_value", self.state.get("last_id"))
+
+    def query(self, base: dict = None) -> dict:
+        """워터마크 이후 문서만 고르는 쿼리 (처음이면 base 그대로)"""
+        base = dict(base or {})
+        if self.last_value is None:
+            return base
+        after = {self.field: {"$gt": self.last_value}}
+        return {"$and": [base, after]} if base else after
+
+    def observe(self, doc: dict):
+        """읽은 원본 문서의 field / crawled_at 중 가장 큰 값을 기억"""
+        value = doc.get(self.field)
+        if value is not None and (self.max_value is None or value > self.max_value):
+            self.max_value = value
+        crawled_at = doc.get("crawled_at")
+        if crawled_at is not None and (self.max_crawled_at is None or crawled_at > self.max_crawled_at):
+            self.max_crawled_at = crawled_at
+
+    def observe_latest(self, collection, scope: dict = None):
+        """처리 시작 시점에 scope 안에서 가장 최근 문서를 observe
+        (서버 쪽에서 걸러져 커서로 오지 않는 문서까지 워터마크에 반영)"""
+        latest_docs = collection.find(scope or {}, {self.field: 1, "crawled_at": 1}).sort(self.field, -1).limit(1)
+        for latest in latest_docs:
+            self.observe(latest)
+        return self.max_value != self.last_value   # 새 문서가 있으면 True
+
+    def track(self, docs):
+        """문서를 그대로 흘려보내며 observe"""
+        for doc in docs:
+            self.observe(doc)
+            yield doc
+
+    def commit(self, processed: int = 0):
+        """observe 한 최댓값까지 처리 완료로 기록"""
+        if self.max_value is None or self.max_value == self.last_value:
+            return
+        self.state = {
+            "_id":             self.stage,
+            "source":          self.source,
+            "field":           self.field,
+            "last_value":      self.max_value,
+            "last_crawled_at": self.max_crawled_at,
+            "last_processed":  processed,
+            "updated_at":      datetime.now().isoformat(),
+        }
+        self.collection.replace_one({"_id": self.stage}, self.state, upsert=True)
+
+    def reset(self):
+        """워터마크 삭제 → 다음 실행은 처음부터 전체 처리"""
+        self.collection.delete_one({"_id": self.stage})
+        self.state = {}
+        self.max_value = self.max_crawled_at = None
+
+    def __repr__(self):
+        return (f"Watermark({self.stage}, {self.field} > {self.last_value}, "
+                f"last_crawled_at={self.state.get('last_crawled_at')})")
@@ -0,0 +1,194 @@
+"""
+문장 임베딩 디스크 캐시
+----------------------
+● 통신 기사는 업데이트마다 리드 문장·상투 문구가 반복되고, num_sentences 나 정리 규칙만 바꿔 다시 돌려도
+  기존 summarizer 는 모든 문장을 처음부터 다시 인코딩
+● 정규화한 문장(NFKC + 공백 정리)과 모델 이름을 blake2b 16바이트 키로 해시해
+    - vectors.f16  : (capacity, dim) float16 행렬 (np.memmap, 필요한 행만 디스크에서 읽음)
+    - index.sqlite : 키 → 행 번호 + LRU 순서 (crawl_ledger / http_cache 와 같은 WAL SQLite)
+● capacity 를 넘으면 가장 오래 쓰지 않은 행을 덮어씀 (LRU)
+  덮어쓰기 전에 그 행을 가리키던 키를 색인에서 지우고 커밋, 새 키 → 행은 벡터를 디스크에 쓴 뒤(flush) 기록
+  → 중간에 죽어도 색인이 다른 문장의 벡터를 가리키는 일은 없음 (BatchSummarizer 는 기사 묶음마다 flush)
+● CachedEncoder: 캐시에 없는 문장만 중복 없이 모아 원래 인코더로 한 번에 인코딩
+  (첫 실행과 재실행 결과가 같도록 새로 인코딩한 벡터도 float16 을 거쳐 돌려줌)
+"""
+
+import hashlib, os, re, sqlite3, unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+EMBEDDING_CACHE_DIR = "embedding_cache"
+EMBEDDING_CACHE_CAPACITY = 1_000_000   # 행 수 상한 (768차원 기준 약 1.5GB)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sentence(sentence: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", sentence)).strip()
+
+
+def sentence_key(sentence: str, namespace: str = "") -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(namespace.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(normalize_sentence(sentence).encode("utf-8"))
+    return h.digest()
+
+
+class EmbeddingCache:
+    """정규화 문장 해시 → float16 임베딩 행 (LRU, 행 수 상한 capacity)"""
+
+    def __init__(self, path: str, dim: int, namespace: str = "",
+                 capacity: int = EMBEDDING_CACHE_CAPACITY):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.dim = dim
+        self.namespace = namespace
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0}
+
+        self._conn = sqlite3.connect(os.path.join(path, "index.sqlite"))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key       BLOB PRIMARY KEY,
+                row       INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        meta = dict(self._conn.execute("SELECT name, value FROM meta"))
+        if meta and int(meta["dim"]) != dim:
+            raise ValueError(f"캐시 차원({meta['dim']})과 모델 차원({dim})이 다릅니다: {path}")
+        # 상한을 줄였으면 범위를 벗어난 행은 버리고, 늘렸으면 파일을 키움
+        self.capacity = capacity
+        self._conn.execute("DELETE FROM entries WHERE row >= ?", (capacity,))
+        self._conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                               [("dim", str(dim)), ("capacity", str(capacity))])
+        self._conn.commit()
+
+        vectors_path = os.path.join(path, "vectors.f16")
+        mode = "r+" if os.path.exists(vectors_path) else "w+"
+        if mode == "r+" and os.path.getsize(vectors_path) < capacity * dim * 2:
+            with open(vectors_path, "r+b") as f:
+                f.truncate(capacity * dim * 2)
+        self.vectors = np.memmap(vectors_path, dtype=np.float16, mode=mode, shape=(capacity, dim))
+
+        # 키 → 행 (앞쪽이 가장 오래 쓰지 않은 항목)
+        self._lru = OrderedDict(self._conn.execute("SELECT key, row FROM entries ORDER BY last_used"))
+        used = set(self._lru.values())
+        self._free = [r for r in range(capacity - 1, -1, -1) if r not in used] if len(used) < capacity else []
+        self._tick = (self._conn.execute("SELECT MAX(last_used) FROM entries").fetchone()[0] or 0) + 1
+        self._dirty = {}   # 이번 실행에서 쓴 키 → last_used
+
+    def __len__(self):
+        return len(self._lru)
+
+    # ───────────── 조회 / 기록 ─────────────
+    def lookup(self, keys: list):
+        """(찾은 위치 목록, 행 번호 목록) → 찾은 키는 최근 사용으로 표시"""
+        found, rows = [], []
+        for i, key in enumerate(keys):
+            row = self._lru.get(key)
+            if row is None:
+                continue
+            self._touch(key)
+            found.append(i)
+            rows.append(row)
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(keys) - len(found)
+        return found, rows
+
+    def _touch(self, key: bytes):
+        self._lru.move_to_end(key)
+        self._dirty[key] = self._tick
+        self._tick += 1
+
+    def _allocate(self, evicted: list) -> int:
+        if self._free:
+            return self._free.pop()
+        old_key, row = self._lru.popitem(last=False)
+        self._dirty.pop(old_key, None)
+        evicted.append((old_key,))
+        self.stats["evicted"] += 1
+        return row
+
+    def store(self, keys: list, vectors: np.ndarray):
+        rows, evicted = [], []
+        for key in keys:
+            row = self._lru.get(key)
+            if row is None:
+                row = self._allocate(evicted)
+                self._lru[key] = row
+            rows.append(row)
+        if evicted:
+            # 재사용할 행을 가리키던 키를 먼저 지워 커밋한 뒤에 덮어씀
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+            self._conn.commit()
+        for key, row, vec in zip(keys, rows, vectors):
+            self.vectors[row] = vec
+            self._touch(key)
+
+    def flush(self):
+        """벡터 파일과 LRU 순서를 디스크에 기록"""
+        if not self._dirty:
+            return
+        self.vectors.flush()
+        self._conn.executemany(
+            "INSERT INTO entries (key, row, last_used) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET row = excluded.row, last_used = excluded.last_used",
+            ((key, self._lru[key], tick) for key, tick in self._dirty.items()),
+        )
+        self._conn.commit()
+        self._dirty.clear()
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+        del self.vectors
+
+    def __repr__(self):
+        return f"EmbeddingCache({self.path}, {len(self)}/{self.capacity}행, dim={self.dim})"
+
+
+class CachedEncoder:
+    """encode(sentences) 앞에 EmbeddingCache 를 둔 인코더 (인코더 인터페이스는 그대로)"""
+
+    def __init__(self, encoder, cache: EmbeddingCache):
+        self.encoder = encoder
+        self.cache = cache
+
+    @property
+    def calls(self):
+        return self.encoder.calls
+
+    def flush(self):
+        self.cache.flush()
+
+    def encode(self, sentences: list) -> np.ndarray:
+        keys = [sentence_key(s, self.cache.namespace) for s in sentences]
+        out = np.empty((len(sentences), self.cache.dim), dtype=np.float32)
+        found, rows = self.cache.lookup(keys)
+        if found:
+            # memmap 은 정렬된 행 번호로 읽어야 디스크 접근이 순차적
+            order = np.argsort(rows)
+            out[np.asarray(found)[order]] = self.cache.vectors[np.asarray(rows)[order]]
+
+        hit = set(found)
+        missing = OrderedDict()   # 같은 문장은 한 번만 인코딩
+        for i, key in enumerate(keys):
+            if i not in hit:
+                missing.setdefault(key, []).append(i)
+        if missing:
+            first = [positions[0] for positions in missing.values()]
+            vectors = self.encoder.encode([sentences[i] for i in first]).astype(np.float16)
+            self.cache.store(list(missing), vectors)
+            for positions, vec in zip(missing.values(), vectors):
+                out[positions] = vec
+        return out
+
+    def close(self):
+        self.cache.close()
+
+    def __repr__(self):
+        return f"CachedEncoder({self.encoder}, {self.cache})"
@@ -0,0 +1,62 @@
+"""
+문장 인코더 CPU 추론 백엔드
+--------------------------
+● 요약 서버에는 GPU 가 없는데 기존 노트북은 cuda / fp32 CPU PyTorch 중에서만 고름
+● BACKENDS
+    - "torch"      : 기존과 같은 fp32 PyTorch
+    - "torch-int8" : nn.Linear 를 int8 동적 양자화 (torch.quantization.quantize_dynamic, 추가 설치 없음)
+    - "onnx-int8"  : ONNX 로 내보낸 뒤 int8 동적 양자화해 ONNX Runtime 으로 실행
+                     (sentence-transformers>=3.2, pip install "optimum[onnxruntime]")
+                     내보낸 모델은 ONNX_EXPORT_DIR 에 저장해 두고 다음부터 그대로 로드
+● threads: PyTorch / ONNX Runtime 의 연산 스레드 수 (None 이면 라이브러리 기본값)
+● 양자화 결과 검증은 summarizer.check_agreement (fp32 와 고른 요약 문장 비교)
+"""
+
+import os
+
+import torch
+
+BACKENDS = ("torch", "torch-int8", "onnx-int8")
+ONNX_EXPORT_DIR = "onnx_models"
+ONNX_QUANTIZATION = "avx512_vnni"   # 실행 CPU 에 맞게: "arm64" / "avx2" / "avx512" / "avx512_vnni"
+
+
+def _export_onnx_int8(model_name: str, threads: int = None):
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    export_dir = os.path.join(ONNX_EXPORT_DIR, model_name.replace("/", "__"))
+    file_name = f"onnx/model_qint8_{ONNX_QUANTIZATION}.onnx"
+    if not os.path.exists(os.path.join(export_dir, file_name)):
+        print(f"ONNX int8 모델을 내보냅니다 → {export_dir} (처음 한 번만)")
+        fp32 = SentenceTransformer(model_name, device="cpu", backend="onnx")
+        fp32.save(export_dir)
+        export_dynamic_quantized_onnx_model(fp32, ONNX_QUANTIZATION, export_dir)
+
+    model_kwargs = {"file_name": file_name, "provider": "CPUExecutionProvider"}
+    if threads:
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        model_kwargs["session_options"] = options
+    return SentenceTransformer(export_dir, device="cpu", backend="onnx", model_kwargs=model_kwargs)
+
+
+def load_sentence_model(model_name: str, device: str = None, backend: str = "torch", threads: int = None):
+    """backend 에 맞는 SentenceTransformer (양자화 백엔드는 항상 CPU)"""
+    from sentence_transformers import SentenceTransformer
+
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 backend: {backend} (가능: {', '.join(BACKENDS)})")
+    if threads:
+        torch.set_num_threads(threads)
+
+    if backend == "onnx-int8":
+        return _export_onnx_int8(model_name, threads)
+    if backend == "torch-int8":
+        model = SentenceTransformer(model_name, device="cpu")
+        model.eval()
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return SentenceTransformer(model_name, device=device)
+
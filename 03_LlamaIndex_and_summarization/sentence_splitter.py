@@ -0,0 +1,180 @@
+"""
+한국어 문장 분리 (KSS 프로세스 풀 + 분리 결과 캐시)
+-----------------------------------------------
+● 기존 split_sentences_ko 는 호출마다 try 안에서 kss 를 import 하고, 어떤 오류든 조용히 정규식 분리로 넘어가며,
+  요약 루프 안에서 한 기사씩 단일 프로세스로 실행 (요약 단계에서 인코딩 다음으로 CPU 를 많이 씀)
+● 여기서는
+    - kss 는 프로세스마다 한 번만 import, 정규식 분리로 넘어가면 그 이유(예외 종류)를 세어 보고
+    - SentenceSplitter: 요약이 끝날 때까지 유지하는 프로세스 풀에 기사를 SPLIT_CHUNKSIZE 개씩 나눠 분리
+    - 분리 결과는 문서 본문 blake2b 해시 → 문장 목록으로 SQLite 파일에 캐시 (http_cache 와 같은 방식)
+      → num_sentences·인코더만 바꿔 다시 요약할 때는 분리를 건너뜀
+"""
+
+import hashlib, json, os, re, sqlite3, zlib
+from collections import Counter
+from multiprocessing import Pool
+
+SPLIT_WORKERS = os.cpu_count() or 1
+SPLIT_CHUNKSIZE = 16                  # 풀 작업자에게 한 번에 넘길 기사 수
+SPLIT_CACHE_PATH = "sentence_splits.sqlite"
+FALLBACK_SPLIT_RE = re.compile(r'(?<=[\.!?])\s+(?=[“"(\[]?[가-힣A-Z0-9])')
+
+_kss = None
+_kss_error = None   # kss 를 쓸 수 없는 이유 (프로세스마다 한 번 확인)
+
+
+def _load_kss():
+    global _kss, _kss_error
+    if _kss is None and _kss_error is None:
+        try:
+            import kss
+            _kss = kss
+        except Exception as e:   # 미설치·의존성 오류 모두 정규식 분리로
+            _kss_error = f"{type(e).__name__}: {e}"
+    return _kss
+
+
+def fallback_split(text: str) -> list:
+    sents = FALLBACK_SPLIT_RE.split(text)
+    return [s.strip() for s in sents if s.strip()]
+
+
+def split_with_reason(text: str):
+    """(문장 목록, 정규식 분리를 쓴 이유 또는 None)"""
+    if not text:
+        return [], None
+    kss = _load_kss()
+    if kss is None:
+        return fallback_split(text), f"kss 없음 ({_kss_error})"
+    try:
+        return [s.strip() for s in kss.split_sentences(text) if s.strip()], None
+    except Exception as e:
+        return fallback_split(text), f"kss 오류 ({type(e).__name__})"
+
+
+def split_sentences_ko(text: str) -> list:
+    return split_with_reason(text)[0]
+
+
+def document_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class SplitCache:
+    """문서 해시 → 문장 목록 (zlib 압축 JSON) SQLite 캐시"""
+
+    def __init__(self, path: str = SPLIT_CACHE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS splits (
+                key       BLOB PRIMARY KEY,
+                sentences BLOB NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+
+    def get_many(self, keys: list) -> dict:
+        found = {}
+        for start in range(0, len(keys), 500):   # SQLite 변수 개수 제한
+            batch = keys[start:start + 500]
+            marks = ",".join("?" * len(batch))
+            for key, blob in self._conn.execute(f"SELECT key, sentences FROM splits WHERE key IN ({marks})", batch):
+                found[key] = json.loads(zlib.decompress(blob))
+        return found
+
+    def put_many(self, items):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO splits (key, sentences) VALUES (?, ?)",
+            ((key, zlib.compress(json.dumps(sents, ensure_ascii=False).encode("utf-8"))) for key, sents in items),
+        )
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM splits").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+
+class SentenceSplitter:
+    """여러 기사를 프로세스 풀에서 문장 분리 (캐시 적중은 풀에 보내지 않음)
+
+    workers 가 1 이면 현재 프로세스에서 분리. with 블록이나 close() 로 풀을 정리
+    """
+
+    def __init__(self, workers: int = SPLIT_WORKERS, chunksize: int = SPLIT_CHUNKSIZE,
+                 cache_path: str = SPLIT_CACHE_PATH):
+        self.workers = workers
+        self.chunksize = chunksize
+        self.cache = SplitCache(cache_path) if cache_path else None
+        self._pool = Pool(workers, initializer=_load_kss) if workers > 1 else None
+        self.stats = {"documents": 0, "cache_hits": 0, "kss": 0, "fallback": 0}
+        self.fallback_reasons = Counter()
+
+    def split_many(self, texts: list) -> list:
+        """본문 목록 → 기사별 문장 목록"""
+        results = [[] for _ in texts]
+        keys = [document_key(t) if t else None for t in texts]
+        cached = self.cache.get_many(list({k for k in keys if k})) if self.cache else {}
+
+        todo = []
+        for i, (text, key) in enumerate(zip(texts, keys)):
+            if not text:
+                continue
+            if key in cached:
+                results[i] = cached[key]
+                self.stats["cache_hits"] += 1
+            else:
+                todo.append(i)
+        self.stats["documents"] += len(texts)
+        if not todo:
+            return results
+
+        todo_texts = [texts[i] for i in todo]
+        if self._pool is not None and len(todo) > self.chunksize:
+            splits = self._pool.map(split_with_reason, todo_texts, chunksize=self.chunksize)
+        else:
+            splits = [split_with_reason(t) for t in todo_texts]
+
+        fresh = {}
+        for i, (sentences, reason) in zip(todo, splits):
+            results[i] = sentences
+            if reason is None:
+                self.stats["kss"] += 1
+                fresh[keys[i]] = sentences   # 정규식 분리 결과는 캐시하지 않음 (kss 를 설치하면 다시 분리)
+            else:
+                if not self.fallback_reasons:
+                    print(f"⚠️ kss 대신 정규식으로 문장을 분리합니다: {reason}")
+                self.stats["fallback"] += 1
+                self.fallback_reasons[reason] += 1
+        if self.cache is not None and fresh:
+            self.cache.put_many(fresh.items())
+        return results
+
+    def report(self) -> str:
+        s = self.stats
+        line = (f"문장 분리: 기사 {s['documents']}건 (캐시 {s['cache_hits']}, kss {s['kss']}, "
+                f"정규식 대체 {s['fallback']})")
+        for reason, count in self.fallback_reasons.most_common():
+            line += f"\n  - 정규식 대체 {count}건: {reason}"
+        return line
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"SentenceSplitter(workers={self.workers}, chunksize={self.chunksize}, cache={self.cache and self.cache.path})"
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+한 줄 요약 생성 (1.one_line_summary.ipynb 의 스크립트 버전)
+-------------------------------------------------------
+● 전처리·기자명 제거·문장 분할·문서 중심 코사인 순위 방식은 노트북과 같음
+● 기존: 기사마다 model.encode(sentences) 를 따로 호출 → 호출당 문장 수십 개짜리 작은 배치라
+  CPU 에서는 호출 오버헤드와 패딩이 대부분을 차지
+● BatchSummarizer: ARTICLE_CHUNK 개 기사의 문장을 한꺼번에 모아 길이순으로 정렬한 뒤
+  ENCODE_BATCH_SIZE 배치로 한 번에 인코딩하고, 임베딩을 기사별로 다시 나눠 중심 벡터 순위를 계산
+  (길이가 비슷한 문장끼리 배치되어 패딩이 줄고, 기사 수와 무관하게 호출 수는 문장 수 / 배치 크기)
+● --backend torch-int8 / onnx-int8: GPU 없는 서버용 int8 양자화 CPU 추론 (encoder_backends.py), --threads 로 스레드 수
+  --check-agreement N: 기사 N 건 표본에서 fp32 와 같은 요약 문장을 고르는지 먼저 확인
+● 본문 정리는 text_cleaning 의 컴파일된 규칙으로 --clean-workers 개 프로세스에서 나눠 처리
+● 문장 분리는 sentence_splitter 의 KSS 프로세스 풀(--split-workers)에서 청크 단위로, 결과는 본문 해시로 캐시
+  (kss 대신 정규식 분리를 쓰면 그 이유와 건수를 출력)
+● 인코딩 전에 embedding_cache 의 디스크 캐시를 먼저 조회 → 같은 기사를 다시 요약할 때는 대부분 캐시 적중
+  (--no-cache 면 사용 안 함)
+
+사용법
+  python summarizer.py [입력폴더] [-o 결과.json] [-n 4] [--batch-size 128] [--article-chunk 512] [--cache-dir 폴더]
+  python summarizer.py [입력폴더] --backend onnx-int8 --threads 8 --check-agreement 200
+"""
+import argparse, os, json, random, time
+from typing import List
+
+import numpy as np
+import torch
+from tqdm import tqdm
+
+from embedding_cache import EMBEDDING_CACHE_CAPACITY, EMBEDDING_CACHE_DIR, CachedEncoder, EmbeddingCache
+from encoder_backends import BACKENDS, load_sentence_model
+from sentence_splitter import SPLIT_CACHE_PATH, SPLIT_WORKERS, SentenceSplitter, split_sentences_ko
+from text_cleaning import CLEAN_WORKERS, clean_documents, clean_summary, preprocess_text
+
+# ===== 기본 설정 =====
+SEED = 42
+random.seed(SEED)
+torch.manual_seed(SEED)
+torch.cuda.manual_seed_all(SEED)
+
+MODEL_NAME = "snunlp/KR-SBERT-V40K-klueNLI-augSTS"
+DATA_DIR = "/home/ds4_sia_nolb/llama_index_json/2024"
+OUTPUT_DIR = "/home/ds4_sia_nolb/code/confirmed/summarized_llama_articles"
+OUTPUT_FILENAME = "summarized_articles_ballon.json"
+
+NUM_SENTENCES = 4          # 요약 문장 수 (노트북 실행부와 같음)
+ENCODE_BATCH_SIZE = 128    # 한 번에 인코딩할 문장 수
+ARTICLE_CHUNK = 512        # 문장을 모아 한꺼번에 인코딩할 기사 수 (메모리 상한)
+BACKEND = "torch"          # "torch" / "torch-int8" / "onnx-int8" (encoder_backends.py)
+AGREEMENT_MIN = 0.9        # 양자화 백엔드가 fp32 와 같은 요약 문장을 골라야 하는 최소 비율
+
+# ===== 전처리 =====
+# 잡음 규칙·기자명 정리는 text_cleaning.py (미리 컴파일한 정규식, 프로세스 풀)
+# 문장 분리(split_sentences_ko)는 sentence_splitter.py (KSS 프로세스 풀 + 분리 결과 캐시)
+
+# ===== 문장 인코더 =====
+class SentenceEncoder:
+    """SentenceTransformer 래퍼: 문장 목록 → (문장 수, 차원) float32 배열
+
+    name 은 임베딩 캐시 구분용 (양자화 백엔드는 벡터가 조금 다르므로 따로 캐시)
+    """
+
+    def __init__(self, model_name: str = MODEL_NAME, device: str = None, batch_size: int = ENCODE_BATCH_SIZE,
+                 backend: str = BACKEND, threads: int = None):
+        self.backend = backend
+        self.device = "cpu" if backend != "torch" else (device or ("cuda" if torch.cuda.is_available() else "cpu"))
+        self.batch_size = batch_size
+        self.model = load_sentence_model(model_name, self.device, backend, threads)
+        self.name = model_name if backend == "torch" else f"{model_name}@{backend}"
+        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.calls = 0
+
+    def encode(self, sentences: List[str]) -> np.ndarray:
+        self.calls += 1
+        return self.model.encode(sentences, batch_size=self.batch_size, convert_to_numpy=True,
+                                 show_progress_bar=False)
+
+    def __repr__(self):
+        return f"SentenceEncoder({self.name}, device={self.device}, batch_size={self.batch_size}, threads={torch.get_num_threads()})"
+
+# ===== 추출 요약기 =====
+def rank_sentences(embeddings: np.ndarray, num_sentences: int) -> List[int]:
+    """문장 임베딩 평균(문서 임베딩)과 코사인 유사도가 높은 num_sentences 개 문장의 원문 순서 인덱스"""
+    centroid = embeddings.mean(axis=0)
+    norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(centroid)
+    similarities = embeddings @ centroid / np.where(norms == 0, 1.0, norms)
+    top_sentence_indices = similarities.argsort()[-num_sentences:][::-1]
+    top_sentence_indices.sort()
+    return top_sentence_indices.tolist()
+
+def summarize_extractive(clean_text: str, encoder: SentenceEncoder, num_sentences: int = 3) -> str:
+    """기사 하나 요약 (노트북과 같은 기사별 인코딩)"""
+    if not clean_text:
+        return ""
+    sentences = split_sentences_ko(clean_text)
+    if len(sentences) <= num_sentences:
+        return " ".join(sentences)
+    idx = rank_sentences(encoder.encode(sentences), num_sentences)
+    return " ".join(sentences[i] for i in idx)
+
+def check_agreement(reference: SentenceEncoder, candidate: SentenceEncoder, texts: List[str],
+                    num_sentences: int = NUM_SENTENCES, sample: int = 200) -> dict:
+    """표본 기사에서 두 인코더가 고른 요약 문장(top-k 인덱스)이 같은 비율과 평균 겹침 비율"""
+    rng = random.Random(SEED)
+    texts = [t for t in texts if t]
+    compared = same = 0
+    overlap = 0.0
+    for text in rng.sample(texts, min(sample, len(texts))):
+        sentences = split_sentences_ko(text)
+        if len(sentences) <= num_sentences:
+            continue
+        ref = set(rank_sentences(reference.encode(sentences), num_sentences))
+        got = set(rank_sentences(candidate.encode(sentences), num_sentences))
+        compared += 1
+        same += ref == got
+        overlap += len(ref & got) / num_sentences
+    return {
+        "articles":     compared,
+        "exact_match":  same / compared if compared else 1.0,
+        "mean_overlap": overlap / compared if compared else 1.0,
+    }
+
+class BatchSummarizer:
+    """여러 기사의 문장을 길이순 큰 배치로 한 번에 인코딩한 뒤 기사별로 나눠 요약
+
+    splitter(SentenceSplitter)가 있으면 청크의 문장 분리를 프로세스 풀에 맡김
+    """
+
+    def __init__(self, encoder: SentenceEncoder, num_sentences: int = NUM_SENTENCES,
+                 article_chunk: int = ARTICLE_CHUNK, splitter: SentenceSplitter = None):
+        self.encoder = encoder
+        self.splitter = splitter
+        self.num_sentences = num_sentences
+        self.article_chunk = article_chunk
+        self.stats = {"articles": 0, "sentences": 0, "encoded": 0, "failed": 0}
+
+    def _summarize_chunk(self, texts: List[str], errors: dict) -> List[str]:
+        """요약 목록 (순위 계산에 실패한 기사는 "" 로 두고 errors[청크 안 위치] 에 예외 기록)"""
+        if self.splitter is not None:
+            per_article = self.splitter.split_many(texts)
+        else:
+            per_article = [split_sentences_ko(t) if t else [] for t in texts]
+        summaries = [" ".join(s) for s in per_article]   # 문장 수가 적으면 본문 전체가 요약
+
+        # 순위를 매겨야 하는 기사의 문장만 모아 (기사 번호, 시작 위치, 문장 수) 기록
+        flat, spans = [], []
+        for i, sents in enumerate(per_article):
+            if len(sents) > self.num_sentences:
+                spans.append((i, len(flat), len(sents)))
+                flat.extend(sents)
+
+        if flat:
+            # 길이순으로 정렬해 인코딩 → 원래 순서로 되돌림
+            order = sorted(range(len(flat)), key=lambda k: len(flat[k]), reverse=True)
+            encoded = self.encoder.encode([flat[k] for k in order])
+            embeddings = np.empty_like(encoded)
+            embeddings[order] = encoded
+            self.stats["encoded"] += len(flat)
+
+            for i, start, count in spans:
+                sents = per_article[i]
+                try:
+                    idx = rank_sentences(embeddings[start:start + count], self.num_sentences)
+                    summaries[i] = " ".join(sents[j] for j in idx)
+                except Exception as e:
+                    summaries[i] = ""
+                    errors[i] = e
+        self.stats["articles"] += len(texts)
+        self.stats["sentences"] += sum(len(s) for s in per_article)
+        return summaries
+
+    def _summarize_each(self, texts: List[str], errors: dict) -> List[str]:
+        """묶음 전체가 실패했을 때 기사 하나씩 요약 (노트북처럼 실패한 기사만 "")"""
+        summaries = []
+        for k, text in enumerate(texts):
+            one = {}
+            try:
+                summaries.extend(self._summarize_chunk([text], one))
+            except Exception as e:
+                summaries.append("")
+                one[0] = e
+            if one:
+                errors[k] = one[0]
+        return summaries
+
+    def summarize(self, texts: List[str], progress: bool = True) -> List[str]:
+        summaries = []
+        chunks = range(0, len(texts), self.article_chunk)
+        flush = getattr(self.encoder, "flush", None)   # 임베딩 캐시는 묶음마다 디스크에 기록
+        for start in tqdm(chunks, desc="기사 요약 중", unit="chunk", disable=not progress):
+            chunk, errors = texts[start:start + self.article_chunk], {}
+            try:
+                summaries.extend(self._summarize_chunk(chunk, errors))
+            except Exception as e:
+                # 문장 분리·인코딩 중 한 기사 때문에 묶음 전체가 실패 → 기사별로 다시
+                print(f"⚠️ 기사 {start}~{start + len(chunk) - 1} 묶음 요약 실패 → 기사별로 다시 요약합니다: {e}")
+                errors.clear()
+                summaries.extend(self._summarize_each(chunk, errors))
+            for k, e in sorted(errors.items()):
+                print(f"⚠️ 요약 실패(index={start + k}): {e}")
+            self.stats["failed"] += len(errors)
+            if flush is not None:
+                flush()
+        return summaries
+
+# ===== 입출력 =====
+def load_articles(data_dir: str) -> list:
+    all_data = []
+    for filename in sorted(os.listdir(data_dir)):
+        if filename.endswith(".json"):
+            path = os.path.join(data_dir, filename)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, list):
+                    all_data.extend(data)
+                else:
+                    all_data.append(data)
+            except Exception as e:
+                print(f"⚠️ 파일 로드 실패: {path} -> {e}")
+    return all_data
+
+def summarize_articles(all_data: list, summarizer: BatchSummarizer, clean_workers: int = CLEAN_WORKERS) -> list:
+    """기사 dict 목록에 summary 필드를 채움"""
+    texts = [item.get("text", "") for item in all_data]
+    try:
+        results = clean_documents(texts, clean_workers)
+    except Exception as e:
+        # 한 기사 때문에 전체가 실패 → 기사별로 다시 (실패한 기사는 빈 본문 → 빈 요약)
+        print(f"⚠️ 본문 정리 실패 → 기사별로 다시 정리합니다: {e}")
+        results = []
+        for i, text in enumerate(texts):
+            try:
+                results.append(preprocess_text(text))
+            except Exception as e:
+                print(f"⚠️ 요약 실패(index={i}): {e}")
+                results.append(("", set()))
+    cleaned = [clean_text for clean_text, _ in results]
+    reporters = [reporter_names for _, reporter_names in results]
+
+    summaries = summarizer.summarize(cleaned)
+    for i, (item, summary, reporter_names) in enumerate(zip(all_data, summaries, reporters)):
+        try:
+            summary = clean_summary(summary, reporter_names)
+        except Exception as e:
+            summary = ""
+            print(f"⚠️ 요약 실패(index={i}): {e}")
+        item["summary"] = summary
+    return all_data
+
+# ===== 실행부 =====
+def main():
+    ap = argparse.ArgumentParser(description="SBERT 문서 중심 추출 요약 (기사 간 배치 인코딩)")
+    ap.add_argument("data_dir", nargs="?", default=DATA_DIR, help="입력 JSON 폴더")
+    ap.add_argument("-o", "--output", default=os.path.join(OUTPUT_DIR, OUTPUT_FILENAME))
+    ap.add_argument("-n", "--num-sentences", type=int, default=NUM_SENTENCES)
+    ap.add_argument("--batch-size", type=int, default=ENCODE_BATCH_SIZE, help="인코딩 배치 크기")
+    ap.add_argument("--article-chunk", type=int, default=ARTICLE_CHUNK, help="한꺼번에 인코딩할 기사 수")
+    ap.add_argument("--device", default=None, help="cuda / cpu (기본: 자동, 양자화 백엔드는 항상 cpu)")
+    ap.add_argument("--backend", choices=BACKENDS, default=BACKEND, help="인코더 추론 백엔드")
+    ap.add_argument("--threads", type=int, default=None, help="CPU 연산 스레드 수")
+    ap.add_argument("--clean-workers", type=int, default=CLEAN_WORKERS, help="본문 정리 프로세스 수")
+    ap.add_argument("--split-workers", type=int, default=SPLIT_WORKERS, help="KSS 문장 분리 프로세스 수")
+    ap.add_argument("--split-cache", default=SPLIT_CACHE_PATH, help="문장 분리 결과 캐시 파일 (빈 문자열이면 사용 안 함)")
+    ap.add_argument("--check-agreement", type=int, default=0, metavar="N",
+                    help="기사 N 건 표본에서 fp32 와 요약 문장 선택이 같은지 확인 (0 이면 생략)")
+    ap.add_argument("--cache-dir", default=EMBEDDING_CACHE_DIR, help="문장 임베딩 캐시 폴더")
+    ap.add_argument("--cache-capacity", type=int, default=EMBEDDING_CACHE_CAPACITY, help="캐시 최대 문장 수")
+    ap.add_argument("--no-cache", action="store_true", help="임베딩 캐시 사용 안 함")
+    args = ap.parse_args()
+
+    all_data = load_articles(args.data_dir)
+    if not all_data:
+        print("❌ JSON 데이터가 없습니다.")
+        raise SystemExit(0)
+    print(f"📄 총 기사 수: {len(all_data)}건")
+
+    encoder = SentenceEncoder(MODEL_NAME, args.device, args.batch_size, args.backend, args.threads)
+    print(f"✅ 모델 로드 완료: {encoder}")
+    if args.check_agreement and args.backend != "torch":
+        reference = SentenceEncoder(MODEL_NAME, "cpu", args.batch_size, "torch", args.threads)
+        texts = [preprocess_text(item.get("text", ""))[0] for item in all_data]
+        result = check_agreement(reference, encoder, texts, args.num_sentences, args.check_agreement)
+        print(f"🔎 fp32 대비 요약 문장 일치: 기사 {result['articles']}건 중 {result['exact_match']:.1%} 완전 일치, "
+              f"평균 겹침 {result['mean_overlap']:.1%}")
+        if result["exact_match"] < AGREEMENT_MIN:
+            print(f"⚠️ 일치율이 기준({AGREEMENT_MIN:.0%})보다 낮습니다. --backend torch 사용을 고려하세요.")
+        del reference
+    if not args.no_cache:
+        cache = EmbeddingCache(args.cache_dir, encoder.dimension, encoder.name, args.cache_capacity)
+        encoder = CachedEncoder(encoder, cache)
+        print(f"✅ 임베딩 캐시: {cache}")
+    splitter = SentenceSplitter(args.split_workers, cache_path=args.split_cache or None)
+    summarizer = BatchSummarizer(encoder, args.num_sentences, args.article_chunk, splitter)
+
+    t0 = time.perf_counter()
+    try:
+        summarize_articles(all_data, summarizer, args.clean_workers)
+    finally:
+        splitter.close()
+        if isinstance(encoder, CachedEncoder):
+            encoder.close()
+    elapsed = time.perf_counter() - t0
+    s = summarizer.stats
+    print(f"⏱️ {elapsed:.1f}초, 기사 {s['articles']}건 (요약 실패 {s['failed']}건) / 인코딩 문장 {s['encoded']}개 / 인코더 호출 {encoder.calls}회 "
+          f"({s['articles'] / elapsed if elapsed else 0:.1f} 기사/s)")
+    print(f"✂️ {splitter.report()}")
+    if isinstance(encoder, CachedEncoder):
+        c = encoder.cache.stats
+        print(f"💾 캐시 적중 {c['hits']}개 / 새로 인코딩 {c['misses']}개 / 교체 {c['evicted']}개")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(all_data, f, ensure_ascii=False, indent=4)
+    print(f"✅ {len(all_data)}건의 요약 결과 저장 완료: {args.output}")
+
+if __name__ == "__main__":
+    main()
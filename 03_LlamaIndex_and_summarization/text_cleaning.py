@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+기사 본문 / 요약문 정리 (미리 컴파일한 정규식)
+-------------------------------------------
+● 기존 preprocess_text 는 기사마다 NOISE_PATTERNS 20개를 re.sub(pat, ..., flags) 로 하나씩 적용 (본문을 20번 훑음),
+  clean_summary 는 요약마다 기자 이름 하나당 정규식 두 개를 새로 컴파일 ([가-힣] 범위 + IGNORECASE 라 컴파일이 수 ms)
+● 여기서는
+    - 잡음 규칙을 모듈 로드 때 한 번만 컴파일하고, 규칙에 꼭 필요한 글자(NOISE_RULE_LITERALS)가
+      남아 있을 때만 적용 (대부분의 기사는 20개 중 몇 개만 본문을 훑음, 적용 순서는 기존 그대로)
+    - 본문 위치마다 시도하는 비싼 정규식('영상 닫기' 절, 이메일 앞 이름)은 필요한 글자('닫기', '@')가 있을 때만 실행
+    - 기자 이름은 정규식을 만들지 않고 str.find 로 모든 이름을 찾아 '이름+직함' 한 번, '이름 단독' 한 번에 제거
+      (기존 정규식과 같은 이름 경계·왼쪽 우선 규칙, 직함은 미리 컴파일한 SUFFIX_AT_RE 로 확인)
+    - clean_documents: 여러 기사를 프로세스 풀에서 나눠 정리
+● 결과는 기존 함수와 같음 (bench 에서 일치율을 함께 출력)
+
+사용법
+  python text_cleaning.py bench [입력폴더] [--limit 5000] [--workers 4]
+"""
+import argparse, json, os, re, sys, time
+from multiprocessing import Pool
+
+CLEAN_WORKERS = os.cpu_count() or 1
+CLEAN_CHUNKSIZE = 64    # 풀 작업자에게 한 번에 넘길 기사 수
+
+# ===== 잡음 규칙 (1.one_line_summary.ipynb 의 NOISE_PATTERNS, 적용 순서 그대로) =====
+NOISE_PATTERNS = [
+    r"\(영상[^\)]*\)",
+    r"<저작권자\(c\).*?>",
+    r"무단전재\s*및\s*재배포\s*금지",
+    r"재배포\s*금지",
+    r"재판매\s*및\s*DB\s*금지",
+    r"재판매\s*금지",
+    r"DB\s*금지",
+    r"제보는\s*카카오톡.*",
+    r"구독중|구독 해지|구독|이전\s*다음",
+    r"연합뉴스\s*TV|연합\s*뉴스",
+    r"뉴스레터\s*구독.*",
+    r"ⓒ\s*연합뉴스",
+    r"송고\s*시간[:：]?\s*\d{2}:\d{2}",
+    r"기사\s*입력\s*[:：]?.*",
+    r"기자\s*=\s*",
+    r"\(서울=.*?\)\s*",
+    r"\([^)]+연합뉴스\)\s*",
+    r"\([^)]+=.*?\)\s*",
+    r"\[.*?\]",              # 대괄호 전체 제거
+    r"이미지\s*확대",
+]
+
+# 규칙마다 일치하려면 본문에 있어야 하는 글자 (NOISE_PATTERNS 와 같은 순서, 없으면 규칙을 건너뜀)
+# 모두 한글·기호라 IGNORECASE 와 상관없음. 여러 개면 그중 하나라도 있을 때 실행
+NOISE_RULE_LITERALS = [
+    ("(영상",), ("<저작권자(",), ("무단전재",), ("재배포",), ("재판매",), ("재판매",), ("금지",),
+    ("제보는",), ("구독", "이전"), ("연합",), ("뉴스레터",), ("ⓒ",), ("송고",), ("기사",),
+    ("기자",), ("(서울=",), ("연합뉴스",), ("=",), ("[",), ("이미지",),
+]
+
+# 앞 규칙이 지운 자리의 공백 때문에 뒤 규칙이 새로 일치하기도 하므로(예: 'DB (영상…)금지')
+# 규칙을 OR 로 묶지 않고 기존 순서대로 하나씩 적용
+NOISE_RULES = [(re.compile(pattern, re.IGNORECASE | re.DOTALL), literals)
+               for pattern, literals in zip(NOISE_PATTERNS, NOISE_RULE_LITERALS)]
+
+VIDEO_CLOSE_SPAN_RE = re.compile(
+    r'(?:(?<=^)|(?<=[\.\?\!。？！…\n,，;:]))\s*.*?영상\s*닫기\s*',
+    re.IGNORECASE
+)
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+INVISIBLE_RE = re.compile(r"[\u200b\u200e\u200f\ufeff]")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# 이름 패턴(한글/영문)
+NAME_PATTERN = r"(?:[가-힣][가-힣·]{1,4}(?:\s[가-힣·]{2,4})?|[A-Za-z][A-Za-z .'\-]{0,30}[A-Za-z])"
+REPORTER_SUFFIX = r"(?:기자|특파원|통신원|논설위원|평론가)"
+# 기자/직함이 붙은 경우
+REPORTER_WITH_SUFFIX_RE = re.compile(
+    rf"({NAME_PATTERN})\s*{REPORTER_SUFFIX}",
+    re.IGNORECASE
+)
+# 이메일 앞에 이름이 오는 경우
+REPORTER_BEFORE_EMAIL_RE = re.compile(
+    rf"({NAME_PATTERN})(?=\s*[<\(\[]?\s*[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{{2,}}\s*[>\)\]]?)"
+)
+SUFFIX_AT_RE = re.compile(rf"\s*{REPORTER_SUFFIX}")
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+# ===== 본문 전처리 =====
+def preprocess_text(text: str):
+    """본문 → (정리된 본문, 기자 이름 집합)"""
+    if not isinstance(text, str):
+        return "", set()
+
+    # 0) "… 영상 닫기" 절 제거
+    t = VIDEO_CLOSE_SPAN_RE.sub(" ", text) if "닫기" in text else text
+
+    # 1) 노이즈 규칙 제거 (필요한 글자가 남아 있는 규칙만)
+    for noise_re, literals in NOISE_RULES:
+        if any(lit in t for lit in literals):
+            t = noise_re.sub(" ", t)
+
+    # 2) 이메일 제거
+    t = EMAIL_RE.sub(" ", t)
+
+    # 3) 기자 이름 추출(두 계열 모두)
+    reporter_names = {m.group(1).strip() for m in REPORTER_WITH_SUFFIX_RE.finditer(text)}
+    if "@" in text:
+        reporter_names.update(m.group(1).strip() for m in REPORTER_BEFORE_EMAIL_RE.finditer(text))
+
+    # 4) 공백 정리
+    t = INVISIBLE_RE.sub("", t)
+    t = WHITESPACE_RE.sub(" ", t).strip(" ,，;:")
+
+    return t, reporter_names
+
+
+# ===== 요약 후 summary 후처리 =====
+def distinct_names(reporter_names) -> frozenset:
+    """다른 이름을 (이름 경계로) 포함하는 이름은 제외 (예: '대해 홍길동' 은 '홍길동' 이 있으면 제외)
+
+    기존처럼 이름을 하나씩 지우면 짧은 이름이 먼저 지워질 때 긴 이름은 더 이상 일치하지 않음
+    → 한 번에 지울 때도 같은 결과가 되도록 짧은 이름만 남김
+    """
+    names = {n for n in reporter_names if n}
+    return frozenset(n for n in names if not any(m != n and _contains_name(n, m) for m in names))
+
+
+def _is_name_char(c: str) -> bool:
+    return "가" <= c <= "힣" or ("a" <= c.lower() <= "z" and c.isascii()) or c == "·"
+
+
+def _contains_name(text: str, name: str) -> bool:
+    """text 안에 name 이 앞뒤가 이름 글자([가-힣A-Za-z·])가 아닌 위치에 있는지"""
+    start = text.find(name)
+    while start >= 0:
+        end = start + len(name)
+        if (start == 0 or not _is_name_char(text[start - 1])) and (end == len(text) or not _is_name_char(text[end])):
+            return True
+        start = text.find(name, start + 1)
+    return False
+
+
+def remove_names(text: str, names, with_suffix: bool = False) -> str:
+    """이름(with_suffix 면 '이름 + 직함')을 모두 지움 — 정규식을 새로 컴파일하지 않고 str.find 로 찾음
+
+    re.sub(경계 + (이름1|이름2|...) + 경계 [+ 직함]) 과 같은 결과: 왼쪽부터, 같은 위치면 긴 이름 우선,
+    겹치지 않게 지움. 직함이 붙은 경우는 영문 이름의 대소문자를 무시
+    """
+    haystack = text.translate(_ASCII_LOWER) if with_suffix else text
+    found = []
+    for rank, name in enumerate(sorted(names, key=lambda n: (-len(n), n))):
+        needle = name.translate(_ASCII_LOWER) if with_suffix else name
+        start = haystack.find(needle)
+        while start >= 0:
+            end = start + len(needle)
+            if (start == 0 or not _is_name_char(text[start - 1])) and (end == len(text) or not _is_name_char(text[end])):
+                m = SUFFIX_AT_RE.match(text, end) if with_suffix else None
+                if not with_suffix or m:
+                    found.append((start, rank, m.end() if m else end))
+            start = haystack.find(needle, start + 1)
+    if not found:
+        return text
+
+    parts, pos = [], 0
+    for start, _, end in sorted(found):
+        if start < pos:
+            continue
+        parts.append(text[pos:start])
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def clean_summary(summary: str, reporter_names: set) -> str:
+    if not isinstance(summary, str):
+        return ""
+    cleaned = summary
+
+    names = distinct_names(reporter_names)
+    if names:
+        cleaned = remove_names(cleaned, names, with_suffix=True)   # 이름+직함 제거
+        cleaned = remove_names(cleaned, names)                     # 이름 단독 제거
+
+    # 이메일 제거
+    cleaned = EMAIL_RE.sub("", cleaned)
+
+    # 공백/구두점 정리
+    cleaned = WHITESPACE_RE.sub(" ", cleaned).strip(" ,，;:")
+    return cleaned
+
+
+# ===== 여러 기사 병렬 정리 =====
+def clean_documents(texts, workers: int = CLEAN_WORKERS, chunksize: int = CLEAN_CHUNKSIZE) -> list:
+    """본문 목록 → [(정리된 본문, 기자 이름 집합)] (workers 가 1 이면 현재 프로세스에서)"""
+    texts = list(texts)
+    if workers <= 1 or len(texts) < chunksize:
+        return [preprocess_text(t) for t in texts]
+    with Pool(workers) as pool:
+        return pool.map(preprocess_text, texts, chunksize=chunksize)
+
+
+# ===== 기존 함수 (비교 기준, 노트북 코드 그대로) =====
+def legacy_preprocess_text(text: str):
+    if not isinstance(text, str):
+        return "", set()
+    t = text
+    t = VIDEO_CLOSE_SPAN_RE.sub(" ", t)
+    for pat in NOISE_PATTERNS:
+        t = re.sub(pat, " ", t, flags=re.IGNORECASE | re.DOTALL)
+    t = EMAIL_RE.sub(" ", t)
+    names_with_suffix = {m.group(1).strip() for m in REPORTER_WITH_SUFFIX_RE.finditer(text)}
+    names_before_email = {m.group(1).strip() for m in REPORTER_BEFORE_EMAIL_RE.finditer(text)}
+    reporter_names = (names_with_suffix | names_before_email)
+    t = re.sub(r"[\u200b\u200e\u200f\ufeff]", "", t)
+    t = re.sub(r"\s+", " ", t).strip(" ,，;:")
+    return t, reporter_names
+
+
+def legacy_clean_summary(summary: str, reporter_names: set) -> str:
+    if not isinstance(summary, str):
+        return ""
+    cleaned = summary
+    for name in reporter_names:
+        name_boundary = rf"(?<![가-힣A-Za-z·]){re.escape(name)}(?![가-힣A-Za-z·])"
+        cleaned = re.sub(
+            rf"{name_boundary}\s*(?:기자|특파원|통신원|논설위원|평론가)",
+            "",
+            cleaned,
+            flags=re.IGNORECASE
+        )
+        cleaned = re.sub(name_boundary, "", cleaned)
+    cleaned = EMAIL_RE.sub("", cleaned)
+    cleaned = re.sub(r"\s+", " ", cleaned).strip(" ,，;:")
+    return cleaned
+
+
+# ===== 벤치마크 =====
+def _load_texts(data_dir: str, limit: int) -> list:
+    texts = []
+    for filename in sorted(os.listdir(data_dir)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(data_dir, filename), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for item in data if isinstance(data, list) else [data]:
+            texts.append(item.get("text", ""))
+            if len(texts) >= limit:
+                return texts
+    return texts
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def bench(texts: list, workers: int):
+    # 요약 대신 본문 앞 300자를 후처리 대상으로 사용 (이름·이메일이 남아 있는 부분)
+    legacy, t_legacy = _timed(lambda: [legacy_preprocess_text(t) for t in texts])
+    compiled, t_compiled = _timed(lambda: [preprocess_text(t) for t in texts])
+    pooled, t_pool = _timed(lambda: clean_documents(texts, workers))
+    heads = [(t[:300] if isinstance(t, str) else "", names) for t, (_, names) in zip(texts, legacy)]
+    # 기존 함수는 이름 집합 순회 순서에 따라 결과가 달라지므로 짧은 이름부터 지우는 순서로 비교
+    legacy_sum, t_legacy_sum = _timed(lambda: [legacy_clean_summary(h, sorted(n, key=len)) for h, n in heads])
+    compiled_sum, t_compiled_sum = _timed(lambda: [clean_summary(h, n) for h, n in heads])
+
+    n = len(texts) or 1
+    same_text = sum(a == b for a, b in zip(legacy, compiled)) / n
+    same_sum = sum(a == b for a, b in zip(legacy_sum, compiled_sum)) / n
+    print(f"기사 {len(texts)}건")
+    print(f"  preprocess_text  기존         : {n / t_legacy:9.1f} 건/s")
+    print(f"  preprocess_text  컴파일       : {n / t_compiled:9.1f} 건/s  ({t_legacy / t_compiled:.1f}배)")
+    print(f"  preprocess_text  풀 {workers}개     : {n / t_pool:9.1f} 건/s  ({t_legacy / t_pool:.1f}배)")
+    print(f"  clean_summary    기존         : {n / t_legacy_sum:9.1f} 건/s")
+    print(f"  clean_summary    이름 한 번에  : {n / t_compiled_sum:9.1f} 건/s  ({t_legacy_sum / t_compiled_sum:.1f}배)")
+    print(f"  기존 결과와 일치: 본문 {same_text:.2%}, 요약 후처리 {same_sum:.2%}")
+    assert pooled == compiled
+
+
+def main():
+    ap = argparse.ArgumentParser(description="본문/요약 정리 정규식 엔진")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("bench", help="기존 함수와 처리 속도·결과 비교")
+    p.add_argument("data_dir", help="기사 JSON 폴더 (text 필드)")
+    p.add_argument("--limit", type=int, default=5000)
+    p.add_argument("--workers", type=int, default=CLEAN_WORKERS)
+    args = ap.parse_args()
+
+    texts = _load_texts(args.data_dir, args.limit)
+    if not texts:
+        print("❌ JSON 데이터가 없습니다.", file=sys.stderr)
+        sys.exit(1)
+    bench(texts, args.workers)
+
+
+if __name__ == "__main__":
+    main()
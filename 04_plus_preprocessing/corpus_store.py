@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+단계 간 공용 기사 코퍼스 저장소 (Parquet, 연/월 파티션)
+-----------------------------------------------------
+● 기존: 단계마다 들여쓰기된 거대한 JSON 배열을 넘기고(re_final_preprocessing.json,
+  re_final_combined_data_ten_year.json, new_combined_data_{year}.json ...), 받는 쪽은 필드 두세 개를 쓰려고
+  파일 전체를 json.load
+● 코퍼스를 year=YYYY/month=M/ 폴더로 나눈 Parquet 데이터셋으로 저장 (열마다 타입 지정)
+    id_ · pubDate(timestamp) · title · url · text · summary · category · locations(list<string>)
+● 읽는 쪽
+    - columns 로 필요한 열만 읽음 (예: 지오 병합은 id_/title/url/pubDate)
+    - start/end 날짜 조건은 파티션(year/month) 단위로 먼저 거르고, 파일 안에서는 row group 통계로 건너뜀
+    - 로컬 파일은 메모리 맵으로 열어 복사 없이 Arrow 버퍼로 사용
+● iter_corpus 는 기존 JSON 소비 코드가 그대로 쓰도록 pubDate 를 '%Y-%m-%d %H:%M:%S' 문자열로 돌려줌
+
+사용법
+  python corpus_store.py import re_final_preprocessing.json -o corpus/ [--locations 추출결과.jsonl]
+  python corpus_store.py export corpus/ -o 2024.json --start 2024-01-01 --end 2025-01-01 --columns id_ title pubDate
+  python corpus_store.py info corpus/
+"""
+import argparse, json, os, sys
+from datetime import date, datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+except ImportError:  # pip install pyarrow
+    pa = ds = fs = None
+
+from json_stream import iter_json_items, open_writer
+
+PUBDATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+WRITE_BATCH_SIZE = 10000          # 한 번에 Arrow RecordBatch 로 만들 기사 수
+MAX_ROWS_PER_GROUP = 50000        # Parquet row group 크기 (날짜 조건으로 건너뛰는 단위)
+COLUMNS = ("id_", "pubDate", "title", "url", "text", "summary", "category", "locations")
+PARTITION_COLUMNS = ("year", "month")
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("corpus_store 는 pyarrow 가 필요합니다. (pip install pyarrow)")
+
+
+def corpus_schema():
+    _require_pyarrow()
+    return pa.schema([
+        ("id_",       pa.string()),
+        ("pubDate",   pa.timestamp("s")),
+        ("title",     pa.string()),
+        ("url",       pa.string()),
+        ("text",      pa.string()),
+        ("summary",   pa.string()),
+        ("category",  pa.string()),
+        ("locations", pa.list_(pa.string())),
+        ("year",      pa.int16()),
+        ("month",     pa.int8()),
+    ])
+
+
+def partitioning():
+    return ds.partitioning(pa.schema([("year", pa.int16()), ("month", pa.int8())]), flavor="hive")
+
+
+# ────────────────────── 기사 → 행 ──────────────────────
+def parse_pubdate(value):
+    """'2024-05-01 09:00:00' / ISO 문자열 / datetime → datetime (알 수 없으면 None)"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return datetime.strptime(value.strip(), PUBDATE_FORMAT)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.strip()).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _location_names(locations):
+    if not locations:
+        return []
+    names = []
+    for loc in locations:
+        name = loc.get("name") if isinstance(loc, dict) else loc
+        if name:
+            names.append(str(name))
+    return names
+
+
+def to_record(doc: dict) -> dict:
+    """LlamaIndex Document 형식(metadata/text_resource)과 평평한 형식(title/pubDate ...) 모두 한 행으로"""
+    meta = doc.get("metadata") or {}
+    text = doc.get("text")
+    if not isinstance(text, str) or not text.strip():
+        text = (doc.get("text_resource") or {}).get("text")
+    pub = parse_pubdate(meta.get("pubDate") or doc.get("pubDate"))
+    return {
+        "id_":       doc.get("id_") or doc.get("id"),
+        "pubDate":   pub,
+        "title":     meta.get("title") or doc.get("title"),
+        "url":       meta.get("url") or doc.get("url"),
+        "text":      text if isinstance(text, str) else None,
+        "summary":   doc.get("summary"),
+        "category":  meta.get("category") or doc.get("category"),
+        "locations": _location_names(doc.get("locations")),
+        "year":      pub.year if pub else None,
+        "month":     pub.month if pub else None,
+    }
+
+
+def _record_batches(docs, schema, batch_size: int, counter: dict):
+    rows = []
+    for doc in docs:
+        rows.append(to_record(doc))
+        if len(rows) >= batch_size:
+            counter["rows"] += len(rows)
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+            rows = []
+    if rows:
+        counter["rows"] += len(rows)
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+# ────────────────────── 쓰기 ──────────────────────
+def write_corpus(docs, root: str, batch_size: int = WRITE_BATCH_SIZE) -> int:
+    """기사 iterable 을 root 아래 year=/month= Parquet 로 스트리밍 기록 → 기록한 기사 수
+
+    이번에 기록하는 연/월 파티션만 교체 (다른 달의 기존 파일은 그대로)
+    """
+    _require_pyarrow()
+    schema = corpus_schema()
+    counter = {"rows": 0}
+    ds.write_dataset(
+        _record_batches(docs, schema, batch_size, counter), root,
+        schema=schema, format="parquet", partitioning=partitioning(),
+        existing_data_behavior="delete_matching",
+        max_rows_per_group=MAX_ROWS_PER_GROUP, min_rows_per_group=min(batch_size, MAX_ROWS_PER_GROUP),
+        basename_template="part-{i}.parquet",
+    )
+    return counter["rows"]
+
+
+# ────────────────────── 읽기 ──────────────────────
+def open_corpus(root: str):
+    """메모리 맵으로 여는 Parquet 데이터셋 (연/월 파티션 열 포함)"""
+    _require_pyarrow()
+    return ds.dataset(root, format="parquet", partitioning=partitioning(),
+                      filesystem=fs.LocalFileSystem(use_mmap=True))
+
+
+def date_filter(start=None, end=None):
+    """start <= pubDate < end 조건 (파티션을 먼저 거르도록 year 조건도 함께)"""
+    start, end = parse_pubdate(start), parse_pubdate(end)
+    expr = None
+
+    def both(e):
+        return e if expr is None else expr & e
+    if start is not None:
+        expr = both(ds.field("year") >= start.year)
+        expr = both(ds.field("pubDate") >= pa.scalar(start, type=pa.timestamp("s")))
+    if end is not None:
+        expr = both(ds.field("year") <= end.year)
+        expr = both(ds.field("pubDate") < pa.scalar(end, type=pa.timestamp("s")))
+    return expr
+
+
+def read_corpus(root: str, columns=None, start=None, end=None):
+    """필요한 열·기간만 읽은 pyarrow.Table"""
+    return open_corpus(root).to_table(columns=list(columns) if columns else None,
+                                      filter=date_filter(start, end))
+
+
+def iter_corpus(root: str, columns=None, start=None, end=None, batch_size: int = WRITE_BATCH_SIZE):
+    """기사를 dict 로 한 건씩 (pubDate 는 기존 JSON 과 같은 문자열, 메모리는 배치 하나 크기)"""
+    scanner = open_corpus(root).scanner(columns=list(columns) if columns else None,
+                                        filter=date_filter(start, end), batch_size=batch_size)
+    for batch in scanner.to_batches():
+        for row in batch.to_pylist():
+            pub = row.get("pubDate")
+            if isinstance(pub, datetime):
+                row["pubDate"] = pub.strftime(PUBDATE_FORMAT)
+            yield row
+
+
+# ────────────────────── CLI ──────────────────────
+def _load_locations(path: str) -> dict:
+    """지명 추출 결과(JSONL: id_, locations) → id_ 별 지명 목록"""
+    return {obj["id_"]: obj.get("locations") for obj in iter_json_items(path) if obj.get("id_")}
+
+
+def _iter_inputs(paths, locations: dict):
+    for path in paths:
+        for doc in iter_json_items(path):
+            if locations and doc.get("id_") in locations:
+                doc["locations"] = locations[doc["id_"]]
+            yield doc
+
+
+def main():
+    ap = argparse.ArgumentParser(description="기사 코퍼스 Parquet 저장소 (연/월 파티션)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("import", help="JSON / JSONL(.gz) 기사 파일 → Parquet 데이터셋")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("-o", "--output", required=True, help="데이터셋 폴더")
+    p.add_argument("--locations", help="id_ 별 locations 를 합칠 지명 추출 결과 JSONL")
+
+    p = sub.add_parser("export", help="Parquet 데이터셋 → JSON 배열 / JSONL(.gz) (기존 단계 입력용)")
+    p.add_argument("root")
+    p.add_argument("-o", "--output", required=True)
+    p.add_argument("--columns", nargs="+", choices=COLUMNS)
+    p.add_argument("--start", help="이 날짜 이후 (포함, 예: 2024-01-01)")
+    p.add_argument("--end", help="이 날짜 이전 (미포함)")
+
+    p = sub.add_parser("info", help="파티션별 기사 수")
+    p.add_argument("root")
+    args = ap.parse_args()
+
+    try:
+        if args.command == "import":
+            locations = _load_locations(args.locations) if args.locations else {}
+            count = write_corpus(_iter_inputs(args.inputs, locations), args.output)
+            print(f"📦 {count}건 저장 완료 → {args.output}")
+        elif args.command == "export":
+            with open_writer(args.output) as out:
+                for row in iter_corpus(args.root, args.columns, args.start, args.end):
+                    out.write(row)
+            print(f"📦 {out.count}건 저장 완료 → {args.output}")
+        else:
+            table = read_corpus(args.root, columns=list(PARTITION_COLUMNS))
+            counts = table.group_by(list(PARTITION_COLUMNS)).aggregate([([], "count_all")])
+            for row in sorted(counts.to_pylist(), key=lambda r: (r["year"] or 0, r["month"] or 0)):
+                print(f"  {row['year']}-{row['month']:02d}: {row['count_all']}건" if row["year"]
+                      else f"  (날짜 없음): {row['count_all']}건")
+            print(f"전체 {table.num_rows}건")
+    except Exception as e:
+        print(f"❌ 처리 중 오류: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
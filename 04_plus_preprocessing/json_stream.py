@@ -0,0 +1,170 @@
+"""
+대용량 JSON 스트리밍 입출력
+--------------------------
+● 단계 사이에 주고받는 파일은 기사 수십만 건짜리 JSON 배열 → json.load 하면 파일 전체가 메모리에 올라감
+● iter_json_items: JSON 배열을 앞에서부터 조금씩 읽어 항목을 하나씩 돌려줌 (메모리는 항목 하나 크기)
+    - ijson 이 설치되어 있으면 사용, 없으면 표준 json.JSONDecoder.raw_decode 로 청크 단위 파싱
+    - 최상위가 객체 하나인 파일, .jsonl(한 줄에 한 건) 파일, .gz 압축 파일도 같은 방식으로 읽음
+● JsonlWriter: 한 줄에 한 건씩 바로 기록 (.gz 면 gzip 압축, 들여쓰기 없음)
+● JsonArrayWriter: 기존 결과 파일처럼 JSON 배열(indent=2)로 쓰되 한 건씩 바로 기록
+● open_writer: 경로가 .jsonl(.gz) 면 JsonlWriter, 아니면 JsonArrayWriter
+"""
+
+import gzip, json, os
+
+try:
+    import ijson
+except ImportError:  # pip install ijson (없어도 동작)
+    ijson = None
+
+CHUNK_SIZE = 1 << 20   # 1MB 씩 읽음
+_WHITESPACE = " \t\r\n"
+
+
+def open_text(path: str, mode: str = "r"):
+    """확장자가 .gz 면 gzip 텍스트 스트림"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def is_jsonl(path: str) -> bool:
+    return path.endswith(".jsonl") or path.endswith(".jsonl.gz")
+
+
+def _iter_jsonl(f):
+    for line in f:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_array_stdlib(f, chunk_size: int = CHUNK_SIZE):
+    """JSON 배열(또는 객체 하나)을 청크 단위로 읽으며 항목을 하나씩 파싱"""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip(chars):
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    skip(_WHITESPACE)
+    if pos >= len(buf):
+        return
+    if buf[pos] != "[":
+        # 최상위가 배열이 아니면 전체를 값 하나로 취급
+        rest = buf[pos:] + f.read()
+        yield json.loads(rest)
+        return
+    pos += 1
+
+    while True:
+        skip(_WHITESPACE + ",")
+        if pos >= len(buf):
+            raise ValueError("JSON 배열이 ']' 없이 끝났습니다.")
+        if buf[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+            # 청크 끝에서 잘린 숫자(예: "2." → 2)가 그대로 파싱되지 않도록
+            # 항목 뒤의 구분자(, 또는 ])까지 버퍼에 있을 때만 받아들임
+            nxt = end
+            while nxt < len(buf) and buf[nxt] in _WHITESPACE:
+                nxt += 1
+            if nxt >= len(buf) or buf[nxt] not in ",]":
+                raise json.JSONDecodeError("항목 뒤에 구분자가 없습니다", buf, nxt)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()
+            continue
+        yield item
+        pos = end
+        if pos > chunk_size:
+            buf = buf[pos:]
+            pos = 0
+
+
+def iter_json_items(path: str, chunk_size: int = CHUNK_SIZE):
+    """JSON 배열 파일의 항목(또는 객체 하나, .jsonl 의 각 줄)을 하나씩 돌려줌"""
+    if ijson is not None and not is_jsonl(path):
+        # ijson 은 바이트 스트림을 받음. 최상위 모양을 먼저 확인 (배열이 아니면 객체 하나)
+        with (gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")) as f:
+            head = f.read(1)
+            while head and head in b" \t\r\n":
+                head = f.read(1)
+            f.seek(0)
+            if head == b"[":
+                yield from ijson.items(f, "item", use_float=True)
+            elif head:
+                yield json.load(f)
+        return
+
+    with open_text(path) as f:
+        if is_jsonl(path):
+            yield from _iter_jsonl(f)
+        else:
+            yield from _iter_array_stdlib(f, chunk_size)
+
+
+class JsonlWriter:
+    """항목을 한 줄씩 바로 기록하는 writer (경로가 .gz 로 끝나면 gzip)"""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._f = open_text(path, "w")
+
+    def write(self, item):
+        self._f.write(json.dumps(item, ensure_ascii=False))
+        self._f.write("\n")
+        self.count += 1
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonArrayWriter(JsonlWriter):
+    """항목을 JSON 배열 원소로 한 건씩 바로 기록 (json.load 로 그대로 읽히는 형식)"""
+
+    def __init__(self, path: str, indent: int = 2):
+        super().__init__(path)
+        self.indent = indent
+        self._f.write("[")
+
+    def write(self, item):
+        body = json.dumps(item, ensure_ascii=False, indent=self.indent)
+        pad = " " * self.indent
+        self._f.write(",\n" if self.count else "\n")
+        self._f.write(pad + body.replace("\n", "\n" + pad))
+        self.count += 1
+
+    def close(self):
+        self._f.write("\n]" if self.count else "]")
+        super().close()
+
+
+def open_writer(path: str):
+    return JsonlWriter(path) if is_jsonl(path) else JsonArrayWriter(path)
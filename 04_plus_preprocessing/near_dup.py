@@ -0,0 +1,143 @@
+"""
+중복 / 유사 중복 기사 탐지 (64비트 지문 + MinHash LSH)
+----------------------------------------------------
+● 기존 최종 전처리는 (정규화 제목, 정규화 본문) 문자열 쌍을 통째로 seen 집합에 보관
+  → 본문이 메모리에 두 번 올라가고, 몇 글자만 고친 재송고 기사(연합뉴스는 하루 종일 수정 송고)는 못 걸러냄
+● 완전 중복: 정규화한 제목+본문의 64비트 blake2b 지문(int) 만 보관
+● 유사 중복: 본문 문자 n-gram(SHINGLE_SIZE) 집합의 MinHash 서명(NUM_PERM 개) 을 LSH 밴드로 나눠 버킷에 넣고,
+  같은 버킷에 걸린 후보끼리만 서명으로 Jaccard 유사도를 추정해 THRESHOLD 이상이면 중복
+    - 밴드 수·행 수는 THRESHOLD 에서 후보가 될 확률이 1/2 이 되도록 고름 (b·r ≤ NUM_PERM)
+    - numpy 가 있으면 서명 계산을 벡터화, 없으면 같은 식을 순수 파이썬으로 계산 (결과 동일)
+● 먼저 들어온 기사를 대표로 남기고, 중복은 대표 기사 번호와 함께 클러스터로 기록
+"""
+
+import hashlib
+import random
+import zlib
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # 없으면 순수 파이썬 (느리지만 같은 서명)
+    np = None
+
+NUM_PERM = 128        # MinHash 서명 길이
+SHINGLE_SIZE = 5      # 문자 n-gram 크기 (한국어는 어절보다 문자 단위가 재송고 수정에 강함)
+THRESHOLD = 0.8       # 유사 중복으로 볼 Jaccard 유사도
+SEED = 1
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MASK64 = (1 << 64) - 1
+_MASK32 = (1 << 32) - 1
+
+
+def fingerprint(*parts: str) -> int:
+    """문자열들의 64비트 지문 (완전 중복 검사용)"""
+    h = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return int.from_bytes(h.digest(), "little")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """문자 n-gram 의 32비트 해시 집합 (공백은 정규화되어 있다고 가정)"""
+    if len(text) <= size:
+        return {zlib.crc32(text.encode("utf-8"))} if text else set()
+    return {zlib.crc32(text[i:i + size].encode("utf-8")) for i in range(len(text) - size + 1)}
+
+
+def optimal_bands(threshold: float, num_perm: int = NUM_PERM) -> tuple:
+    """후보가 될 확률 1 - (1 - s^r)^b 의 문턱 (1/b)^(1/r) 이 threshold 에 가장 가까운 (b, r)"""
+    best = None
+    for r in range(1, num_perm + 1):
+        b = num_perm // r
+        gap = abs((1.0 / b) ** (1.0 / r) - threshold)
+        if best is None or gap < best[0]:
+            best = (gap, b, r)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """h_i(x) = ((a_i·x + b_i) mod 2^64) mod (2^61 - 1) 의 하위 32비트 최솟값을 서명으로"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = SEED):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.randrange(1, _MERSENNE_PRIME) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a = np.array(self.a, dtype=np.uint64)[:, None]
+            self._b = np.array(self.b, dtype=np.uint64)[:, None]
+
+    def signature(self, hashes: set) -> array:
+        """32비트 서명 NUM_PERM 개 (array('I') 로 기사당 NUM_PERM × 4 바이트)"""
+        if np is not None:
+            x = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))[None, :]
+            with np.errstate(over="ignore"):
+                values = (self._a * x + self._b) % np.uint64(_MERSENNE_PRIME) & np.uint64(_MASK32)
+            return array("I", values.min(axis=1).astype(np.uint32).tobytes())
+        return array("I", (min((((a * x + b) & _MASK64) % _MERSENNE_PRIME) & _MASK32 for x in hashes)
+                           for a, b in zip(self.a, self.b)))
+
+
+def estimate_jaccard(sig1, sig2) -> float:
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class NearDupIndex:
+    """완전 중복 지문 + MinHash LSH 인덱스. add() 가 중복이면 대표 기사 번호를 돌려줌"""
+
+    def __init__(self, threshold: float = THRESHOLD, num_perm: int = NUM_PERM,
+                 shingle_size: int = SHINGLE_SIZE, seed: int = SEED):
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self.exact = {}                                  # 64비트 지문 → 대표 번호
+        self.buckets = [{} for _ in range(self.bands)]   # 밴드별 (밴드 해시 → 대표 번호 목록)
+        self.signatures = {}                             # 대표 번호 → 서명 (후보 검증용)
+        self.stats = {"exact": 0, "near": 0, "candidates": 0}
+
+    def _band_keys(self, sig) -> list:
+        r = self.rows
+        return [hash(sig[i * r:(i + 1) * r].tobytes()) for i in range(self.bands)]
+
+    def add(self, key: int, title: str, text: str):
+        """정규화된 제목·본문을 key 번호로 등록 → (대표 번호, 유사도) 또는 새 기사면 None"""
+        fp = fingerprint(title, text)
+        if fp in self.exact:
+            self.stats["exact"] += 1
+            return self.exact[fp], 1.0
+
+        hashes = shingles(text, self.shingle_size)
+        if not hashes:   # 본문이 없으면 유사도 비교 없이 지문만 등록
+            self.exact[fp] = key
+            return None
+        sig = self.hasher.signature(hashes)
+        band_keys = self._band_keys(sig)
+        seen = set()
+        best = None
+        for band, bkey in zip(self.buckets, band_keys):
+            for cand in band.get(bkey, ()):
+                if cand in seen:
+                    continue
+                seen.add(cand)
+                sim = estimate_jaccard(sig, self.signatures[cand])
+                if sim >= self.threshold and (best is None or sim > best[1]):
+                    best = (cand, sim)
+        self.stats["candidates"] += len(seen)
+        if best is not None:
+            self.stats["near"] += 1
+            self.exact[fp] = best[0]   # 같은 글이 또 오면 지문으로 바로 처리
+            return best
+
+        self.exact[fp] = key
+        self.signatures[key] = sig
+        for band, bkey in zip(self.buckets, band_keys):
+            band.setdefault(bkey, []).append(key)
+        return None
+
+    def __repr__(self):
+        return (f"NearDupIndex(threshold={self.threshold}, bands={self.bands}x{self.rows}, "
+                f"shingle={self.shingle_size}, numpy={np is not None})")
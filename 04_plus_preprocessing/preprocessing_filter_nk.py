@@ -1,5 +1,15 @@
 #!/usr/bin/env python3
-import os, sys, json, argparse
+"""
+사용법
+  기존 방식 : python preprocessing_filter_nk.py 입력폴더 -o 결과.json
+  스트리밍  : python preprocessing_filter_nk.py 입력폴더 -o 결과.jsonl.gz --stream -j 4
+    - 입력 JSON 배열을 한 건씩 읽고(json_stream), 파일마다 프로세스를 나눠 처리
+    - 찾은 기사는 바로 JSONL(.gz 면 압축)로 기록 → 입력 크기와 무관하게 메모리 일정
+"""
+import os, sys, json, argparse, shutil
+from multiprocessing import Pool
+
+from json_stream import JsonlWriter, iter_json_items
 
 def _is_nk(item) -> bool:
     """제목에 '북한' 또는 '北'이 포함되면 True"""
@@ -14,12 +24,69 @@ def _filter_from_obj(data):
         return [data] if _is_nk(data) else []
     return []
 
+# ───────────── 스트리밍 모드 ─────────────
+def _part_path(output: str, index: int) -> str:
+    return f"{output}.part{index:04d}"
+
+def _stream_filter_file(task):
+    """입력 파일 하나를 스트리밍으로 읽어 매칭된 기사를 조각 파일에 기록 → (파일명, 건수, 오류)"""
+    index, fpath, output = task
+    part = _part_path(output, index)
+    if output.endswith(".gz"):
+        part += ".gz"   # 조각도 gzip 으로 써야 이어 붙였을 때 올바른 gzip 파일이 됨
+    try:
+        with JsonlWriter(part) as writer:
+            for item in iter_json_items(fpath):
+                if _is_nk(item):
+                    writer.write(item)
+        return os.path.basename(fpath), writer.count, part, None
+    except Exception as e:
+        # 기존 방식처럼 실패한 파일은 통째로 건너뜀 (중간까지 쓴 조각 파일은 지움)
+        if os.path.exists(part):
+            os.remove(part)
+        return os.path.basename(fpath), 0, None, str(e)
+
+def stream_main(input_dir: str, output: str, workers: int):
+    fnames = sorted(f for f in os.listdir(input_dir)
+                    if f.endswith((".json", ".jsonl", ".json.gz", ".jsonl.gz")))
+    tasks = [(i, os.path.join(input_dir, f), output) for i, f in enumerate(fnames)]
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+
+    total = 0
+    parts = []
+    with Pool(max(1, workers)) as pool:
+        # 파일 순서대로 결과를 받아 출력 순서를 기존 방식과 같게 유지
+        for fname, count, part, error in pool.imap(_stream_filter_file, tasks):
+            if part:
+                parts.append(part)
+            if error:
+                print(f"❌ {fname} 처리 중 오류: {error}", file=sys.stderr)
+            else:
+                print(f"✅ {fname}: 제목에 북한/北 포함 {count}건 추출")
+            total += count
+
+    # 조각 파일을 순서대로 이어 붙임 (gzip 은 멤버를 이어 붙여도 하나의 파일로 읽힘)
+    with open(output, "wb") as out:
+        for part in parts:
+            if os.path.exists(part):
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out)
+                os.remove(part)
+
+    print(f"\n📦 최종 결과 {total}건 저장 완료 → {output}")
+
 def main():
     ap = argparse.ArgumentParser(description="폴더 내 JSON 파일 전체에서 제목에 '북한'/'北'이 있으면 추출 후 합쳐 저장")
     ap.add_argument("input_dir", help="입력 JSON 디렉터리")
-    ap.add_argument("-o", "--output", required=True, help="최종 출력 JSON 파일 경로")
+    ap.add_argument("-o", "--output", required=True, help="최종 출력 JSON 파일 경로 (--stream 이면 .jsonl / .jsonl.gz 권장)")
+    ap.add_argument("--stream", action="store_true", help="스트리밍 모드: 한 건씩 읽어 JSONL 로 바로 기록")
+    ap.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="스트리밍 모드 프로세스 수")
     args = ap.parse_args()
 
+    if args.stream:
+        stream_main(args.input_dir, args.output, args.workers)
+        return
+
     results = []
 
     # 입력 폴더 내 모든 JSON 파일 순회
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+최종 전처리 (preprocessing_final_nk.ipynb 의 스크립트 버전)
+1. title 에 [북한 날씨] 가 들어가는 기사를 삭제
+2. 같은 기사 삭제
+   - 완전 중복 : 정규화한 제목+본문이 같은 기사 (64비트 지문만 보관)
+   - 유사 중복 : 본문 MinHash Jaccard 유사도가 --threshold 이상인 재송고·수정 기사 (near_dup.py)
+   - 먼저 나온 기사를 남기고, 지운 기사는 대표 기사와 함께 --clusters 파일(JSONL)에 기록
+
+사용법
+  python preprocessing_final_nk.py 입력.json(.jsonl.gz) -o 결과.json [--clusters 중복.jsonl] [--threshold 0.8]
+  --exact-only 면 기존 노트북과 같은 완전 중복 제거만 수행
+"""
+import argparse, re, sys, time, unicodedata
+
+from json_stream import JsonlWriter, iter_json_items, open_writer
+from near_dup import NUM_PERM, SHINGLE_SIZE, THRESHOLD, NearDupIndex, fingerprint
+
+# ----------------------------
+# 1. 기본 경로
+# ----------------------------
+INPUT_PATH = "preprocessing_filter_data/ten_year_dprk.json"
+OUTPUT_PATH = "preprocessing_final_data/re_final_preprocessing.json"
+CLUSTER_PATH = "preprocessing_final_data/duplicate_clusters.jsonl"
+
+# ----------------------------
+# 2. 함수 정의
+# ----------------------------
+ZERO_WIDTH_PATTERN = re.compile(r"[\u200B-\u200D\uFEFF]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# [북한날씨], [북한 날씨], <북한날씨>, <북한 날씨> 모두 매칭
+WEATHER_REGEX = re.compile(r"[\[<]북한\s*날씨[\]>]")
+
+def extract_title(doc):
+    return (doc.get("metadata", {}).get("title")
+            or doc.get("title")
+            or "")
+
+def extract_text(doc):
+    txt = doc.get("text")
+    if isinstance(txt, str) and txt.strip():
+        return txt
+    txt2 = doc.get("text_resource", {}).get("text")
+    return txt2 if isinstance(txt2, str) else ""
+
+def normalize(s: str) -> str:
+    s = unicodedata.normalize("NFKC", s)
+    s = ZERO_WIDTH_PATTERN.sub("", s)
+    return s.strip()
+
+def is_weather_tagged(title: str) -> bool:
+    t = normalize(title)
+    return bool(WEATHER_REGEX.search(t))
+
+def normalize_for_dup(s: str) -> str:
+    s = unicodedata.normalize("NFKC", s)
+    s = ZERO_WIDTH_PATTERN.sub("", s)
+    s = s.lower()
+    s = WHITESPACE_PATTERN.sub(" ", s)
+    return s.strip()
+
+# ----------------------------
+# 3. 중복 제거
+# ----------------------------
+class ExactDupIndex:
+    """기존 노트북과 같은 완전 중복 검사 (문자열 쌍 대신 64비트 지문만 보관)"""
+
+    def __init__(self):
+        self.exact = {}
+        self.stats = {"exact": 0, "near": 0, "candidates": 0}
+
+    def add(self, key, title, text):
+        fp = fingerprint(title, text)
+        if fp in self.exact:
+            self.stats["exact"] += 1
+            return self.exact[fp], 1.0
+        self.exact[fp] = key
+        return None
+
+    def __repr__(self):
+        return "ExactDupIndex()"
+
+def run(input_path, output_path, cluster_path, index):
+    removed_weather = 0
+    examples = []
+    scanned = kept = 0
+    titles = {}   # 남긴 기사 번호 → 제목 (클러스터 기록용, 본문은 보관하지 않음)
+
+    clusters = JsonlWriter(cluster_path) if cluster_path else None
+    try:
+        with open_writer(output_path) as out:
+            for idx, d in enumerate(iter_json_items(input_path)):
+                scanned += 1
+                title = extract_title(d)
+                if is_weather_tagged(title):
+                    removed_weather += 1
+                    if len(examples) < 10:
+                        examples.append(normalize(title))
+                    continue
+
+                dup = index.add(idx, normalize_for_dup(title), normalize_for_dup(extract_text(d)))
+                if dup is not None:
+                    if clusters:
+                        rep, similarity = dup
+                        clusters.write({"representative": rep, "representative_title": titles.get(rep, ""),
+                                        "duplicate": idx, "title": title,
+                                        "similarity": round(similarity, 4),
+                                        "kind": "exact" if similarity >= 1.0 else "near"})
+                    continue
+
+                titles[idx] = title
+                out.write(d)
+                kept += 1
+    finally:
+        if clusters:
+            clusters.close()
+
+    print(f"원본 문서 개수: {scanned}")
+    print(f"[북한날씨]/[북한 날씨] 제목 제거 수: {removed_weather}")
+    if examples:
+        print("제거된 제목 예시(최대 10개):")
+        for t in examples:
+            print(" -", t)
+    print(f"제거 후 문서 개수: {scanned - removed_weather}")
+    print(f"중복 제거: {index.stats['exact']}건 (완전 중복), {index.stats['near']}건 (유사 중복)  [{index}]")
+    print(f"최종 문서 개수: {kept}")
+    return kept
+
+def main():
+    ap = argparse.ArgumentParser(description="[북한 날씨] 기사 제거 + 완전/유사 중복 기사 제거")
+    ap.add_argument("input", nargs="?", default=INPUT_PATH, help="입력 JSON / JSONL(.gz) 파일")
+    ap.add_argument("-o", "--output", default=OUTPUT_PATH, help="출력 파일 (.jsonl(.gz) 면 JSONL, 아니면 JSON 배열)")
+    ap.add_argument("--clusters", default=CLUSTER_PATH, help="제거한 중복 기사와 대표 기사 기록 (JSONL, 빈 값이면 기록 안 함)")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD, help="유사 중복 Jaccard 기준")
+    ap.add_argument("--num-perm", type=int, default=NUM_PERM, help="MinHash 서명 길이")
+    ap.add_argument("--shingle", type=int, default=SHINGLE_SIZE, help="문자 n-gram 크기")
+    ap.add_argument("--exact-only", action="store_true", help="유사 중복 검사 없이 완전 중복만 제거 (기존 방식)")
+    args = ap.parse_args()
+
+    if args.exact_only:
+        index = ExactDupIndex()
+    else:
+        index = NearDupIndex(args.threshold, args.num_perm, args.shingle)
+
+    t0 = time.perf_counter()
+    try:
+        run(args.input, args.output, args.clusters or None, index)
+    except Exception as e:
+        print(f"❌ 처리 중 오류: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"전처리 완료 및 저장 경로: {args.output} ({time.perf_counter() - t0:.1f}초)")
+
+if __name__ == "__main__":
+    main()
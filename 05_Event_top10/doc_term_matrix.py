@@ -0,0 +1,114 @@
+"""
+전체 코퍼스 TF-IDF 문서-단어 행렬 (CSR, 메모리 맵)
+-----------------------------------------------
+● 기존 extract_event_phrases_auto 는 달마다 vectorizer.transform(그 달 기사) 로 토큰화부터 다시 해서
+  pre_train_vectorizer 가 전체 코퍼스를 학습할 때 이미 만들었던 행을 다시 만듦
+● 학습(또는 처음 한 번 transform)한 전체 코퍼스 행렬을 폴더에 저장
+    data.npy / indices.npy / indptr.npy : CSR 배열 (np.load(mmap_mode="r") 로 필요한 행만 디스크에서 읽음)
+    ids.json                             : 행마다 기사 id_ (코퍼스 순서) + 만든 벡터라이저 파일 크기·수정 시각
+    keys.npy                             : 행마다 분석한 본문 해시 (pos_cache.text_key, 본문이 바뀐 기사 확인용)
+                                           (n, 16) uint8 로 저장 — 'S16' 은 끝의 0 바이트를 잘라 비교가 틀어짐
+● 기간(주·달·분기·임의 구간)의 tfidf_avg 는 그 기간 기사 행만 골라 평균 → 토크나이저를 거치지 않음
+  행렬에 없거나 본문이 바뀐 기사만 vectorizer.transform 으로 보충
+"""
+
+import json, os
+
+import numpy as np
+from scipy import sparse
+
+from pos_cache import text_key
+
+KEY_SIZE = 16   # text_key 바이트 수 (blake2b digest_size)
+
+
+class DocTermMatrix:
+    """기사 id_ 순서에 맞춘 전체 코퍼스 TF-IDF CSR 행렬"""
+
+    def __init__(self, matrix, ids: list, keys: np.ndarray, source=None):
+        self.matrix = matrix
+        self.ids = ids
+        self.keys = keys
+        self.source = source    # 행렬을 만든 벡터라이저 파일 [크기, 수정 시각] (다시 학습했는지 확인용)
+        self._rows = {id_: i for i, id_ in enumerate(ids) if id_ is not None}
+        self._terms = None
+        self.stats = {"rows": 0, "transformed": 0}
+
+    @classmethod
+    def from_texts(cls, matrix, ids: list, texts: list, source=None):
+        keys = np.frombuffer(b"".join(text_key(t) for t in texts), dtype=np.uint8).reshape(-1, KEY_SIZE)
+        return cls(sparse.csr_matrix(matrix), list(ids), keys, source)
+
+    # ───────────── 저장 / 읽기 ─────────────
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        m = self.matrix
+        np.save(os.path.join(path, "data.npy"), m.data)
+        np.save(os.path.join(path, "indices.npy"), m.indices)
+        np.save(os.path.join(path, "indptr.npy"), m.indptr.astype(m.indices.dtype))
+        np.save(os.path.join(path, "keys.npy"), self.keys)
+        with open(os.path.join(path, "ids.json"), "w", encoding="utf-8") as f:
+            json.dump({"shape": list(m.shape), "source": self.source, "ids": self.ids}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str):
+        with open(os.path.join(path, "ids.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+                  for name in ("data", "indices", "indptr")]
+        matrix = sparse.csr_matrix(tuple(arrays), shape=tuple(meta["shape"]), copy=False)
+        keys = np.load(os.path.join(path, "keys.npy"))
+        if keys.dtype.kind == "S":
+            # 예전 형식(S16): 파일에는 16바이트가 그대로 있으므로 바이트 배열로 다시 봄
+            keys = keys.view(np.uint8).reshape(-1, KEY_SIZE)
+        return cls(matrix, meta["ids"], keys, meta.get("source"))
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        return os.path.exists(os.path.join(path, "ids.json"))
+
+    @staticmethod
+    def file_signature(path: str) -> list:
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+
+    # ───────────── 조회 ─────────────
+    def terms(self, vectorizer):
+        """vectorizer.get_feature_names_out() (어휘가 커서 한 번만 만듦)"""
+        if self._terms is None:
+            self._terms = vectorizer.get_feature_names_out()
+        return self._terms
+
+    def row_of(self, id_, text: str):
+        """기사의 행 번호 (없거나 본문이 바뀌었으면 None)"""
+        i = self._rows.get(id_)
+        if i is None or self.keys[i].tobytes() != text_key(text):
+            return None
+        return i
+
+    def tfidf_mean(self, ids: list, texts: list, vectorizer) -> np.ndarray:
+        """기사들의 TF-IDF 평균 벡터 (vectorizer.transform(texts).mean(axis=0) 과 같은 값)"""
+        rows, missing, order = [], [], []
+        for id_, text in zip(ids, texts):
+            i = self.row_of(id_, text)
+            if i is None:
+                order.append(-1 - len(missing))
+                missing.append(text)
+            else:
+                order.append(len(rows))
+                rows.append(i)
+        self.stats["rows"] += len(rows)
+        self.stats["transformed"] += len(missing)
+
+        Xp = self.matrix[rows]
+        if missing:
+            # 기사 순서를 그대로 두어야 평균이 transform 결과와 같은 값
+            Xp = sparse.vstack([Xp, vectorizer.transform(missing)], format="csr")
+            Xp = Xp[[o if o >= 0 else len(rows) - 1 - o for o in order]]
+        return np.asarray(Xp.mean(axis=0)).ravel()
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def __repr__(self):
+        return f"DocTermMatrix(기사 {self.matrix.shape[0]}건 × 단어 {self.matrix.shape[1]}개, nnz={self.matrix.nnz})"
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+여러 연/월 사건 구 일괄 추출 (event_keyword.py 의 월별 처리를 프로세스 풀로)
+--------------------------------------------------------------------------
+● event_keyword.py / 노트북은 input() 으로 연도 하나를 받아 12개월을 차례로 처리
+  → 2016~2025 를 다시 만들려면 열 번 따로 실행
+● 코퍼스·형태소 분석 캐시·발행일 인덱스·벡터라이저·전체 코퍼스 TF-IDF 행렬을 한 번 준비한 뒤
+  --start ~ --end 의 달마다 독립 작업으로 -j 개 프로세스에 나눠 처리
+    - 작업 프로세스는 fork 로 띄워 준비한 자료(읽기 전용)를 복사 없이 공유
+      (형태소 분석은 미리 OktPool 작업자에서 끝내므로 이 프로세스에는 JVM 이 없음)
+    - 결과 파일은 event_keyword.py 와 같음: {year}_{month:02d}_keywords.json, {year}_keywords_by_month_all.json
+      (일부 달만 처리한 연도는 기존 연간 파일에 이번 달 결과를 합쳐 저장)
+    - 각 달의 자세한 출력은 생략하고 끝난 달마다 한 줄씩 출력
+    - 한 달이 실패해도 나머지 달은 계속 처리하고 연간 파일도 저장, 끝에 실패한 달을 모아 보여 주고 종료 코드 1
+
+사용법
+  python event_batch.py --start 2016-01 --end 2025-12 [-j 8] [--input re_final_preprocessing.json] [--output-dir 폴더]
+"""
+import argparse, json, os, sys, time
+from multiprocessing import get_context
+
+import event_keyword as ek
+from month_index import load_month_index
+from okt_pool import JVM_HEAP_MB, OKT_WORKERS
+from pos_cache import PosCache
+
+BATCH_WORKERS = os.cpu_count() or 1
+
+# fork 한 작업 프로세스가 공유하는 읽기 전용 자료 (prepare 에서 채움)
+_shared = {}
+
+
+def parse_month(value: str):
+    """'2024-05' / '2024.5' / '202405' → (2024, 5)"""
+    digits = value.replace("-", "").replace(".", "").replace("/", "")
+    if len(digits) == 5:
+        digits = digits[:4] + "0" + digits[4]
+    if len(digits) != 6 or not digits.isdigit() or not 1 <= int(digits[4:]) <= 12:
+        raise argparse.ArgumentTypeError(f"연-월 형식이 아닙니다: {value} (예: 2024-05)")
+    return int(digits[:4]), int(digits[4:])
+
+
+def month_range(start, end):
+    (year, month), months = start, []
+    while (year, month) <= end:
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _init_worker():
+    # 여러 달이 동시에 출력하면 뒤섞이므로 작업 프로세스의 자세한 출력은 버림 (오류는 _run_month 가 부모로 전달)
+    sys.stdout = sys.stderr = open(os.devnull, "w")
+
+
+def _run_month(task):
+    """(연, 월, 사건 구 목록, 걸린 시간, 오류) — 한 달이 실패해도 다른 달은 계속하도록 예외는 문자열로 돌려줌"""
+    year, month = task
+    s = _shared
+    t0 = time.perf_counter()
+    try:
+        events = ek.process_month(year, month, s["articles"], s["vectorizer"], s["output_dir"],
+                                  s["month_index"], s["doc_terms"])
+    except Exception as e:
+        return year, month, None, time.perf_counter() - t0, f"{type(e).__name__}: {e}"
+    return year, month, events, time.perf_counter() - t0, None
+
+
+def prepare(args):
+    """코퍼스와 공유 자료를 준비해 _shared 에 넣음"""
+    print("📖 전체 기사 데이터를 로드하는 중...")
+    articles = ek.load_all_articles(args.input)
+    if not articles:
+        raise SystemExit("전체 코퍼스를 로드할 수 없습니다.")
+
+    cache = PosCache(args.pos_cache)
+    ek.prepare_pos_cache(articles, cache, args.okt_workers, args.jvm_heap)
+    month_index = load_month_index(args.input, articles)
+    print(f"📅 발행일 인덱스: {month_index}")
+    vectorizer = ek.pre_train_vectorizer(articles, args.vectorizer, args.doc_terms)
+    doc_terms = ek.load_doc_term_matrix(articles, vectorizer, args.vectorizer, args.doc_terms)
+    doc_terms.terms(vectorizer)   # 작업 프로세스마다 다시 만들지 않도록 미리
+    print(f"🧮 {doc_terms}")
+    cache.close()   # 분석 결과는 메모리에 남아 있음 (작업 프로세스는 SQLite 를 쓰지 않음)
+
+    _shared.update(articles=articles, vectorizer=vectorizer, month_index=month_index,
+                   doc_terms=doc_terms, output_dir=args.output_dir)
+
+
+def write_year_summaries(results: dict, output_dir: str):
+    """연도별 {year}_keywords_by_month_all.json (이번에 처리하지 않은 달은 기존 파일 내용 유지)"""
+    for year in sorted({y for y, _ in results}):
+        summary_file = os.path.join(output_dir, f"{year}_keywords_by_month_all.json")
+        monthly = {}
+        if os.path.exists(summary_file):
+            with open(summary_file, encoding="utf-8") as f:
+                monthly = json.load(f)
+        for (y, m), events in results.items():
+            if y == year:
+                monthly[f"{y}_{m:02d}"] = events
+        with open(summary_file, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(monthly.items())), f, ensure_ascii=False, indent=2)
+        print(f"📊 연간 종합 결과: '{summary_file}'")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="여러 연/월 사건 구 추출 (달 단위 병렬)")
+    ap.add_argument("--start", type=parse_month, required=True, help="시작 연-월 (예: 2016-01)")
+    ap.add_argument("--end", type=parse_month, required=True, help="끝 연-월 (포함, 예: 2025-12)")
+    ap.add_argument("-j", "--workers", type=int, default=BATCH_WORKERS, help="동시에 처리할 달 수 (프로세스)")
+    ap.add_argument("--input", default=ek.FILE_PATH, help="전처리 완료 기사 JSON")
+    ap.add_argument("--output-dir", default=ek.OUTPUT_DIR)
+    ap.add_argument("--vectorizer", default=ek.TFIDF_VECTORIZER_PATH, help="전체 코퍼스 TF-IDF 벡터라이저 (.pkl)")
+    ap.add_argument("--doc-terms", default=ek.DOC_TERMS_PATH, help="전체 코퍼스 TF-IDF 행렬 폴더")
+    ap.add_argument("--pos-cache", default=ek.POS_CACHE_PATH, help="형태소 분석 결과 캐시 파일")
+    ap.add_argument("--okt-workers", type=int, default=OKT_WORKERS, help="Okt 작업자 프로세스 수")
+    ap.add_argument("--jvm-heap", type=int, default=JVM_HEAP_MB, help="작업자 JVM 최대 힙 (MB)")
+    args = ap.parse_args()
+
+    months = month_range(args.start, args.end)
+    if not months:
+        ap.error("--start 가 --end 보다 늦습니다.")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    t0 = time.perf_counter()
+    prepare(args)
+    if ek.okt is not None:
+        print("⚠️ 이 프로세스에서 JVM 을 띄웠습니다. fork 한 작업 프로세스에서 Okt 를 부르지 않도록 --okt-workers 를 1 이상으로 두세요.")
+    print(f"\n🚀 {len(months)}개월 ({months[0][0]}-{months[0][1]:02d} ~ {months[-1][0]}-{months[-1][1]:02d}) "
+          f"사건 구 추출을 시작합니다... (프로세스 {args.workers}개, 준비 {time.perf_counter() - t0:.1f}초)")
+
+    results, failed = {}, {}
+    workers = max(1, min(args.workers, len(months)))
+    with get_context("fork").Pool(workers, initializer=_init_worker) as pool:
+        for n, (year, month, events, elapsed, error) in enumerate(pool.imap_unordered(_run_month, months), 1):
+            if error is not None:
+                failed[(year, month)] = error
+                print(f"[{n}/{len(months)}] {year}-{month:02d}: ❌ 실패 ({error}) {elapsed:.1f}초")
+                continue
+            results[(year, month)] = events
+            top = events[0][0] if events else "-"
+            print(f"[{n}/{len(months)}] {year}-{month:02d}: 사건 구 {len(events)}개 (1위: {top}) {elapsed:.1f}초")
+
+    write_year_summaries(results, args.output_dir)   # 실패한 달은 기존 연간 파일 내용 유지
+    print(f"\n🎉 {len(results)}/{len(months)}개월 사건 구 추출 완료 ({time.perf_counter() - t0:.1f}초)")
+    print(f"📁 결과 파일들이 '{args.output_dir}' 디렉토리에 저장되었습니다.")
+    if failed:
+        print(f"❌ 실패한 달 {len(failed)}개:")
+        for (year, month), error in sorted(failed.items()):
+            print(f"   {year}-{month:02d}: {error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+핵심이슈 키워드 월별 추출 (1.Event_keyword.ipynb 1번 셀의 스크립트 버전)
+---------------------------------------------------------------------
+● 행동 동사/행위 명사 학습 → 사건 구 후보 생성 → 전체 코퍼스 TF-IDF 와 문서 수 결합 순위는 노트북과 같음
+● Okt 형태소 분석은 기사마다 한 번만: 먼저 모든 기사를 분석해 pos_cache 에 저장하고
+  learn_action_lexicons / extract_event_phrases_auto / tokenizer_for_vectorizer 가 모두 캐시에서 읽음
+  (--pos-cache 파일에 남으므로 다음 실행·다른 연도에서는 Okt 를 거의 부르지 않음)
+● 처음 분석은 okt_pool 의 작업자 --okt-workers 개가 각자 JVM(--jvm-heap MB)을 띄워 나눠 처리
+  (JVM 이 죽어도 작업자만 다시 띄워 이어감, 0 이면 기존처럼 현재 프로세스에서 분석)
+● 달별 TF-IDF 평균은 전체 코퍼스 문서-단어 행렬(doc_term_matrix, --doc-terms 폴더)에서 그 달 기사 행만 골라 계산
+  (벡터라이저 학습 때 함께 저장, 기존 pkl 만 있으면 처음 한 번 transform 해서 저장)
+● 달별 기사 선택은 month_index 의 발행일 인덱스로 (날짜는 코퍼스 전체에서 한 번만 파싱, 코퍼스 옆 .month_index.npz)
+
+사용법
+  python event_keyword.py [--input re_final_preprocessing.json] [--year 2024] [--output-dir 폴더]
+  --year 를 빼면 노트북처럼 실행 중에 연도를 물어봄
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from tqdm import tqdm
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+import joblib
+import calendar
+
+from doc_term_matrix import DocTermMatrix
+from month_index import MonthIndex, extract_pubdate, load_month_index, parse_date
+from okt_pool import JVM_HEAP_MB, OKT_WORKERS, OktPool
+from pos_cache import PosCache
+
+# =========================
+# 설정
+# =========================
+FILE_PATH = '/home/ds4_sia_nolb/#FINAL_POLARIS/04_plus_preprocessing/preprocessing_final_data/re_final_preprocessing.json'
+OUTPUT_DIR = '/home/ds4_sia_nolb/#FINAL_POLARIS/05_Event_top10/re_monthly_results'
+TFIDF_VECTORIZER_PATH = '/home/ds4_sia_nolb/#FINAL_POLARIS/05_Event_top10/re_idf_vectorizer_for_all_corpus.pkl'
+POS_CACHE_PATH = '/home/ds4_sia_nolb/#FINAL_POLARIS/05_Event_top10/pos_cache.sqlite'
+DOC_TERMS_PATH = '/home/ds4_sia_nolb/#FINAL_POLARIS/05_Event_top10/re_idf_doc_terms'   # 전체 코퍼스 TF-IDF 행렬 폴더
+
+# =========================
+# 형태소 분석기 (+ 분석 결과 캐시)
+# =========================
+okt = None          # JVM 은 캐시에 없는 기사를 처음 분석할 때 띄움
+pos_cache = None    # use_pos_cache 로 지정한 PosCache
+
+def get_okt():
+    global okt
+    if okt is None:
+        from konlpy.tag import Okt
+        okt = Okt()
+    return okt
+
+def use_pos_cache(cache):
+    global pos_cache
+    pos_cache = cache
+
+def okt_pos(text: str):
+    """okt.pos(text, norm=True, stem=True) (캐시에 있으면 캐시에서)"""
+    if pos_cache is not None:
+        p = pos_cache.get(text)
+        if p is not None:
+            return p
+    p = get_okt().pos(text, norm=True, stem=True)
+    if pos_cache is not None:
+        pos_cache.put(text, p)
+    return p
+
+# =========================
+# 기사 로드 및 필터링 유틸
+# =========================
+def load_all_articles(file_path):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("JSON 루트는 list 여야 합니다.")
+        return data
+    except FileNotFoundError:
+        print(f"파일을 찾을 수 없습니다: {file_path}")
+        return None
+    except json.JSONDecodeError as e:
+        print(f"JSON 파싱 오류: {e}")
+        return None
+    except Exception as e:
+        print(f"알 수 없는 오류가 발생했습니다: {e}")
+        return None
+
+def filter_articles_by_period(articles, start_date_str, end_date_str):
+    sdt = parse_date(start_date_str)
+    edt = parse_date(end_date_str)
+    
+    period_articles = []
+    
+    all_articles_count = len(articles)
+    
+    for article in tqdm(articles, desc=f"기사 처리 중 ({sdt.date()}~{edt.date()})", leave=False):
+        pub_date = extract_pubdate(article)
+        if pub_date and sdt <= pub_date <= edt:
+            period_articles.append(article)
+    
+    print(f"총 {all_articles_count}개의 기사 중 지정 기간 내 기사 {len(period_articles)}개를 찾았습니다.")
+    
+    return period_articles
+
+# =========================
+# 텍스트 정규화 (표기 통일 약간)
+# =========================
+def normalize_text(t: str) -> str:
+    if not t:
+        return ""
+    t = t.replace("탄도 미사일", "탄도미사일")
+    t = t.replace("순항 미사일", "순항미사일")
+    t = t.replace("극초 음속", "극초음속")
+    t = t.replace("초대형 방사포", "초대형방사포")
+    return t
+
+# =========================
+# 불용어 & 뉴스 노이즈
+# =========================
+BASE_STOP = set([
+    '가','간','같은','같이','것','게다가','결국','곧','관하여','관련','관한','그','그것','그녀','그들',
+    '그리고','그때','그래','그래서','그러나','그러므로','그러한','그런','그렇게','그외','근거로','기타',
+    '까지도','까지','나','남들','너','누구','다','다가','다른','다만','다소','다수','다시','다음','단','단지',
+    '당신','대','대해서','더군다나','더구나','더라도','더욱이','도','도로','또','또는','또한','때','때문',
+    '라도','라면','라는','로','로부터','로써','를','마저','마치','만약','만일','만큼','모두','무엇','무슨',
+    '무척','물론','및','밖에','바로','보다','뿐이다','사람','사실은','상대적으로','생각','설령','소위','수',
+    '수준','쉽게','시대','시작하여','실로','실제','아니','아무','아무도','아무리','아마도','아울러','아직',
+    '앞에서','앞으로','어느','어떤','어떻게','어디','언제','얼마나','여기','여부','역시','예','오히려',
+    '와','왜','외에도','요','우리','우선','원래','위해서','으로','으로부터','으로써','을','의','의거하여',
+    '의지하여','의해','의해서','의하여','이','이것','이곳','이때','이라고','이러한','이런','이렇게','이제',
+    '이지만','이후','이상','이다','이전','인','일','일단','일반적으로','임시로','입장에서','자','자기','자신',
+    '잠시','저','저것','저기','저쪽','저희','전부','전혀','점에서','정도','제','조금','좀','주로','주제','즉',
+    '즉시','지금','진짜로','차라리','참','참으로','첫번째로','최고','최대','최소','최신','최초','통하여',
+    '통해서','평가','포함한','포함하여','하지만','하면서','하여','한','한때','한번','할','할것이다','할수있다',
+    '함께','해도', 
+    # 아래 키워드는 idf_vectorizer_for_all_corpus.pkl파일 생성 이후 추가된 불용어임. BASE_STOP에 있으면 pkl파일로 인해 미적용 되기 때문에 ENTITY_NOISE에 추가하였음.
+    # '돼다', '서다', '대해', '나오다', '통해', '맞다', '대한', '위해', '기상청', '예보', '밝히다', '크다', '약간', '가다', '내리다', '받다', '기온'
+])
+
+NEWS_STOP = {"기자","연합뉴스","사진","속보","종합","자료","영상","단독","전문","인터뷰","브리핑"}
+
+# =========================
+# 엔터티 노이즈
+# =========================
+ENTITY_NOISE = {
+    "북한","한국","대한민국","남한","미국","중국","일본","러시아","우크라이나","유엔","나토","NATO","EU","유럽연합",
+    "푸틴","블라디미르 푸틴","바이든","조 바이든","시진핑","김정은","김여정","문재인","윤석열","쇼이구","젤렌스키", "중앙", "통신", "보도", 
+    # 아래 키워드는 BASE_STOP에 있어야하지만 잠시 옮겨옴.
+    '돼다', '서다', '대해', '나오다', '통해', '맞다', '대한', '위해', '기상청', '예보', '밝히다', '크다', '약간', '가다', '내리다', '받다', '기온',
+    '강수', '날씨', '소식통', '인용', '대체로', '이번', '들다', '들어', '올해', 
+
+}
+
+# =========================
+# 토큰/텍스트
+# =========================
+def pos_tokens(text: str):
+    text = normalize_text(text or "")
+    return okt_pos(text)
+
+def doc_text(a) -> str:
+    # 수정: metadata의 title과 최상위 summary를 함께 사용
+    # (summary 가 None 이면 빈 문자열: 사건 구 추출과 TF-IDF 가 같은 문자열을 분석하도록)
+    title = (a.get('metadata') or {}).get('title', '')
+    summary = a.get('summary', '') or ''
+    return normalize_text(f"{title} {summary}")
+
+def tokenizer_for_vectorizer(s: str):
+    toks = []
+    for w, t in okt_pos(s):
+        if t not in ("Noun", "Verb"):
+            continue
+        if len(w) <= 1:
+            continue
+        if w in BASE_STOP or w in NEWS_STOP:
+            continue
+        if w.isdigit():
+            continue
+        toks.append(w)
+    return toks
+
+# =========================
+# 자동 학습: '행동 동사'와 '행위 명사'
+# =========================
+def learn_action_lexicons(articles, min_df_ratio_verbs=0.002, min_df_ratio_nouns=0.002):
+    verb_doc_df = Counter()
+    action_noun_df = Counter()
+    N_docs = len(articles)
+
+    for a in tqdm(articles, desc="행동 동사/행위명사 학습 중", leave=False):
+        p = pos_tokens(doc_text(a))
+
+        verbs_in_doc = set()
+        action_nouns_in_doc = set()
+
+        for i, (w, t) in enumerate(p):
+            if t == "Verb":
+                verbs_in_doc.add(w)
+            if t == "Noun":
+                ahead = [p[j][0] for j in range(i+1, min(i+3, len(p)))]
+                if "하다" in ahead or "되다" in ahead:
+                    if w not in BASE_STOP and len(w) > 1:
+                        action_nouns_in_doc.add(w)
+
+        for v in verbs_in_doc:
+            verb_doc_df[v] += 1
+        for n in action_nouns_in_doc:
+            action_noun_df[n] += 1
+
+    min_df_verbs = max(5, int(N_docs * min_df_ratio_verbs))
+    min_df_nouns = max(5, int(N_docs * min_df_ratio_nouns))
+
+    drop_verbs = {"하다","되다","이다","있다"}
+    verb_set = {v for v,df in verb_doc_df.items() if df >= min_df_verbs and v not in drop_verbs}
+    action_nouns = {n for n,df in action_noun_df.items() if df >= min_df_nouns}
+
+    print(f"학습 결과: 행동동사 {len(verb_set)}개, 행위명사 {len(action_nouns)}개")
+    return verb_set, action_nouns
+
+# =========================
+# 사건 구 후보 생성 + TF-IDF 결합 랭킹
+# =========================
+def nominalize_verb(v: str) -> str:
+    if v.endswith("하다"):
+        return v[:-2]
+    if v.endswith("되다"):
+        return v[:-2]
+    return v
+
+def extract_event_phrases_auto(articles, top_k=30, vectorizer=None, doc_terms=None):
+    N = len(articles)
+    if N == 0:
+        print("⚠ 지정 기간에 기사가 없습니다.")
+        return []
+
+    print(f"지정 기간 내 기사 수: {N}개")
+    
+    verb_set, action_nouns = learn_action_lexicons(articles)
+
+    phrase_df = Counter()
+    phrase_examples = defaultdict(list)
+
+    for a in tqdm(articles, desc="사건 구 자동 추출 중", leave=False):
+        # 수정: metadata에서 title을 가져옴
+        title = (a.get('metadata') or {}).get('title', '')
+        p = pos_tokens(doc_text(a))
+        phrases_in_doc = set()
+
+        prev_nouns = []
+        L = len(p)
+        for i, (w, t) in enumerate(p):
+            if t == "Noun":
+                if w not in BASE_STOP and len(w) > 1:
+                    prev_nouns.append(w)
+                    if len(prev_nouns) > 5:
+                        prev_nouns = prev_nouns[-5:]
+
+            if t == "Verb" and w in verb_set:
+                vnom = nominalize_verb(w)
+                nn = [n for n in reversed(prev_nouns)][:2]
+                if nn:
+                    phrases_in_doc.add(f"{nn[0]} {vnom}".strip())
+                    if len(nn) >= 2:
+                        phrases_in_doc.add(f"{nn[1]} {nn[0]} {vnom}".strip())
+                else:
+                    phrases_in_doc.add(vnom.strip())
+
+            if t == "Noun" and w in action_nouns:
+                nn = [n for n in reversed(prev_nouns) if n != w][:2]
+                base = w
+                if nn:
+                    phrases_in_doc.add(f"{nn[0]} {base}".strip())
+                    if len(nn) >= 2:
+                        phrases_in_doc.add(f"{nn[1]} {nn[0]} {base}".strip())
+                else:
+                    phrases_in_doc.add(base.strip())
+
+                if i+1 < L and p[i+1][1] == "Noun" and p[i+1][0] in action_nouns:
+                    tail = p[i+1][0]
+                    if nn:
+                        phrases_in_doc.add(f"{nn[0]} {base} {tail}".strip())
+                        if len(nn) >= 2:
+                            phrases_in_doc.add(f"{nn[1]} {nn[0]} {base} {tail}".strip())
+                    else:
+                        phrases_in_doc.add(f"{base} {tail}".strip())
+
+        cleaned = set()
+        for ph in phrases_in_doc:
+            ph = re.sub(r"\s+", " ", ph).strip()
+            if len(ph.split()) == 1 and len(ph) <= 2:
+                continue
+            cleaned.add(ph)
+
+        for ph in cleaned:
+            phrase_df[ph] += 1
+            # 수정: title이 존재할 때만 examples에 추가
+            if len(phrase_examples[ph]) < 3 and title:
+                phrase_examples[ph].append(title)
+
+    if vectorizer is None:
+        print("[오류] TfidfVectorizer 객체가 전달되지 않았습니다.")
+        return []
+
+    corpus_period = [doc_text(a) for a in articles]
+    if doc_terms is not None:
+        # 전체 코퍼스 행렬에서 이 기간 기사 행만 평균 (다시 토큰화하지 않음)
+        tfidf_avg = doc_terms.tfidf_mean([a.get('id_') for a in articles], corpus_period, vectorizer)
+        terms = doc_terms.terms(vectorizer)
+    else:
+        Xp = vectorizer.transform(corpus_period)
+        tfidf_avg = np.asarray(Xp.mean(axis=0)).ravel()
+        terms = vectorizer.get_feature_names_out()
+    tfidf_dict = {terms[i]: float(tfidf_avg[i]) for i in np.where(tfidf_avg > 0)[0]}
+
+    print(f"TF-IDF 코퍼스: {len(corpus_period)}개 문서")
+    print(f"TF-IDF 용어수: {len(terms)}")
+
+    def is_entity_only(ph: str) -> bool:
+        toks = ph.split()
+        if len(toks) <= 2 and any(ent in ph for ent in ENTITY_NOISE):
+            return True
+        ent_hits = sum(1 for t in toks if any(ent in t for ent in ENTITY_NOISE))
+        return (ent_hits >= max(1, len(toks) - 1))
+
+    def generic_penalty(ph: str) -> int:
+        generic = {"대통령","위원장","정부","당국","관계자","대변인","회의","논의","강조"}
+        return -sum(1 for t in ph.split() if t in generic)
+
+    def phrase_score(ph: str, df_cnt: int) -> float:
+        tfidf = tfidf_dict.get(ph, 0.0)
+        score = 0.6 * tfidf + 0.4 * float(df_cnt)
+
+        if is_entity_only(ph):
+            score -= 6.0
+        score += generic_penalty(ph)
+        if len(ph.split()) <= 2:
+            score -= 1.5
+        return score
+
+    scored = []
+    for ph, cnt in phrase_df.items():
+        if is_entity_only(ph):
+            continue
+        scored.append( (ph, cnt, phrase_score(ph, cnt)) )
+
+    scored.sort(key=lambda x: (x[2], x[1]), reverse=True)
+    ranked = [(ph, cnt, score, phrase_examples.get(ph, [])) for ph, cnt, score in scored[:top_k]]
+    return ranked
+
+# =========================
+# 전체 코퍼스용 TF-IDF 벡터라이저 사전 학습
+# =========================
+def load_vectorizer(path):
+    """저장된 벡터라이저 (노트북에서 저장한 pkl 은 __main__.tokenizer_for_vectorizer 를 찾음)
+
+    불러온 뒤 tokenizer 를 이 모듈의 함수로 바꿔 형태소 분석 캐시를 쓰게 함
+    """
+    main = sys.modules['__main__']
+    if not hasattr(main, 'tokenizer_for_vectorizer'):
+        main.tokenizer_for_vectorizer = tokenizer_for_vectorizer
+    vectorizer = joblib.load(path)
+    vectorizer.tokenizer = tokenizer_for_vectorizer
+    return vectorizer
+
+def pre_train_vectorizer(articles, save_path, doc_terms_path=None):
+    """doc_terms_path 가 있으면 새로 학습할 때 전체 코퍼스 행렬(fit_transform 결과)도 함께 저장"""
+    if os.path.exists(save_path):
+        print(f"✔️ 기존 TF-IDF 벡터라이저 파일 '{save_path}'이 이미 존재합니다. 학습을 건너뜁니다.")
+        return load_vectorizer(save_path)
+    
+    print(f"🔍 전체 코퍼스용 TF-IDF 벡터라이저를 새로 학습합니다.")
+    
+    full_corpus = [doc_text(a) for a in articles]
+    
+    vectorizer = TfidfVectorizer(
+        tokenizer=tokenizer_for_vectorizer,
+        ngram_range=(1, 3),
+        min_df=5,
+        max_df=0.85,
+        sublinear_tf=True,
+        norm='l2'
+    )
+    if doc_terms_path:
+        X = vectorizer.fit_transform(full_corpus)
+    else:
+        vectorizer.fit(full_corpus)
+    joblib.dump(vectorizer, save_path)
+    print(f"✅ 전체 코퍼스 기반 TF-IDF 벡터라이저를 '{save_path}'에 저장했습니다.")
+    if doc_terms_path:
+        DocTermMatrix.from_texts(X, [a.get('id_') for a in articles], full_corpus,
+                                 DocTermMatrix.file_signature(save_path)).save(doc_terms_path)
+        print(f"✅ 전체 코퍼스 TF-IDF 행렬을 '{doc_terms_path}'에 저장했습니다.")
+    return vectorizer
+
+def load_doc_term_matrix(articles, vectorizer, vectorizer_path, doc_terms_path):
+    """저장된 전체 코퍼스 행렬 (없거나 벡터라이저를 다시 학습했으면 transform 한 번으로 새로 만듦)"""
+    signature = DocTermMatrix.file_signature(vectorizer_path)
+    if DocTermMatrix.exists(doc_terms_path):
+        doc_terms = DocTermMatrix.load(doc_terms_path)
+        if doc_terms.source == signature:
+            return doc_terms
+    print(f"🔍 전체 코퍼스 TF-IDF 행렬을 만듭니다 → '{doc_terms_path}'")
+    full_corpus = [doc_text(a) for a in articles]
+    DocTermMatrix.from_texts(vectorizer.transform(full_corpus), [a.get('id_') for a in articles],
+                             full_corpus, signature).save(doc_terms_path)
+    return DocTermMatrix.load(doc_terms_path)
+
+# =========================
+# 형태소 분석 캐시 채우기 (기사마다 한 번)
+# =========================
+def prepare_pos_cache(articles, cache, workers=OKT_WORKERS, heap_mb=JVM_HEAP_MB):
+    """캐시에 없는 기사를 모두 분석해 두고 use_pos_cache 로 지정
+
+    workers > 0 이면 OktPool 작업자(각자 JVM)에서 분석. 끝내 분석하지 못한 기사는 빈 결과로 둠 (저장 안 함)
+    """
+    todo = cache.missing((a.get('id_'), doc_text(a)) for a in articles)
+    print(f"🔤 형태소 분석 캐시: {cache} → 새로 분석할 기사 {len(todo)}건")
+    if workers > 0 and todo:
+        with OktPool(workers, heap_mb) as pool:
+            results = pool.pos_many([text for _, text in todo])
+            for n, (i, p) in enumerate(tqdm(results, total=len(todo), desc="형태소 분석 중", leave=False), 1):
+                id_, text = todo[i]
+                cache.put(text, p or [], id_, persist=p is not None)
+                if n % 10000 == 0:
+                    cache.flush()
+        s = pool.stats
+        if s["restarts"]:
+            print(f"⚠️ Okt 작업자 재시작 {s['restarts']}회, 분석 실패 기사 {s['failed']}건")
+    else:
+        for n, (id_, text) in enumerate(tqdm(todo, desc="형태소 분석 중", leave=False), 1):
+            cache.put(text, get_okt().pos(text, norm=True, stem=True), id_)
+            if n % 10000 == 0:
+                cache.flush()
+    cache.flush()
+    use_pos_cache(cache)
+
+# =========================
+# 월별 자동 처리 함수
+# =========================
+def process_month(year, month, all_articles, vectorizer, output_dir=OUTPUT_DIR, month_index=None,
+                  doc_terms=None):
+    """한 달의 사건 구를 추출해 {year}_{month:02d}_keywords.json 에 저장하고 결과 목록을 돌려줌"""
+    if month_index is None:
+        month_index = MonthIndex.build(all_articles)
+
+    print(f"\n{'='*50}")
+    print(f"📅 {year}년 {month}월 키워드 추출 중...")
+    print(f"{'='*50}")
+    
+    start_date = f"{year}-{month:02d}-01"
+    last_day = calendar.monthrange(year, month)[1]
+    end_date = f"{year}-{month:02d}-{last_day:02d}"
+    
+    # 기존 필터와 같은 기간 (end_date 는 말일 0시까지)
+    monthly_articles = month_index.select(all_articles, start_date, end_date)
+    print(f"총 {len(all_articles)}개의 기사 중 지정 기간 내 기사 {len(monthly_articles)}개를 찾았습니다.")
+    
+    if not monthly_articles:
+        print(f"⚠️ {year}년 {month}월에 기사가 없습니다.")
+        return []
+    
+    events = extract_event_phrases_auto(
+        monthly_articles,
+        top_k=30,
+        vectorizer=vectorizer,
+        doc_terms=doc_terms
+    )
+    
+    print(f"\n=== {year}년 {month}월 '사건 구' TOP 30 (TF-IDF + DF 결합) ===")
+    if not events:
+        print(f"{year}년 {month}월에 추출된 사건 구가 없습니다.")
+    else:
+        for i, (ph, cnt, score, examples) in enumerate(events[:10], 1):
+            print(f"{i}. {ph}   (점수={score:.2f}, 문서수={cnt})")
+    
+    output_file = os.path.join(output_dir, f"{year}_{month:02d}_keywords.json")
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'year': year,
+            'month': month,
+            'period': f"{start_date} ~ {end_date}",
+            'total_articles': len(monthly_articles),
+            'keywords': [{'phrase': ph, 'doc_count': cnt, 'score': round(score, 2), 'examples': examples} 
+                         for ph, cnt, score, examples in events]
+        }, f, ensure_ascii=False, indent=2)
+    
+    print(f"💾 결과가 '{output_file}'에 저장되었습니다.")
+    return events
+
+def process_monthly_keywords(year, all_articles, vectorizer, output_dir=OUTPUT_DIR, month_index=None,
+                             doc_terms=None):
+    """지정된 연도의 모든 월에 대해 키워드를 추출하고 결과를 저장합니다.
+
+    month_index(MonthIndex) 가 없으면 전체 기사 날짜를 한 번 파싱해 만듦
+    """
+    if month_index is None:
+        month_index = MonthIndex.build(all_articles)
+    
+    results = {}
+    for month in range(1, 13):
+        results[f"{year}_{month:02d}"] = process_month(year, month, all_articles, vectorizer, output_dir,
+                                                       month_index, doc_terms)
+    return results
+
+# =========================
+# 실행부
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="TF-IDF + 문서 수 결합 월별 사건 구 추출")
+    ap.add_argument("--input", default=FILE_PATH, help="전처리 완료 기사 JSON")
+    ap.add_argument("--output-dir", default=OUTPUT_DIR)
+    ap.add_argument("--vectorizer", default=TFIDF_VECTORIZER_PATH, help="전체 코퍼스 TF-IDF 벡터라이저 (.pkl)")
+    ap.add_argument("--doc-terms", default=DOC_TERMS_PATH, help="전체 코퍼스 TF-IDF 행렬 폴더 (빈 값이면 달마다 transform)")
+    ap.add_argument("--year", type=int, default=None, help="분석할 연도 (생략하면 입력받음)")
+    ap.add_argument("--pos-cache", default=POS_CACHE_PATH, help="형태소 분석 결과 캐시 파일")
+    ap.add_argument("--okt-workers", type=int, default=OKT_WORKERS, help="Okt 작업자 프로세스 수 (0 이면 현재 프로세스)")
+    ap.add_argument("--jvm-heap", type=int, default=JVM_HEAP_MB, help="작업자 JVM 최대 힙 (MB)")
+    ap.add_argument("--no-pos-cache", action="store_true", help="캐시 없이 매번 Okt 로 분석 (기존 방식)")
+    args = ap.parse_args()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    cache = None
+    try:
+        print("📖 전체 기사 데이터를 로드하는 중...")
+        all_articles = load_all_articles(args.input)
+        if not all_articles:
+            print("전체 코퍼스를 로드할 수 없습니다. 프로그램을 종료합니다.")
+            return
+
+        if not args.no_pos_cache:
+            cache = PosCache(args.pos_cache)
+            prepare_pos_cache(all_articles, cache, args.okt_workers, args.jvm_heap)
+
+        month_index = load_month_index(args.input, all_articles)
+        print(f"📅 발행일 인덱스: {month_index}")
+
+        vectorizer = pre_train_vectorizer(all_articles, args.vectorizer, args.doc_terms or None)
+        doc_terms = None
+        if args.doc_terms:
+            doc_terms = load_doc_term_matrix(all_articles, vectorizer, args.vectorizer, args.doc_terms)
+            print(f"🧮 {doc_terms}")
+        
+        year = args.year or int(input("분석할 연도를 입력하세요 (예: 2024): ").strip())
+        
+        print(f"\n🚀 {year}년 월별 키워드 추출을 시작합니다...")
+        
+        monthly_results = process_monthly_keywords(year, all_articles, vectorizer, args.output_dir, month_index,
+                                                   doc_terms)
+        
+        summary_file = os.path.join(args.output_dir, f"{year}_keywords_by_month_all.json")
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(monthly_results, f, ensure_ascii=False, indent=2)
+        
+        print(f"\n🎉 {year}년 월별 키워드 추출이 완료되었습니다!")
+        print(f"📁 결과 파일들이 '{args.output_dir}' 디렉토리에 저장되었습니다.")
+        print(f"📊 연간 종합 결과: '{summary_file}'")
+        if cache is not None:
+            print(f"🔤 형태소 분석 캐시 적중 {cache.stats['hits']}회 / 새로 분석 {cache.stats['misses']}회")
+        
+    except ValueError as e:
+        print(f"오류: {e}. 올바른 연도를 입력해주세요.")
+    except Exception as e:
+        print(f"예기치 않은 오류가 발생했습니다: {e}")
+    finally:
+        if cache is not None:
+            cache.close()
+
+if __name__ == '__main__':
+    main()
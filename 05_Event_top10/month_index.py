@@ -0,0 +1,170 @@
+"""
+기사 발행일 (연, 월) 인덱스
+--------------------------
+● 기존 process_monthly_keywords 는 달마다 filter_articles_by_period 로 전체 기사를 다시 훑으며
+  extract_pubdate (키 4개 후보 × strptime 형식 10개)를 반복 → 10년치를 돌리면 날짜를 120번 다시 파싱
+● MonthIndex: 한 번만 모든 기사의 pubDate 를 파싱해 (발행 시각 순으로 정렬한 시각, 기사 행 번호) 배열로 보관
+    - rows_between(start, end) : 기간 안 기사 행 번호 (이분 탐색, 기간 안 기사 수에 비례)
+    - rows_for_month(year, month) / months() : 달 단위 조회와 달별 기사 수
+    - 돌려주는 행 번호는 코퍼스 순서 (기존 필터와 같은 기사 순서 → 같은 결과)
+● 코퍼스 파일 옆 {코퍼스}.month_index.npz 에 저장하고, 코퍼스 크기·수정 시각이 같으면 다시 읽어 씀
+"""
+
+import calendar, os
+from datetime import datetime
+
+import numpy as np
+
+MONTH_INDEX_SUFFIX = ".month_index.npz"
+
+
+# ───────────── 날짜 파서 (여러 포맷 허용) ─────────────
+def parse_date_flexible(s: str):
+    if not s or not isinstance(s, str):
+        return None
+    s = s.strip()
+
+    candidates = [s]
+    if "T" in s:
+        candidates.append(s[:19])
+        candidates.append(s[:10])
+    if len(s) >= 10:
+        candidates.append(s[:10])
+    if "-" not in s and "." not in s and "/" not in s and len(s) == 8:
+        candidates.append(f"{s[:4]}-{s[4:6]}-{s[6:8]}")
+
+    fmts = [
+        "%Y-%m-%d",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d %H:%M",
+        "%Y/%m/%d",
+        "%Y/%m/%d %H:%M:%S",
+        "%Y.%m.%d",
+        "%Y.%m.%d %H:%M:%S",
+        "%Y.%m.%d %H:%M",
+        "%Y%m%d",
+        "%Y-%m-%dT%H:%M:%S",
+    ]
+
+    for cand in candidates:
+        for fmt in fmts:
+            try:
+                return datetime.strptime(cand, fmt)
+            except Exception:
+                pass
+    return None
+
+
+def parse_date(date_str: str) -> datetime:
+    d = parse_date_flexible(date_str)
+    if d is None:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {date_str}")
+    return d
+
+
+def extract_pubdate(article):
+    keys = ["pubDate", "pubdate", "time", "date", "published", "pub_date"]
+    for k in keys:
+        if k in article and article[k]:
+            dt = parse_date_flexible(str(article[k]))
+            if dt:
+                return dt
+    meta = article.get("metadata", {}) or {}
+    for k in keys:
+        if k in meta and meta[k]:
+            dt = parse_date_flexible(str(meta[k]))
+            if dt:
+                return dt
+    return None
+
+
+# ───────────── 인덱스 ─────────────
+def _stamp(dt: datetime):
+    return np.datetime64(dt.replace(tzinfo=None), "s")
+
+
+def corpus_signature(path: str) -> np.ndarray:
+    st = os.stat(path)
+    return np.array([st.st_size, st.st_mtime_ns], dtype=np.int64)
+
+
+class MonthIndex:
+    """발행 시각순 (시각, 기사 행 번호) 배열"""
+
+    def __init__(self, stamps: np.ndarray, rows: np.ndarray, total: int):
+        self.stamps = stamps    # datetime64[s], 오름차순
+        self.rows = rows        # 같은 순서의 기사 행 번호
+        self.total = total      # 인덱스를 만든 기사 수 (날짜 없는 기사 포함)
+
+    @classmethod
+    def build(cls, articles):
+        rows, stamps = [], []
+        for i, article in enumerate(articles):
+            pub_date = extract_pubdate(article)
+            if pub_date:
+                rows.append(i)
+                stamps.append(_stamp(pub_date))
+        stamps = np.array(stamps, dtype="datetime64[s]")
+        rows = np.array(rows, dtype=np.int64)
+        order = np.argsort(stamps, kind="stable")
+        return cls(stamps[order], rows[order], len(articles))
+
+    # ───────────── 저장 / 읽기 ─────────────
+    def save(self, path: str, signature: np.ndarray = None):
+        with open(path, "wb") as f:
+            np.savez(f, stamps=self.stamps.astype(np.int64), rows=self.rows,
+                     total=np.int64(self.total),
+                     signature=signature if signature is not None else np.zeros(2, np.int64))
+
+    @classmethod
+    def load(cls, path: str, signature: np.ndarray = None):
+        """저장된 인덱스 (signature 가 다르면 None)"""
+        with np.load(path) as z:
+            if signature is not None and not np.array_equal(z["signature"], signature):
+                return None
+            return cls(z["stamps"].astype("datetime64[s]"), z["rows"], int(z["total"]))
+
+    # ───────────── 조회 ─────────────
+    def rows_between(self, start: datetime, end: datetime) -> np.ndarray:
+        """start <= pubDate <= end 인 기사 행 번호 (코퍼스 순서)"""
+        lo = np.searchsorted(self.stamps, _stamp(start), side="left")
+        hi = np.searchsorted(self.stamps, _stamp(end), side="right")
+        return np.sort(self.rows[lo:hi])
+
+    def rows_for_month(self, year: int, month: int) -> np.ndarray:
+        """해당 달 전체 (1일 0시 ~ 말일 23:59:59) 기사 행 번호"""
+        last_day = calendar.monthrange(year, month)[1]
+        return self.rows_between(datetime(year, month, 1), datetime(year, month, last_day, 23, 59, 59))
+
+    def months(self) -> dict:
+        """(연, 월) → 기사 수"""
+        months = self.stamps.astype("datetime64[M]")
+        values, counts = np.unique(months, return_counts=True)
+        return {(int(str(v)[:4]), int(str(v)[5:7])): int(c) for v, c in zip(values, counts)}
+
+    def select(self, articles, start_date_str, end_date_str):
+        """filter_articles_by_period 와 같은 결과 (parse_date 한 기간 양끝 포함)"""
+        rows = self.rows_between(parse_date(start_date_str), parse_date(end_date_str))
+        return [articles[i] for i in rows]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return f"MonthIndex(날짜 있는 기사 {len(self)}/{self.total}건, {len(self.months())}개월)"
+
+
+def load_month_index(corpus_path: str, articles) -> MonthIndex:
+    """코퍼스 옆에 저장된 인덱스를 읽거나 (없거나 코퍼스가 바뀌었으면) 새로 만들어 저장"""
+    path = corpus_path + MONTH_INDEX_SUFFIX
+    signature = corpus_signature(corpus_path)
+    if os.path.exists(path):
+        index = MonthIndex.load(path, signature)
+        if index is not None and index.total == len(articles):
+            return index
+    index = MonthIndex.build(articles)
+    try:
+        index.save(path, signature)
+    except OSError as e:
+        print(f"⚠️ 월 인덱스를 저장하지 못했습니다: {path} -> {e}")
+    return index
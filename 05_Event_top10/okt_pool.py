@@ -0,0 +1,162 @@
+"""
+Okt 형태소 분석 작업자 풀 (작업자마다 별도 JVM, 죽으면 다시 띄워 재시도)
+------------------------------------------------------------------
+● KoNLPy 가 띄운 JVM 이 분석 중에 죽으면(hs_err_pid*.log, -Xmx1024m) 노트북 프로세스 전체가 함께 종료
+● OktPool: 작업자 프로세스 workers 개가 각자 Okt(max_heap_size=heap_mb) JVM 을 띄우고
+  기사를 chunksize 개씩 받아 okt.pos(norm=True, stem=True) 결과를 돌려줌
+    - 작업자가 죽으면(세그폴트·OOM) 새 작업자를 띄우고, 하던 묶음은 반으로 나눠 다시 맡김
+      → 문제 기사 하나만 남을 때까지 좁혀 가며 나머지 기사는 정상 처리
+    - 한 기사에서 max_retries 번 죽으면 그 기사는 실패로 기록하고 건너뜀 (결과 None)
+    - okt.pos 가 파이썬 예외를 내면 작업자는 살아 있으므로 다시 띄우지 않고 그 기사만 None
+● 작업자는 forkserver 에서 띄움 (JVM 을 띄운 프로세스를 fork 하면 안전하지 않음, 서버 프로세스는 JVM 을 띄우지 않음)
+
+사용법
+  with OktPool(workers=8, heap_mb=2048) as pool:
+      for index, pos in pool.pos_many(texts):   # 끝난 순서대로, pos 가 None 이면 실패
+          ...
+"""
+
+import os
+from collections import deque
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+
+OKT_WORKERS = os.cpu_count() or 1
+OKT_CHUNKSIZE = 200       # 작업자에게 한 번에 넘길 기사 수
+JVM_HEAP_MB = 1024        # 작업자 JVM 최대 힙 (-Xmx, 기존 KoNLPy 기본값)
+MAX_RETRIES = 2           # 한 기사만 남은 묶음을 다시 시도할 횟수
+
+
+def _worker_main(conn, heap_mb: int):
+    from konlpy.tag import Okt
+
+    okt = Okt(max_heap_size=heap_mb)
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+        task_id, texts = task
+        results, errors = [], []
+        for offset, text in enumerate(texts):
+            try:
+                results.append(okt.pos(text, norm=True, stem=True))
+            except Exception as e:   # 파이썬 예외는 그 기사만 실패 (작업자·JVM 은 그대로 사용)
+                results.append(None)
+                errors.append((offset, f"{type(e).__name__}: {e}"))
+        conn.send((task_id, results, errors))
+
+
+class _Worker:
+    def __init__(self, ctx, heap_mb: int):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child, heap_mb), daemon=True)
+        self.proc.start()
+        child.close()
+        self.task = None   # (task_id, start, texts, attempts)
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.proc.join(timeout=10)
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.conn.close()
+
+
+class OktPool:
+    """여러 JVM 으로 Okt 분석 (작업자가 죽어도 풀 전체는 계속)"""
+
+    def __init__(self, workers: int = OKT_WORKERS, heap_mb: int = JVM_HEAP_MB,
+                 chunksize: int = OKT_CHUNKSIZE, max_retries: int = MAX_RETRIES):
+        self.workers = max(1, workers)
+        self.heap_mb = heap_mb
+        self.chunksize = chunksize
+        self.max_retries = max_retries
+        self._ctx = get_context("forkserver")
+        self._pool = []
+        self.stats = {"chunks": 0, "restarts": 0, "failed": 0}
+
+    def _start(self):
+        while len(self._pool) < self.workers:
+            self._pool.append(_Worker(self._ctx, self.heap_mb))
+
+    def _replace(self, worker: _Worker):
+        worker.proc.join(timeout=10)
+        code = worker.proc.exitcode
+        worker.conn.close()
+        self._pool[self._pool.index(worker)] = _Worker(self._ctx, self.heap_mb)
+        self.stats["restarts"] += 1
+        return code
+
+    def pos_many(self, texts: list):
+        """(texts 안의 위치, [(토큰, 품사), ...] 또는 None) 을 끝나는 순서대로"""
+        self._start()
+        pending = deque((start, texts[start:start + self.chunksize], 0)
+                        for start in range(0, len(texts), self.chunksize))
+        next_id = 0
+        while pending or any(w.task for w in self._pool):
+            for worker in self._pool:
+                if worker.task is None and pending:
+                    start, chunk, attempts = pending.popleft()
+                    worker.task = (next_id, start, chunk, attempts)
+                    next_id += 1
+                    try:
+                        worker.conn.send((worker.task[0], chunk))
+                    except (BrokenPipeError, OSError):
+                        pass   # 이미 죽은 작업자 → 아래에서 sentinel 로 감지
+
+            busy = [w for w in self._pool if w.task]
+            ready = wait([w.conn for w in busy] + [w.proc.sentinel for w in busy])
+            for worker in busy:
+                if worker.conn not in ready and worker.proc.sentinel not in ready:
+                    continue
+                task_id, start, chunk, attempts = worker.task
+                result = None
+                if worker.conn in ready:
+                    try:
+                        got_id, result, errors = worker.conn.recv()
+                        if got_id != task_id:
+                            result = None
+                    except (EOFError, OSError):
+                        result = None
+                if result is not None:
+                    worker.task = None
+                    self.stats["chunks"] += 1
+                    for offset, error in errors:
+                        self.stats["failed"] += 1
+                        print(f"⚠️ Okt 분석 실패({error}) → 건너뜁니다: {chunk[offset][:40]!r}")
+                    for offset, pos in enumerate(result):
+                        yield start + offset, pos
+                    continue
+
+                # 작업자가 죽음 → 새 JVM 으로 교체하고 묶음을 나눠 다시 맡김
+                worker.task = None
+                code = self._replace(worker)
+                if len(chunk) > 1:
+                    half = len(chunk) // 2
+                    pending.appendleft((start + half, chunk[half:], 0))
+                    pending.appendleft((start, chunk[:half], 0))
+                    print(f"⚠️ Okt 작업자 종료(exit {code}) → 기사 {len(chunk)}건을 나눠 다시 분석합니다.")
+                elif attempts < self.max_retries:
+                    pending.appendleft((start, chunk, attempts + 1))
+                else:
+                    self.stats["failed"] += 1
+                    print(f"⚠️ Okt 작업자가 같은 기사에서 {attempts + 1}번 종료(exit {code}) → 건너뜁니다: "
+                          f"{chunk[0][:40]!r}")
+                    yield start, None
+
+    def close(self):
+        for worker in self._pool:
+            worker.stop()
+        self._pool = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"OktPool(workers={self.workers}, heap={self.heap_mb}MB, chunksize={self.chunksize})"
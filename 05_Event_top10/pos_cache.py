@@ -0,0 +1,131 @@
+"""
+Okt 형태소 분석 결과 디스크 캐시 (기사당 한 번만 분석)
+---------------------------------------------------
+● 기존 노트북은 기사 하나를 okt.pos(norm=True, stem=True) 로 최소 세 번 분석
+    learn_action_lexicons → extract_event_phrases_auto → tokenizer_for_vectorizer (fit, 월마다 transform)
+  JVM 을 거치는 Okt 가 키워드 추출에서 가장 느린 단계
+● 기사 id_ 와 분석한 본문(doc_text)의 blake2b 해시로 (토큰, 품사) 목록을 저장하고 세 곳 모두 여기서 읽음
+    - 토큰은 어휘 번호(array('I')), 품사는 품사 번호 1바이트로 저장 (문자열은 vocab / tags 표에 한 번만)
+    - pos_cache.sqlite : crawl_ledger / http_cache 와 같은 WAL SQLite, 열 때 전부 메모리로 읽음
+    - 같은 id_ 의 본문(title/summary)이 바뀌면 해시가 달라져 다시 분석
+● 해시는 소문자로 바꾼 본문 기준: TfidfVectorizer 는 tokenizer 에 소문자로 바꾼 문자열을 넘기는데,
+  대소문자는 영문(Alpha) 토큰에만 영향을 주고 세 곳 모두 Noun/Verb 외 토큰의 철자는 쓰지 않음
+"""
+
+import hashlib, sqlite3
+from array import array
+
+POS_CACHE_PATH = "pos_cache.sqlite"
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.blake2b(text.lower().encode("utf-8"), digest_size=16).digest()
+
+
+class PosCache:
+    """본문 해시 → Okt (토큰, 품사) 목록"""
+
+    def __init__(self, path: str = POS_CACHE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS vocab (id INTEGER PRIMARY KEY, token TEXT NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS tags (id INTEGER PRIMARY KEY, tag TEXT NOT NULL)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS docs (
+                key    BLOB PRIMARY KEY,
+                id_    TEXT,
+                tokens BLOB NOT NULL,
+                tags   BLOB NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS docs_id ON docs (id_)")
+
+        self.vocab = [t for _, t in self._conn.execute("SELECT id, token FROM vocab ORDER BY id")]
+        self.tags = [t for _, t in self._conn.execute("SELECT id, tag FROM tags ORDER BY id")]
+        self._token_ids = {t: i for i, t in enumerate(self.vocab)}
+        self._tag_ids = {t: i for i, t in enumerate(self.tags)}
+        self._docs = {key: (tokens, tags) for key, tokens, tags
+                      in self._conn.execute("SELECT key, tokens, tags FROM docs")}
+        self._saved_vocab, self._saved_tags = len(self.vocab), len(self.tags)
+        self._dirty = {}   # 새로 분석한 key → (id_, tokens, tags)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, text: str):
+        return text_key(text) in self._docs
+
+    # ───────────── 조회 / 기록 ─────────────
+    def get(self, text: str):
+        """[(토큰, 품사), ...] (없으면 None)"""
+        entry = self._docs.get(text_key(text))
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        tokens, tags = entry
+        vocab, tag_names = self.vocab, self.tags
+        return [(vocab[t], tag_names[g]) for t, g in zip(array("I", tokens), tags)]
+
+    def _intern(self, token: str) -> int:
+        i = self._token_ids.get(token)
+        if i is None:
+            i = self._token_ids[token] = len(self.vocab)
+            self.vocab.append(token)
+        return i
+
+    def _intern_tag(self, tag: str) -> int:
+        i = self._tag_ids.get(tag)
+        if i is None:
+            if len(self.tags) >= 256:
+                raise ValueError(f"품사 종류가 256개를 넘습니다: {tag}")
+            i = self._tag_ids[tag] = len(self.tags)
+            self.tags.append(tag)
+        return i
+
+    def put(self, text: str, pos: list, id_: str = None, persist: bool = True):
+        """persist=False 면 이번 실행에서만 사용 (예: 분석에 실패해 빈 결과로 둔 기사)"""
+        key = text_key(text)
+        tokens = array("I", (self._intern(w) for w, _ in pos)).tobytes()
+        tags = bytes(self._intern_tag(t) for _, t in pos)
+        self._docs[key] = (tokens, tags)
+        if persist:
+            self._dirty[key] = (id_, tokens, tags)
+
+    def missing(self, items):
+        """(id_, 본문) 목록 중 캐시에 없는 것 (같은 본문은 한 번만)"""
+        seen, todo = set(), []
+        for id_, text in items:
+            key = text_key(text)
+            if key not in self._docs and key not in seen:
+                seen.add(key)
+                todo.append((id_, text))
+        return todo
+
+    def flush(self):
+        if not self._dirty:
+            return
+        self._conn.executemany("INSERT OR REPLACE INTO vocab (id, token) VALUES (?, ?)",
+                               ((i, self.vocab[i]) for i in range(self._saved_vocab, len(self.vocab))))
+        self._conn.executemany("INSERT OR REPLACE INTO tags (id, tag) VALUES (?, ?)",
+                               ((i, self.tags[i]) for i in range(self._saved_tags, len(self.tags))))
+        # 본문이 바뀐 기사는 예전 분석 결과를 지움
+        ids = [(id_,) for id_, _, _ in self._dirty.values() if id_]
+        self._conn.executemany("DELETE FROM docs WHERE id_ = ?", ids)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO docs (key, id_, tokens, tags) VALUES (?, ?, ?, ?)",
+            ((key, id_, tokens, tags) for key, (id_, tokens, tags) in self._dirty.items()),
+        )
+        self._conn.commit()
+        self._saved_vocab, self._saved_tags = len(self.vocab), len(self.tags)
+        self._dirty.clear()
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def __repr__(self):
+        return f"PosCache({self.path}, 기사 {len(self)}건, 어휘 {len(self.vocab)}개)"